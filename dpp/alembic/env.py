@@ -3,7 +3,8 @@
 Spec Lock:
   - URL resolution: DATABASE_URL_MIGRATIONS > DATABASE_URL > alembic.ini
   - Online migration uses build_engine() — inherits full SSL SSOT policy
-    (verify-full in PROD, sslrootcert from DPP_DB_SSLROOTCERT, NullPool default).
+    (verify-full in PROD, sslrootcert from DPP_DB_SSLROOTCERT); pool per DPP_DB_POOL
+    (QueuePool default; set DPP_DB_POOL=nullpool for connect-per-checkout).
   - No separate ssl injection needed here; ssl_policy handles it via build_engine().
 """
 
@@ -13,13 +14,12 @@ from logging.config import fileConfig
 from pathlib import Path
 
 from alembic import context
-from sqlalchemy import pool
+from sqlalchemy import MetaData, pool
 
 # Add apps/api to path so dpp_api imports resolve.
 sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "api"))
 
 from dpp_api.db.engine import build_engine  # noqa: E402
-from dpp_api.db.models import Base  # noqa: E402
 
 # Alembic Config object — provides access to values in the .ini file.
 config = context.config
@@ -28,8 +28,17 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Target metadata for autogenerate support.
-target_metadata = Base.metadata
+
+def _get_target_metadata() -> MetaData:
+    """Target metadata for autogenerate support (online mode only).
+
+    Imported lazily: the full model graph is only needed when comparing against
+    a live database. Offline SQL generation never loads it.
+    """
+    from dpp_api.db.models import Base
+
+    return Base.metadata
+
 
 # Spec Lock: Inject DATABASE_URL from environment.
 # Priority: DATABASE_URL_MIGRATIONS (migration-specific) > DATABASE_URL (runtime) > alembic.ini
@@ -57,11 +66,12 @@ def run_migrations_offline() -> None:
 
     Configures the context with a URL and emits SQL to stdout/file.
     SSL is not enforced in offline mode (no actual connection is made).
+    Autogenerate needs a connection, so no target metadata (model import) here.
     """
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
-        target_metadata=target_metadata,
+        target_metadata=None,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -75,7 +85,7 @@ def run_migrations_online() -> None:
 
     Uses build_engine() as the SSOT engine builder so that:
       - SSL policy (verify-full in PROD + sslrootcert) is automatically applied.
-      - NullPool is used by default (DPP Spec Lock for Supabase pooler).
+      - Pool mode follows DPP_DB_POOL (QueuePool default, nullpool opt-in).
       - Production guardrails (port 6543, pooler host, ACK vars) are enforced.
 
     Raises:
@@ -85,7 +95,7 @@ def run_migrations_online() -> None:
     connectable = build_engine(database_url)
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(connection=connection, target_metadata=_get_target_metadata())
 
         with context.begin_transaction():
             context.run_migrations()
@@ -20,29 +20,66 @@ branch_labels = None
 depends_on = None
 
 
+# Redundant indexes dropped by this migration:
+# - ix_api_keys_tenant_id          (keep idx_api_keys_tenant)
+# - ix_runs_tenant_id              (keep idx_runs_tenant_created, idx_runs_status_lease)
+# - idx_runs_idem                  (redundant with uq_runs_tenant_idempotency unique index)
+# - ix_tenant_plans_tenant_id      (keep idx_tenant_plans_tenant_status, idx_tenant_plans_effective)
+# - ix_tenant_usage_daily_tenant_id (keep idx_tenant_usage_daily_tenant_date, unique)
+_REDUNDANT_INDEXES = (
+    "ix_api_keys_tenant_id",
+    "ix_runs_tenant_id",
+    "idx_runs_idem",
+    "ix_tenant_plans_tenant_id",
+    "ix_tenant_usage_daily_tenant_id",
+)
+
+# Decisionproof tables that get RLS enabled (default deny, no policies).
+_RLS_TABLES = (
+    "tenants",
+    "api_keys",
+    "runs",
+    "plans",
+    "tenant_plans",
+    "tenant_usage_daily",
+)
+
+
+def _set_rls(action: str, tables: tuple[str, ...]) -> None:
+    """ENABLE/DISABLE row level security on public.<table> in one DO block.
+
+    One statement, one round-trip and one parse, whatever the table count.
+    Table names are quoted with format('%I').
+    """
+    table_array = ", ".join(f"'{t}'" for t in tables)
+    op.execute(
+        sa.text(
+            f"""
+            DO $$
+            DECLARE t text;
+            BEGIN
+              FOREACH t IN ARRAY ARRAY[{table_array}] LOOP
+                EXECUTE format('ALTER TABLE public.%I {action} ROW LEVEL SECURITY', t);
+              END LOOP;
+            END $$;
+            """
+        )
+    )
+
+
 def upgrade() -> None:
     # ====================================================================
     # Part 1: Drop redundant indexes (idempotent - IF EXISTS)
     # ====================================================================
     # Redundant: SQLAlchemy auto-generated ix_* indexes (index=True creates these)
     # We keep canonical idx_* indexes defined in __table_args__
-
-    # api_keys: Keep idx_api_keys_tenant, drop auto-generated ix_api_keys_tenant_id
-    op.execute("DROP INDEX IF EXISTS public.ix_api_keys_tenant_id;")
-
-    # runs: Keep idx_runs_tenant_created, idx_runs_status_lease
-    #       Drop auto-generated ix_runs_tenant_id
-    #       Drop idx_runs_idem (redundant with uq_runs_tenant_idempotency unique constraint)
-    op.execute("DROP INDEX IF EXISTS public.ix_runs_tenant_id;")
-    op.execute("DROP INDEX IF EXISTS public.idx_runs_idem;")
-
-    # tenant_plans: Keep idx_tenant_plans_tenant_status, idx_tenant_plans_effective
-    #               Drop auto-generated ix_tenant_plans_tenant_id
-    op.execute("DROP INDEX IF EXISTS public.ix_tenant_plans_tenant_id;")
-
-    # tenant_usage_daily: Keep idx_tenant_usage_daily_tenant_date (unique)
-    #                     Drop auto-generated ix_tenant_usage_daily_tenant_id
-    op.execute("DROP INDEX IF EXISTS public.ix_tenant_usage_daily_tenant_id;")
+    #
+    # CONCURRENTLY takes SHARE UPDATE EXCLUSIVE instead of ACCESS EXCLUSIVE, so live
+    # reads/writes are not blocked. It cannot run inside a transaction block (an
+    # implicit multi-statement one included), hence autocommit and one statement each.
+    with op.get_context().autocommit_block():
+        for index_name in _REDUNDANT_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS public.{index_name};")
 
     # ====================================================================
     # Part 2: Enable RLS on all Decisionproof tables (defense-in-depth)
@@ -50,34 +87,25 @@ def upgrade() -> None:
     # RLS default: DENY (no policies added intentionally)
     # Server-side connections (owner role) bypass RLS by default (not FORCE RLS)
     # This protects against anon/authenticated Supabase roles accessing data
-
-    op.execute("ALTER TABLE public.tenants ENABLE ROW LEVEL SECURITY;")
-    op.execute("ALTER TABLE public.api_keys ENABLE ROW LEVEL SECURITY;")
-    op.execute("ALTER TABLE public.runs ENABLE ROW LEVEL SECURITY;")
-    op.execute("ALTER TABLE public.plans ENABLE ROW LEVEL SECURITY;")
-    op.execute("ALTER TABLE public.tenant_plans ENABLE ROW LEVEL SECURITY;")
-    op.execute("ALTER TABLE public.tenant_usage_daily ENABLE ROW LEVEL SECURITY;")
+    _set_rls("ENABLE", _RLS_TABLES)
 
 
 def downgrade() -> None:
     # ====================================================================
     # Downgrade: Disable RLS (weakens security - not recommended)
     # ====================================================================
-    op.execute("ALTER TABLE public.tenant_usage_daily DISABLE ROW LEVEL SECURITY;")
-    op.execute("ALTER TABLE public.tenant_plans DISABLE ROW LEVEL SECURITY;")
-    op.execute("ALTER TABLE public.plans DISABLE ROW LEVEL SECURITY;")
-    op.execute("ALTER TABLE public.runs DISABLE ROW LEVEL SECURITY;")
-    op.execute("ALTER TABLE public.api_keys DISABLE ROW LEVEL SECURITY;")
-    op.execute("ALTER TABLE public.tenants DISABLE ROW LEVEL SECURITY;")
+    _set_rls("DISABLE", tuple(reversed(_RLS_TABLES)))
 
     # ====================================================================
     # Downgrade: Recreate dropped indexes (optional - for rollback safety)
     # ====================================================================
     # Note: Recreating these is optional. They are redundant by design.
-    # Uncomment if you want full rollback capability:
-
-    # op.execute("CREATE INDEX ix_api_keys_tenant_id ON public.api_keys (tenant_id);")
-    # op.execute("CREATE INDEX ix_runs_tenant_id ON public.runs (tenant_id);")
-    # op.execute("CREATE INDEX idx_runs_idem ON public.runs (tenant_id, idempotency_key);")
-    # op.execute("CREATE INDEX ix_tenant_plans_tenant_id ON public.tenant_plans (tenant_id);")
-    # op.execute("CREATE INDEX ix_tenant_usage_daily_tenant_id ON public.tenant_usage_daily (tenant_id);")
+    # Uncomment if you want full rollback capability (CONCURRENTLY avoids
+    # blocking writes; like the drops, it needs the autocommit block):
+
+    # with op.get_context().autocommit_block():
+    #     op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_api_keys_tenant_id ON public.api_keys (tenant_id);")
+    #     op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_runs_tenant_id ON public.runs (tenant_id);")
+    #     op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_runs_idem ON public.runs (tenant_id, idempotency_key);")
+    #     op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tenant_plans_tenant_id ON public.tenant_plans (tenant_id);")
+    #     op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tenant_usage_daily_tenant_id ON public.tenant_usage_daily (tenant_id);")
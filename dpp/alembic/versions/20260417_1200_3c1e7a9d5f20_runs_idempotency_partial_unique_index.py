@@ -0,0 +1,67 @@
+"""runs_idempotency_partial_unique_index
+
+Replace the uq_runs_tenant_idempotency unique constraint with a partial
+unique index on (tenant_id, idempotency_key) WHERE idempotency_key IS NOT NULL.
+Runs without an idempotency_key never conflict, so they are left out of the index.
+
+Revision ID: 3c1e7a9d5f20
+Revises: d98c8258a72a
+Create Date: 2026-04-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1e7a9d5f20'
+down_revision = 'd98c8258a72a'
+branch_labels = None
+depends_on = None
+
+
+# The new index is built under a temporary name, then takes over the constraint's
+# name. The name must stay uq_runs_tenant_idempotency: routers/runs.py matches it
+# in IntegrityError messages to detect idempotency conflicts.
+_INDEX_NAME = "uq_runs_tenant_idempotency"
+_BUILD_NAME = "uq_runs_tenant_idempotency_build"
+
+
+def upgrade() -> None:
+    # ====================================================================
+    # Step 1: Build the partial unique index without blocking writes
+    # ====================================================================
+    # CONCURRENTLY cannot run inside a transaction block, hence autocommit and
+    # one statement each. A failed concurrent build leaves an INVALID index
+    # behind, so any leftover is dropped first rather than skipped with
+    # IF NOT EXISTS.
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS public.{_BUILD_NAME};")
+        op.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY {_BUILD_NAME} "
+            "ON public.runs (tenant_id, idempotency_key) "
+            "WHERE idempotency_key IS NOT NULL;"
+        )
+
+    # ====================================================================
+    # Step 2: Swap it in for the constraint (catalog-only, brief lock)
+    # ====================================================================
+    op.drop_constraint(_INDEX_NAME, "runs", type_="unique")
+    op.execute(f"ALTER INDEX public.{_BUILD_NAME} RENAME TO {_INDEX_NAME};")
+
+
+def downgrade() -> None:
+    # Build the full unique index concurrently, then attach it as the
+    # constraint (ADD CONSTRAINT ... USING INDEX renames it to the constraint name).
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS public.{_BUILD_NAME};")
+        op.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY {_BUILD_NAME} "
+            "ON public.runs (tenant_id, idempotency_key);"
+        )
+
+    op.execute(f"DROP INDEX public.{_INDEX_NAME};")
+    op.execute(
+        f"ALTER TABLE public.runs ADD CONSTRAINT {_INDEX_NAME} "
+        f"UNIQUE USING INDEX {_BUILD_NAME};"
+    )
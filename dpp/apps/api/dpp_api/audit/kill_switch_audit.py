@@ -4,35 +4,68 @@ Records are written to the WORM sink BEFORE state is mutated.
 Fail-closed semantics are enforced in the caller (admin router).
 
 P5.9 additions:
-  fingerprint_token() — HMAC-SHA256(pepper, token) with Key-ID prefix for rotation-ready
+  fingerprint_token() — keyed BLAKE2b(pepper, token) with Key-ID prefix for rotation-ready
                         actor token fingerprinting. Format: "<kid>:<TRUNC_HEX>".
+                        (Originally HMAC-SHA256; BLAKE2b's native keyed mode drops the HMAC
+                        wrapper. The algorithm is recorded as actor.token_fingerprint_algo.)
+  fingerprint_token_batch() — same, for bulk replay (config resolved once per batch).
   Env vars:
     KILL_SWITCH_AUDIT_FINGERPRINT_KID         — Key-ID prefix (default: "kid_dev")
     KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER_B64  — base64-encoded pepper (preferred production)
     KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER      — utf-8 pepper (fallback / dev)
 
-  IP addresses continue to use sha256 (_fingerprint); they are less sensitive than
+  IP addresses use unkeyed BLAKE2b (_fingerprint); they are less sensitive than
   admin tokens and are not subject to the same rotation requirements.
+
+  The validated kid, pepper bytes and a keyed BLAKE2b template are cached at module
+  level (populated at boot by validate_kill_switch_audit_fingerprint_config(), or
+  lazily on first use). Tests that mutate the env vars call reset_fingerprint_cache().
 """
 
 import base64
 import hashlib
-import hmac
 import os
-import re
+import string
+import threading
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 
 # ── P5.9: Constants ───────────────────────────────────────────────────────────
 
-_TRUNC_LEN: int = 12             # Hex chars to retain from HMAC digest
+_TRUNC_LEN: int = 12             # Hex chars to retain from the keyed digest
+_FP_DIGEST_SIZE: int = _TRUNC_LEN // 2  # BLAKE2b digest bytes → exactly _TRUNC_LEN hex chars
+_FP_ALGO: str = "blake2b"        # Recorded next to the fingerprint (rotation-unambiguous)
 _KID_DEFAULT: str = "kid_dev"    # Safe default for dev/CI (not for production-required mode)
-_KID_PATTERN: re.Pattern = re.compile(r"^[A-Za-z0-9._-]{1,32}$")
+_KID_MAX_LEN: int = 32
+_ALLOWED_KID_CHARS: frozenset[str] = frozenset(string.ascii_letters + string.digits + "._-")
+
+# Env var names (module constants so lookups share one interned key object)
+_ENV_KID: str = "KILL_SWITCH_AUDIT_FINGERPRINT_KID"
+_ENV_PEPPER_B64: str = "KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER_B64"
+_ENV_PEPPER: str = "KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER"
+_ENV_REQUIRED: str = "KILL_SWITCH_AUDIT_REQUIRED"
+_ENV_STRICT: str = "KILL_SWITCH_AUDIT_STRICT"
+
+
+# ── Fingerprint config cache ──────────────────────────────────────────────────
+
+_FP_CACHE_LOCK = threading.Lock()
+_FP_CACHE_READY: bool = False
+_KID_CACHED: str | None = None
+_FP_TEMPLATE: hashlib.blake2b | None = None
 
 
 # ── P5.9: Kid + pepper helpers ────────────────────────────────────────────────
 
+def _env_stripped(name: str) -> str:
+    """Return the stripped env value, or "" if unset/empty (no strip on empty)."""
+    value = os.environ.get(name)
+    return value.strip() if value else ""
+
+
 def _load_kid() -> str:
     """Read and validate KILL_SWITCH_AUDIT_FINGERPRINT_KID.
 
@@ -42,13 +75,14 @@ def _load_kid() -> str:
     Raises:
         RuntimeError("INVALID_FINGERPRINT_KID"): If the value is malformed.
     """
-    kid = os.getenv("KILL_SWITCH_AUDIT_FINGERPRINT_KID", _KID_DEFAULT)
+    kid = os.environ.get(_ENV_KID, _KID_DEFAULT)
     if ":" in kid:
         raise RuntimeError(
             f"INVALID_FINGERPRINT_KID: colon (':') is not allowed in kid value, "
             f"got {kid!r}. The colon is the separator between kid and hex digest."
         )
-    if not _KID_PATTERN.match(kid):
+    # Set containment instead of a regex: [A-Za-z0-9._-]{1,32}
+    if not (1 <= len(kid) <= _KID_MAX_LEN and _ALLOWED_KID_CHARS.issuperset(kid)):
         raise RuntimeError(
             f"INVALID_FINGERPRINT_KID: {kid!r} must be 1–32 chars using "
             f"[A-Za-z0-9._-] only. Check KILL_SWITCH_AUDIT_FINGERPRINT_KID."
@@ -71,17 +105,17 @@ def _load_pepper() -> bytes | None:
         RuntimeError("FINGERPRINT_PEPPER_NOT_SET"): If neither env var is set
             and KILL_SWITCH_AUDIT_REQUIRED=1 or KILL_SWITCH_AUDIT_STRICT=1.
     """
-    b64 = os.getenv("KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER_B64", "").strip()
+    b64 = _env_stripped(_ENV_PEPPER_B64)
     if b64:
         return base64.b64decode(b64)
 
-    plain = os.getenv("KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER", "").strip()
+    plain = _env_stripped(_ENV_PEPPER)
     if plain:
         return plain.encode("utf-8")
 
     # Neither env var set — check if production-required context demands pepper
-    required = os.getenv("KILL_SWITCH_AUDIT_REQUIRED", "0").strip() == "1"
-    strict = os.getenv("KILL_SWITCH_AUDIT_STRICT", "0").strip() == "1"
+    required = _env_stripped(_ENV_REQUIRED) == "1"
+    strict = _env_stripped(_ENV_STRICT) == "1"
 
     if required or strict:
         raise RuntimeError(
@@ -97,8 +131,43 @@ def _load_pepper() -> bytes | None:
     return None
 
 
+def _resolve_fingerprint_config() -> tuple[str, hashlib.blake2b | None]:
+    """Load kid + pepper from env and (re)populate the module-level cache.
+
+    The BLAKE2b template is keyed once here; fingerprint_token() .copy()s it per
+    call, which skips the key block compression on every fingerprint.
+
+    Raises:
+        Same as _load_kid() / _load_pepper(). The cache is left untouched on error.
+    """
+    global _FP_CACHE_READY, _KID_CACHED, _FP_TEMPLATE
+
+    with _FP_CACHE_LOCK:
+        kid = _load_kid()
+        pepper_bytes = _load_pepper()
+        template = (
+            hashlib.blake2b(key=pepper_bytes, digest_size=_FP_DIGEST_SIZE)
+            if pepper_bytes is not None
+            else None
+        )
+        _KID_CACHED = kid
+        _FP_TEMPLATE = template
+        _FP_CACHE_READY = True
+    return kid, template
+
+
+def reset_fingerprint_cache() -> None:
+    """Drop the cached kid and keyed BLAKE2b template (test helper; forces env re-read)."""
+    global _FP_CACHE_READY, _KID_CACHED, _FP_TEMPLATE
+
+    with _FP_CACHE_LOCK:
+        _FP_CACHE_READY = False
+        _KID_CACHED = None
+        _FP_TEMPLATE = None
+
+
 def fingerprint_token(token: str | None) -> str | None:
-    """Compute HMAC-SHA256(pepper, token) fingerprint with Key-ID prefix.
+    """Compute keyed BLAKE2b(pepper, token) fingerprint with Key-ID prefix.
 
     Returns the rotation-ready fingerprint format: "<kid>:<hex[:TRUNC_LEN]>"
 
@@ -123,27 +192,65 @@ def fingerprint_token(token: str | None) -> str | None:
     if not token:
         return None
 
-    kid = _load_kid()
-    pepper_bytes = _load_pepper()
+    if _FP_CACHE_READY:
+        kid, template = _KID_CACHED, _FP_TEMPLATE
+    else:
+        kid, template = _resolve_fingerprint_config()
 
-    if pepper_bytes is None:
+    if template is None:
         # Dev/CI mode: no pepper configured; return None to indicate unavailable fingerprint.
         # Production-required mode raises before reaching here.
         return None
 
-    digest = hmac.new(pepper_bytes, token.encode("utf-8"), hashlib.sha256).hexdigest()
-    return f"{kid}:{digest[:_TRUNC_LEN]}"
+    h = template.copy()
+    h.update(token.encode("utf-8"))
+    return f"{kid}:{h.hexdigest()}"
+
 
+def fingerprint_token_batch(tokens: Iterable[str | None]) -> list[str | None]:
+    """Fingerprint many tokens with one config resolution (bulk replay / re-verification).
 
-# ── P5.3 (legacy): SHA-256 fingerprint for non-token fields ───────────────────
+    Equivalent to [fingerprint_token(t) for t in tokens], but kid/pepper are
+    resolved once and the keyed template is bound outside the loop.
 
+    Raises:
+        Same as fingerprint_token(), before any token is processed.
+    """
+    if _FP_CACHE_READY:
+        kid, template = _KID_CACHED, _FP_TEMPLATE
+    else:
+        kid, template = _resolve_fingerprint_config()
+
+    if template is None:
+        return [None for _ in tokens]
+
+    prefix = f"{kid}:"
+    copy = template.copy
+    out: list[str | None] = []
+    append = out.append
+    for token in tokens:
+        if not token:
+            append(None)
+            continue
+        h = copy()
+        h.update(token.encode("utf-8"))
+        append(prefix + h.hexdigest())
+    return out
+
+
+# ── P5.3 (legacy): Unkeyed fingerprint for non-token fields ───────────────────
+
+@lru_cache(maxsize=512)
 def _fingerprint(secret: str, length: int = 12) -> str:
-    """Return a short SHA-256 hex fingerprint (not HMAC — used for IP addresses only).
+    """Return a short unkeyed BLAKE2b hex fingerprint (used for IP addresses only).
 
-    IP addresses are not secret credentials and do not require HMAC protection.
-    Admin tokens use fingerprint_token() which applies HMAC with a secret pepper.
+    IP addresses are not secret credentials and do not require a keyed hash.
+    Admin tokens use fingerprint_token() which keys the hash with a secret pepper.
+    Memoized: admin traffic comes from a handful of egress IPs, and the output
+    depends only on the input (no env/pepper), so the cache never goes stale.
     """
-    return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:length]
+    digest_size = (length + 1) // 2
+    return hashlib.blake2b(secret.encode("utf-8"), digest_size=digest_size).hexdigest()[:length]
 
 
 # ── P6.1: Boot-time fingerprint config validation ─────────────────────────────
@@ -156,15 +263,16 @@ def validate_kill_switch_audit_fingerprint_config() -> None:
     or kid is misconfigured, this raises immediately so the pod fails to start
     before becoming READY (CrashLoop → operator is alerted).
 
-    Never logs the pepper or kid value — only the error code.
+    Never logs the pepper or kid value — only the error code. On success the
+    validated kid/pepper are cached for fingerprint_token().
 
     Raises:
         RuntimeError("INVALID_FINGERPRINT_KID"): Kid env var has illegal chars or colon.
         RuntimeError("FINGERPRINT_PEPPER_NOT_SET"): Pepper absent in REQUIRED/STRICT mode.
         Exception: base64.b64decode failure if PEPPER_B64 is malformed.
     """
-    _load_kid()      # validates KID format; raises on invalid
-    _load_pepper()   # validates pepper presence; raises if missing in required/strict mode
+    # Validates KID format and pepper presence (raises on invalid); always re-reads env
+    _resolve_fingerprint_config()
 
 
 # ── Audit record builder ───────────────────────────────────────────────────────
@@ -180,26 +288,31 @@ def build_kill_switch_audit_record(
     ttl_minutes: int,
     result: str,
     error: str | None = None,
+    now: datetime | None = None,
 ) -> dict[str, Any]:
     """Build a structured audit record for a kill-switch change attempt.
 
     The record never contains raw token values or raw IP addresses;
     only short fingerprints are stored.
 
-    P5.9: actor.token_fingerprint is now "<kid>:<HMAC-SHA256[:12]>" — a
-    rotation-ready HMAC fingerprint. The kid prefix identifies which pepper
-    version was used, enabling historical verification after key rotation.
+    P5.9: actor.token_fingerprint is "<kid>:<12 hex>" — a rotation-ready keyed
+    fingerprint. The kid prefix identifies which pepper version was used and
+    actor.token_fingerprint_algo names the hash, enabling historical
+    verification after key or algorithm rotation.
 
     Args:
         request_id:  X-Request-ID from the incoming request (may be None).
-        actor_token: Raw admin token (HMAC-fingerprinted before storage; never stored raw).
-        actor_ip:    Client IP address (SHA-256 hashed before storage; never stored raw).
+        actor_token: Raw admin token (keyed-fingerprinted before storage; never stored raw).
+        actor_ip:    Client IP address (BLAKE2b hashed before storage; never stored raw).
         mode_from:   Previous kill-switch mode value.
         mode_to:     Requested kill-switch mode value.
         reason:      Operator-supplied reason (max 200 chars, validated by Pydantic upstream).
         ttl_minutes: Requested TTL (0 = permanent).
         result:      "ok" if state was successfully changed, "failed" otherwise.
         error:       Error description if result == "failed", else None.
+        now:         Timestamp of the action (UTC); defaults to the current time.
+                     The admin router passes the same value to the sink so the
+                     record timestamp and the WORM retention base agree.
 
     Returns:
         Audit record dict suitable for JSON serialisation.
@@ -212,12 +325,13 @@ def build_kill_switch_audit_record(
     """
     return {
         "schema_version": "1.0",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": (now if now is not None else datetime.now(timezone.utc)).isoformat(),
         "request_id": request_id,
         "actor": {
-            # P5.9: HMAC+kid fingerprint (rotation-ready). kid identifies pepper version.
+            # P5.9: keyed fingerprint + kid (rotation-ready). kid identifies pepper version.
             "token_fingerprint": fingerprint_token(actor_token),
-            # P5.3: SHA-256 hash of IP (not a secret credential; no HMAC needed).
+            "token_fingerprint_algo": _FP_ALGO,
+            # P5.3: unkeyed hash of IP (not a secret credential; no pepper needed).
             "ip_hash": _fingerprint(actor_ip),
         },
         "change": {
@@ -16,7 +16,8 @@ Sink selection (get_default_audit_sink):
 
 P5.6 additions:
   AuditSinkConfigError     — raised when REQUIRED=1 but bucket not configured
-  audit_required()         — True when KILL_SWITCH_AUDIT_REQUIRED=1
+  audit_required()         — True when KILL_SWITCH_AUDIT_REQUIRED=1 (memoized)
+  audit_strict()           — True when KILL_SWITCH_AUDIT_STRICT=1 (memoized)
   validate_audit_required_config() — fail-fast check (no network calls)
 
 P5.8 additions:
@@ -26,17 +27,35 @@ P5.8 additions:
   S3WormAuditSink.mode     — configurable; no bypass behavior ever included
   validate_audit_required_config() — extended to check WORM_MODE when REQUIRED=1
 
+Serialization:
+  serialize_audit_record() — orjson (C extension; native datetime/UUID) → bytes.
+  put_record() accepts a dict or pre-serialized bytes, so a record fanned out
+  to several sinks is serialized only once.
+
+Client / sink caching:
+  _get_or_build_s3_client() — one boto3 S3 client per region (keepalive, adaptive retries),
+                              shared by every S3WormAuditSink so TLS sessions are reused.
+  get_default_audit_sink()  — memoized; reset_sink_cache() drops both caches (tests).
+
 Test helpers:
   FailingAuditSink → always raises RuntimeError (used in Test D / Test E)
 """
 
-import json
+import base64
+import hashlib
+import io
 import logging
 import os
 import tempfile
-from datetime import datetime, timezone
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import Any, Protocol
+from uuid import UUID
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -56,14 +75,30 @@ class AuditSinkConfigError(RuntimeError):
 _VALID_WORM_MODES: frozenset[str] = frozenset({"GOVERNANCE", "COMPLIANCE"})
 _DEFAULT_WORM_MODE: str = "GOVERNANCE"  # Safe default for non-required (dev/CI) mode
 
+# FileAuditSink default directory when KILL_SWITCH_AUDIT_FILE_DIR is unset
+_TMPDIR: str = tempfile.gettempdir()
+
 
 # ── P5.6/P5.8: Config helpers ─────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
 def audit_required() -> bool:
-    """Return True when KILL_SWITCH_AUDIT_REQUIRED=1 (WORM is mandatory)."""
+    """Return True when KILL_SWITCH_AUDIT_REQUIRED=1 (WORM is mandatory).
+
+    Memoized: env is fixed for the process lifetime. reset_sink_cache() clears it.
+    """
     return os.getenv("KILL_SWITCH_AUDIT_REQUIRED", "0").strip() == "1"
 
 
+@lru_cache(maxsize=1)
+def audit_strict() -> bool:
+    """Return True when KILL_SWITCH_AUDIT_STRICT=1 (sink failures are fatal).
+
+    Memoized: env is fixed for the process lifetime. reset_sink_cache() clears it.
+    """
+    return os.getenv("KILL_SWITCH_AUDIT_STRICT", "0").strip() == "1"
+
+
 def validate_audit_required_config() -> None:
     """Validate audit sink configuration when REQUIRED mode is enabled.
 
@@ -108,19 +143,70 @@ def validate_audit_required_config() -> None:
         )
 
 
+# ── Serialization ─────────────────────────────────────────────────────────────
+
+_JSON_NATIVE_TYPES: tuple[type, ...] = (str, int, float, bool, type(None), datetime, UUID)
+
+
+def _coerce_for_json(obj: Any) -> Any:
+    """Return a copy of obj with non-JSON-native leaves converted via str()."""
+    if isinstance(obj, dict):
+        return {k: _coerce_for_json(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_coerce_for_json(v) for v in obj]
+    if isinstance(obj, _JSON_NATIVE_TYPES):
+        return obj
+    return str(obj)
+
+
+def serialize_audit_record(data: dict[str, Any]) -> bytes:
+    """Serialize an audit record to UTF-8 JSON bytes (non-ASCII kept as-is).
+
+    Records built by build_kill_switch_audit_record() are JSON-native, so the
+    fast path runs with no default= callback. Anything else (e.g. an exception
+    object in a field) is coerced with str() in one pre-conversion pass.
+    """
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return orjson.dumps(_coerce_for_json(data), option=orjson.OPT_NON_STR_KEYS)
+
+
+def _utc_iso_seconds(dt: datetime) -> str:
+    """Format a UTC datetime as YYYY-MM-DDThh:mm:ssZ (seconds precision)."""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+    )
+
+
 # ── Protocol ──────────────────────────────────────────────────────────────────
 
-@runtime_checkable
 class AuditSink(Protocol):
-    """Minimal interface for all audit sinks."""
+    """Minimal interface for all audit sinks.
+
+    Static-typing only (not runtime_checkable): nothing isinstance()-checks
+    sinks, and runtime protocol checks introspect every member per call.
+    """
 
-    def put_record(self, key: str, data: dict, *, content_type: str = "application/json") -> None:
+    def put_record(
+        self,
+        key: str,
+        data: dict | bytes,
+        *,
+        content_type: str = "application/json",
+        now: datetime | None = None,
+    ) -> None:
         """Write an immutable audit record.
 
         Args:
             key: Object key / file name (must be unique per record).
-            data: Record payload dict (will be JSON-serialised).
+            data: Record payload dict (will be JSON-serialised), or bytes already
+                produced by serialize_audit_record().
             content_type: MIME type of the payload.
+            now: Timestamp of the audited action (UTC). Callers pass the value
+                used for the record's "timestamp" so both share one clock read;
+                defaults to the current time.
 
         Raises:
             RuntimeError: If the write fails and the caller must treat it as fatal.
@@ -128,6 +214,43 @@ class AuditSink(Protocol):
         ...
 
 
+# ── S3 client cache ───────────────────────────────────────────────────────────
+
+_S3_CLIENT_CACHE: dict[str, Any] = {}
+_S3_CLIENT_CACHE_LOCK = threading.Lock()
+_S3_MAX_POOL_CONNECTIONS: int = 32
+_S3_TOTAL_MAX_ATTEMPTS: int = 5
+
+
+def _get_or_build_s3_client(region: str) -> Any:
+    """Return the shared boto3 S3 client for region, building it on first use.
+
+    boto3.client() is expensive (service model load, endpoint resolution), and a
+    shared client lets urllib3 reuse keep-alive TLS connections across puts.
+    """
+    client = _S3_CLIENT_CACHE.get(region)
+    if client is not None:
+        return client
+
+    import boto3
+    from botocore.config import Config
+
+    with _S3_CLIENT_CACHE_LOCK:
+        client = _S3_CLIENT_CACHE.get(region)
+        if client is None:
+            client = boto3.client(
+                "s3",
+                region_name=region,
+                config=Config(
+                    max_pool_connections=_S3_MAX_POOL_CONNECTIONS,
+                    retries={"mode": "adaptive", "total_max_attempts": _S3_TOTAL_MAX_ATTEMPTS},
+                    tcp_keepalive=True,
+                ),
+            )
+            _S3_CLIENT_CACHE[region] = client
+    return client
+
+
 # ── S3 WORM sink ──────────────────────────────────────────────────────────────
 
 class S3WormAuditSink:
@@ -148,36 +271,63 @@ class S3WormAuditSink:
 
     # 7 years ≈ 2555 days (365.25 * 7)
     _RETENTION_DAYS = 2555
+    _RETENTION_DELTA = timedelta(days=_RETENTION_DAYS)
 
-    def __init__(self, bucket: str, region: str | None = None, mode: str = _DEFAULT_WORM_MODE) -> None:
-        import boto3
+    # (epoch second, retain-until string) of the last put. Object Lock only needs
+    # second granularity, so bursts within one second reuse the formatted value.
+    # A single tuple so concurrent readers never see a torn pair (last writer wins).
+    _retain_until_cache: tuple[int, str] = (-1, "")
 
+    def __init__(self, bucket: str, region: str | None = None, mode: str = _DEFAULT_WORM_MODE) -> None:
         self._bucket = bucket
         self._mode = mode
-        self._client = boto3.client(
-            "s3",
-            region_name=region or os.getenv("AWS_DEFAULT_REGION", "us-east-1"),
+        self._client = _get_or_build_s3_client(
+            region or os.getenv("AWS_DEFAULT_REGION", "us-east-1")
         )
 
-    def put_record(self, key: str, data: dict, *, content_type: str = "application/json") -> None:
-        """Serialize data to JSON and PUT to S3 with Object Lock.
+    @classmethod
+    def _retain_until(cls, now: datetime | None) -> str:
+        """Return (now + retention) as YYYY-MM-DDThh:mm:ssZ, cached per epoch second."""
+        second = int(now.timestamp()) if now is not None else int(time.time())
+        cached_second, cached_value = cls._retain_until_cache
+        if cached_second == second:
+            return cached_value
+        value = _utc_iso_seconds(
+            datetime.fromtimestamp(second, tz=timezone.utc) + cls._RETENTION_DELTA
+        )
+        cls._retain_until_cache = (second, value)
+        return value
+
+    def put_record(
+        self,
+        key: str,
+        data: dict | bytes,
+        *,
+        content_type: str = "application/json",
+        now: datetime | None = None,
+    ) -> None:
+        """Serialize data to JSON (unless pre-serialized) and PUT to S3 with Object Lock.
 
         Always sends ObjectLockMode + ObjectLockRetainUntilDate as a paired set.
         Never includes BypassGovernanceRetention or any bypass-related parameters.
         """
-        from datetime import timedelta
-
-        body = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
-        retain_until = datetime.now(timezone.utc) + timedelta(days=self._RETENTION_DAYS)
+        body = data if isinstance(data, bytes) else serialize_audit_record(data)
+        retain_until = self._retain_until(now)
+        # Seekable body + explicit length/MD5 (computed once here): botocore neither
+        # re-reads the payload to size/hash it nor copies it into its own buffer.
+        # S3 also requires Content-MD5 (or a checksum) on Object Lock PUTs.
+        content_md5 = base64.b64encode(hashlib.md5(body, usedforsecurity=False).digest()).decode()
 
         try:
             self._client.put_object(
                 Bucket=self._bucket,
                 Key=key,
-                Body=body,
+                Body=io.BytesIO(body),
+                ContentLength=len(body),
+                ContentMD5=content_md5,
                 ContentType=content_type,
                 ObjectLockMode=self._mode,
-                ObjectLockRetainUntilDate=retain_until.isoformat(),
+                ObjectLockRetainUntilDate=retain_until,
             )
             logger.info(
                 "AUDIT_WORM_WRITTEN",
@@ -185,7 +335,7 @@ class S3WormAuditSink:
                     "bucket": self._bucket,
                     "key": key,
                     "worm_mode": self._mode,
-                    "retain_until": retain_until.isoformat(),
+                    "retain_until": retain_until,
                 },
             )
         except Exception as exc:
@@ -196,26 +346,72 @@ class S3WormAuditSink:
 # ── File sink (CI / local dev) ────────────────────────────────────────────────
 
 class FileAuditSink:
-    """Write audit records as JSON files on the local filesystem.
+    """Append audit records as JSON lines to a per-day log on the local filesystem.
 
     Intended for local development and CI only (no WORM guarantee).
-    Each record is written as a separate file named by key.
+    Records go to audit-YYYYMMDD.jsonl (UTC date), one {"key": ..., "record": ...}
+    object per line. The file is opened once with O_APPEND, so each record is a
+    single os.write() and concurrent writers never interleave within a line.
     """
 
     def __init__(self, directory: str | None = None) -> None:
         if directory:
             self._dir = Path(directory)
         else:
-            self._dir = Path(os.getenv("KILL_SWITCH_AUDIT_FILE_DIR", tempfile.gettempdir()))
+            self._dir = Path(os.getenv("KILL_SWITCH_AUDIT_FILE_DIR", _TMPDIR))
         self._dir.mkdir(parents=True, exist_ok=True)
-
-    def put_record(self, key: str, data: dict, *, content_type: str = "application/json") -> None:
-        # Sanitize key → safe filename (replace slashes / colons)
-        filename = key.replace("/", "_").replace(":", "_") + ".json"
-        filepath = self._dir / filename
-        body = json.dumps(data, ensure_ascii=False, indent=2, default=str)
-        filepath.write_text(body, encoding="utf-8")
-        logger.info("AUDIT_FILE_WRITTEN", extra={"path": str(filepath)})
+        self._lock = threading.Lock()
+        self._fd: int | None = None
+        self._day: str | None = None
+        self._path: Path | None = None
+
+    def _current_fd(self, now: datetime) -> tuple[int, Path]:
+        """Return the fd for now's (UTC) daily log, rolling over at UTC midnight."""
+        day = f"{now.year:04d}{now.month:02d}{now.day:02d}"
+        with self._lock:
+            if self._fd is None or self._day != day:
+                path = self._dir / f"audit-{day}.jsonl"
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+                if self._fd is not None:
+                    os.close(self._fd)
+                self._fd, self._day, self._path = fd, day, path
+            return self._fd, self._path
+
+    def put_record(
+        self,
+        key: str,
+        data: dict | bytes,
+        *,
+        content_type: str = "application/json",
+        now: datetime | None = None,
+    ) -> None:
+        body = data if isinstance(data, bytes) else serialize_audit_record(data)
+        line = b'{"key":' + orjson.dumps(key) + b',"record":' + body + b"}\n"
+        fd, path = self._current_fd(now if now is not None else datetime.now(timezone.utc))
+        os.write(fd, line)
+        logger.info("AUDIT_FILE_WRITTEN", extra={"path": str(path), "key": key})
+
+    def close(self) -> None:
+        """Close the underlying log file descriptor (idempotent)."""
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+                self._day = None
+
+    def __enter__(self) -> "FileAuditSink":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        fd = getattr(self, "_fd", None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
 
 
 # ── Failing sink (test helper) ────────────────────────────────────────────────
@@ -223,12 +419,20 @@ class FileAuditSink:
 class FailingAuditSink:
     """Always raises RuntimeError.  Used in tests to simulate sink failure."""
 
-    def put_record(self, key: str, data: dict, *, content_type: str = "application/json") -> None:
+    def put_record(
+        self,
+        key: str,
+        data: dict | bytes,
+        *,
+        content_type: str = "application/json",
+        now: datetime | None = None,
+    ) -> None:
         raise RuntimeError("FailingAuditSink: intentional failure for testing")
 
 
 # ── Factory ───────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
 def get_default_audit_sink() -> AuditSink:
     """Return the appropriate sink based on environment configuration.
 
@@ -242,6 +446,9 @@ def get_default_audit_sink() -> AuditSink:
     P5.8: If KILL_SWITCH_AUDIT_REQUIRED=1 and KILL_SWITCH_AUDIT_WORM_MODE is absent
     or invalid, raises AuditSinkConfigError — silent defaults are forbidden in
     production-required mode.
+
+    The result is memoized (config errors are not cached); call reset_sink_cache()
+    after changing the env vars above.
     """
     # P5.6/P5.8: Fail-fast if REQUIRED=1 but config is incomplete
     validate_audit_required_config()
@@ -255,5 +462,14 @@ def get_default_audit_sink() -> AuditSink:
         return S3WormAuditSink(bucket=bucket, region=region, mode=mode)
 
     file_dir = os.getenv("KILL_SWITCH_AUDIT_FILE_DIR")
-    logger.info("AUDIT_SINK_FILE", extra={"directory": file_dir or tempfile.gettempdir()})
+    logger.info("AUDIT_SINK_FILE", extra={"directory": file_dir or _TMPDIR})
     return FileAuditSink(directory=file_dir)
+
+
+def reset_sink_cache() -> None:
+    """Drop the memoized default sink, env flags and cached S3 clients (test helper)."""
+    get_default_audit_sink.cache_clear()
+    audit_required.cache_clear()
+    audit_strict.cache_clear()
+    with _S3_CLIENT_CACHE_LOCK:
+        _S3_CLIENT_CACHE.clear()
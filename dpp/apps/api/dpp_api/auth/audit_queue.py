@@ -0,0 +1,137 @@
+"""Background writer for auth_request_log (P0-3 telemetry).
+
+Token auth used to INSERT + COMMIT one auth_request_log row on every request,
+a write on the read path that holds a pooled connection for the round-trip.
+Entries are now queued in-process and flushed by one background task in
+multi-row INSERTs (up to _BATCH_SIZE rows or every _FLUSH_INTERVAL_SEC).
+
+SEMANTICS:
+- Best-effort telemetry, same as before: a full queue or a failed flush drops
+  rows with a warning, never fails the request.
+- submit() returns False when the writer is not running (tests, scripts);
+  callers then fall back to a synchronous insert.
+- On shutdown the remaining entries are flushed before the task exits.
+"""
+
+import asyncio
+import logging
+from typing import Any, Optional
+
+from sqlalchemy import insert
+
+from dpp_api.db.models import AuthRequestLog
+
+logger = logging.getLogger(__name__)
+
+_QUEUE_MAXSIZE = 10_000
+_BATCH_SIZE = 100
+_FLUSH_INTERVAL_SEC = 0.5
+
+_queue: Optional[asyncio.Queue] = None
+_writer_task: Optional[asyncio.Task] = None
+_dropped_count = 0
+
+
+def submit(entry: dict[str, Any]) -> bool:
+    """Queue one auth_request_log row (column -> value).
+
+    Must be called from the event loop thread.
+
+    Returns:
+        True if the entry was queued or dropped on overflow,
+        False if no writer is running and the caller should write it itself.
+    """
+    global _dropped_count
+
+    if _queue is None:
+        return False
+
+    try:
+        _queue.put_nowait(entry)
+    except asyncio.QueueFull:
+        _dropped_count += 1
+        if _dropped_count % 100 == 1:
+            logger.warning(
+                "auth_request_log queue full, dropping entries",
+                extra={"event": "auth_log.queue_full", "dropped_total": _dropped_count},
+            )
+    return True
+
+
+def _write_batch(batch: list[dict[str, Any]]) -> None:
+    """Insert a batch in one multi-row INSERT and one commit (runs in a thread)."""
+    from dpp_api.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        db.execute(insert(AuthRequestLog), batch)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(
+            f"Failed to flush auth_request_log batch: {e}",
+            extra={"event": "auth_log.flush_failed", "batch_size": len(batch)},
+        )
+    finally:
+        db.close()
+
+
+def _drain_nowait(queue: asyncio.Queue, batch: list[dict[str, Any]]) -> None:
+    while len(batch) < _BATCH_SIZE:
+        try:
+            batch.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            return
+
+
+async def _run_writer(queue: asyncio.Queue) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + _FLUSH_INTERVAL_SEC
+        try:
+            while len(batch) < _BATCH_SIZE:
+                _drain_nowait(queue, batch)
+                remaining = deadline - loop.time()
+                if len(batch) >= _BATCH_SIZE or remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            # Shutdown while collecting: these entries are already off the queue
+            _write_batch(batch)
+            raise
+        await asyncio.to_thread(_write_batch, batch)
+
+
+def start_auth_log_writer() -> None:
+    """Create the queue and start the flush task on the running loop (app startup)."""
+    global _queue, _writer_task
+
+    if _writer_task is not None and not _writer_task.done():
+        return
+    _queue = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+    _writer_task = asyncio.get_running_loop().create_task(_run_writer(_queue))
+
+
+async def stop_auth_log_writer() -> None:
+    """Stop the flush task and write out whatever is still queued (app shutdown)."""
+    global _queue, _writer_task
+
+    queue, task = _queue, _writer_task
+    _queue, _writer_task = None, None
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    if queue is None:
+        return
+
+    while not queue.empty():
+        batch: list[dict[str, Any]] = []
+        _drain_nowait(queue, batch)
+        await asyncio.to_thread(_write_batch, batch)
@@ -9,29 +9,254 @@ FLOW:
 4. Returns SessionAuthContext(user_id, tenant_id, role)
 
 SECURITY:
-- JWT signature verified by Supabase
+- JWT signature verified locally against the project's JWKS (asymmetric
+  keys, fetched on the shared async HTTP client; unknown kids trigger at most
+  one refetch per minute); legacy HS256 tokens fall back to Supabase
+  GET /auth/v1/user over the same keep-alive client (non-blocking)
+- Verified results cached in-process until min(TTL, exp - skew), keyed by
+  token digest, so repeat requests skip the Supabase round-trip
 - User-to-tenant mapping enforced via user_tenants table
 - Only active user-tenant relationships allowed
+- Resolved (tenant_id, role) cached per user_id for 60s
 """
 
+import asyncio
+import base64
+import hashlib
+import json
 import logging
-from typing import Optional
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Optional
 
+import httpx
+import jwt
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from dpp_api.context import request_id_var
 from dpp_api.db.models import UserTenant
-from dpp_api.db.session import get_db
-from dpp_api.schemas import ProblemDetail
-from dpp_api.supabase_client import get_supabase_client
+from dpp_api.db.session import get_auth_db
+from dpp_api.supabase_client import (
+    get_supabase_api_key,
+    get_supabase_http_client,
+    get_supabase_url,
+)
 
 logger = logging.getLogger(__name__)
 
 # HTTPBearer scheme for session JWT
 session_security = HTTPBearer(auto_error=False, description="Supabase JWT Session Token")
 
+# Per-request memo: (request, resolved context). The request identity check
+# keeps a context from ever answering for a different request.
+_session_auth_memo: ContextVar[Optional[tuple[Request, "SessionAuthContext"]]] = ContextVar(
+    "session_auth_memo", default=None
+)
+
+
+# ── Verified JWT cache ──────────────────────────────────────────────────────
+# Keyed by a BLAKE2b digest of the compact token (the raw JWT is never kept).
+# Value: (user_id, email, cache_expires_at) with cache_expires_at on the wall
+# clock, capped at both the TTL and the token's own exp minus a skew margin.
+
+_JWT_CACHE_TTL_SEC = 300
+_JWT_CACHE_MAX_ENTRIES = 10_000
+_JWT_EXP_SKEW_SEC = 30
+
+_jwt_cache: dict[bytes, tuple[str, Optional[str], float]] = {}
+
+
+def _jwt_cache_key(jwt_token: str) -> bytes:
+    return hashlib.blake2b(jwt_token.encode(), digest_size=16).digest()
+
+
+def _jwt_exp(jwt_token: str) -> Optional[float]:
+    """Read the exp claim from a JWT payload without verifying it.
+
+    Only called after Supabase has accepted the token, to bound the cache TTL.
+    Returns None if the payload cannot be decoded or carries no numeric exp.
+    """
+    try:
+        payload_b64 = jwt_token.split(".")[1]
+        payload_b64 += "=" * (-len(payload_b64) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload_b64)).get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+def _jwt_cache_get(key: bytes) -> Optional[tuple[str, Optional[str]]]:
+    cached = _jwt_cache.get(key)
+    if cached is None:
+        return None
+    user_id, email, expires_at = cached
+    if time.time() >= expires_at:
+        _jwt_cache.pop(key, None)
+        return None
+    return user_id, email
+
+
+def _jwt_cache_put(key: bytes, jwt_token: str, user_id: str, email: Optional[str]) -> None:
+    now = time.time()
+    expires_at = now + _JWT_CACHE_TTL_SEC
+    exp = _jwt_exp(jwt_token)
+    if exp is not None:
+        expires_at = min(expires_at, exp - _JWT_EXP_SKEW_SEC)
+    if expires_at <= now:
+        return
+
+    if len(_jwt_cache) >= _JWT_CACHE_MAX_ENTRIES:
+        # Drop the oldest insertion; dicts preserve insertion order.
+        _jwt_cache.pop(next(iter(_jwt_cache)), None)
+    _jwt_cache[key] = (user_id, email, expires_at)
+
+
+# ── User -> tenant resolution cache ─────────────────────────────────────────
+# Membership changes rarely; a short TTL bounds staleness across workers.
+# Value: (tenant_id, role, cache_expires_at) on the monotonic clock.
+# "No active tenant" is never cached so a freshly provisioned user is seen at once.
+
+_TENANT_CACHE_TTL_SEC = 60
+_TENANT_CACHE_MAX_ENTRIES = 20_000
+
+_tenant_cache: dict[str, tuple[str, str, float]] = {}
+
+
+def _resolve_user_tenant(db: Session, user_id: str) -> Optional[tuple[str, str]]:
+    """Return (tenant_id, role) of the user's primary active tenant, or None."""
+    now = time.monotonic()
+    cached = _tenant_cache.get(user_id)
+    if cached is not None:
+        tenant_id, role, expires_at = cached
+        if now < expires_at:
+            return tenant_id, role
+        _tenant_cache.pop(user_id, None)
+
+    # Only the indexed columns are selected so Postgres can answer from
+    # ix_user_tenants_active_lookup without touching the heap. Core select()
+    # returns a plain Row; no ORM Query/identity-map work on the hot path.
+    user_tenant = db.execute(
+        select(UserTenant.tenant_id, UserTenant.role)
+        .where(
+            UserTenant.user_id == user_id,
+            UserTenant.status == "active",
+        )
+        .order_by(
+            # Prioritize owner role, then by creation date
+            UserTenant.role.desc(),
+            UserTenant.created_at.asc(),
+        )
+        .limit(1)
+    ).first()
+    if user_tenant is None:
+        return None
+
+    if len(_tenant_cache) >= _TENANT_CACHE_MAX_ENTRIES:
+        _tenant_cache.pop(next(iter(_tenant_cache)), None)
+    _tenant_cache[user_id] = (
+        user_tenant.tenant_id,
+        user_tenant.role,
+        now + _TENANT_CACHE_TTL_SEC,
+    )
+    return user_tenant.tenant_id, user_tenant.role
+
+
+def invalidate_user_tenant_cache(user_id: str) -> None:
+    """Forget the cached tenant of one user (call after mutating user_tenants)."""
+    _tenant_cache.pop(user_id, None)
+
+
+def reset_session_auth_cache() -> None:
+    """Drop all cached session validation results (tests / logout hooks)."""
+    _jwt_cache.clear()
+    _tenant_cache.clear()
+    _get_jwks_cache.cache_clear()
+
+
+# ── Offline JWKS verification ───────────────────────────────────────────────
+# Supabase asymmetric signing keys are published at /auth/v1/.well-known/jwks.json.
+# The key set is fetched on the shared async client (never blocking the event
+# loop) and kept for _JWKS_LIFESPAN_SEC. An unknown kid refetches it, so key
+# rotation is picked up without a restart -- but at most once per
+# _JWKS_MISS_REFRESH_SEC; in between, unknown kids are rejected outright so
+# tokens with random kids cannot force a fetch per request.
+
+_JWKS_LIFESPAN_SEC = 24 * 60 * 60
+_JWKS_MISS_REFRESH_SEC = 60
+_JWT_ASYMMETRIC_ALGS = ("RS256", "ES256")
+_JWT_AUDIENCE = "authenticated"
+
+
+class _JWKSCache:
+    """kid -> signing key map for the project JWKS, refreshed asynchronously."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._loaded_at: Optional[float] = None  # monotonic; None = never loaded
+        self._lock = asyncio.Lock()
+
+    async def get_signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        """Return the key for kid, refetching the set when stale or on a kid miss.
+
+        Raises:
+            jwt.PyJWKClientConnectionError: JWKS endpoint unreachable
+            jwt.PyJWKClientError: No key for kid (after any allowed refetch)
+        """
+        loaded_at = self._loaded_at
+        age = time.monotonic() - loaded_at if loaded_at is not None else None
+        if age is None or age >= _JWKS_LIFESPAN_SEC:
+            await self._refresh(loaded_at)
+        elif kid not in self._keys and age >= _JWKS_MISS_REFRESH_SEC:
+            await self._refresh(loaded_at)
+
+        key = self._keys.get(kid) if kid else None
+        if key is None:
+            raise jwt.PyJWKClientError(f'Unable to find a signing key that matches: "{kid}"')
+        return key
+
+    async def _refresh(self, seen_loaded_at: Optional[float]) -> None:
+        async with self._lock:
+            # Another caller may have refreshed while we waited
+            if self._loaded_at != seen_loaded_at:
+                return
+            try:
+                response = await get_supabase_http_client().get(self.url)
+                response.raise_for_status()
+                jwk_set = response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                raise jwt.PyJWKClientConnectionError(f"JWKS fetch failed: {e}") from e
+            keys = jwt.PyJWKSet.from_dict(jwk_set).keys
+            self._keys = {key.key_id: key for key in keys if key.key_id}
+            self._loaded_at = time.monotonic()
+
+
+@lru_cache(maxsize=1)
+def _get_jwks_cache() -> _JWKSCache:
+    return _JWKSCache(f"{get_supabase_url().rstrip('/')}/auth/v1/.well-known/jwks.json")
+
+
+async def _verify_jwt_locally(jwt_token: str) -> tuple[str, Optional[str]]:
+    """Verify an asymmetrically signed session JWT against the cached JWKS.
+
+    Raises:
+        jwt.PyJWKClientConnectionError: JWKS endpoint unreachable
+        jwt.PyJWTError: Signature, expiry, audience or required-claim failure
+    """
+    kid = jwt.get_unverified_header(jwt_token).get("kid")
+    signing_key = (await _get_jwks_cache().get_signing_key(kid)).key
+    payload = jwt.decode(
+        jwt_token,
+        signing_key,
+        algorithms=list(_JWT_ASYMMETRIC_ALGS),
+        audience=_JWT_AUDIENCE,
+        options={"require": ["exp", "sub"]},
+    )
+    return payload["sub"], payload.get("email")
+
 
 class SessionAuthContext:
     """Session authentication context for user-authenticated requests."""
@@ -49,6 +274,24 @@ class SessionAuthContext:
         self.email = email
 
 
+def _problem_template(status_code: int, title: str) -> dict[str, Any]:
+    return {
+        "type": f"https://api.decisionproof.ai/problems/{title.lower().replace(' ', '-')}",
+        "title": title,
+        "status": status_code,
+    }
+
+
+# Fixed (status, title) pairs raised by this module, built once at import
+_PROBLEM_TEMPLATES: dict[tuple[int, str], dict[str, Any]] = {
+    key: _problem_template(*key)
+    for key in (
+        (401, "Unauthorized"),
+        (403, "No Active Tenant"),
+    )
+}
+
+
 def _create_session_problem(
     status_code: int,
     title: str,
@@ -57,6 +300,10 @@ def _create_session_problem(
 ) -> HTTPException:
     """Create RFC 9457 Problem Detail for session auth errors.
 
+    Builds the payload from _PROBLEM_TEMPLATES instead of validating a
+    ProblemDetail model per failure; output is the same dict that
+    ProblemDetail(...).model_dump(exclude_none=True) produced.
+
     Args:
         status_code: HTTP status code
         title: Problem title
@@ -66,28 +313,105 @@ def _create_session_problem(
     Returns:
         HTTPException with problem+json response
     """
-    trace_id = request_id_var.get()
-
-    problem = ProblemDetail(
-        type=f"https://api.decisionproof.ai/problems/{title.lower().replace(' ', '-')}",
-        title=title,
-        status=status_code,
-        detail=detail,
-        instance=str(request.url.path),
-        trace_id=trace_id,
-    )
+    template = _PROBLEM_TEMPLATES.get((status_code, title)) or _problem_template(status_code, title)
+    problem = {**template, "detail": detail, "instance": str(request.url.path)}
 
     return HTTPException(
         status_code=status_code,
-        detail=problem.model_dump(exclude_none=True),
+        detail=problem,
         headers={"WWW-Authenticate": "Bearer"},
     )
 
 
+async def _validate_jwt_with_supabase(
+    jwt_token: str, request: Request
+) -> tuple[str, Optional[str]]:
+    """Validate a session JWT against Supabase and return (user_id, email).
+
+    Calls GET /auth/v1/user directly on the shared keep-alive client instead of
+    the blocking SDK get_user(), so the event loop is not held and the TLS
+    connection is reused across requests.
+
+    Raises:
+        HTTPException: 401 if Supabase rejects the token or the call fails
+    """
+    try:
+        response = await get_supabase_http_client().get(
+            f"{get_supabase_url().rstrip('/')}/auth/v1/user",
+            headers={
+                "Authorization": f"Bearer {jwt_token}",
+                "apikey": get_supabase_api_key(),
+            },
+        )
+
+        if response.status_code in (401, 403):
+            raise _create_session_problem(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                title="Unauthorized",
+                detail="Invalid or expired session token. Please log in again.",
+                request=request,
+            )
+        response.raise_for_status()
+
+        user = response.json()
+        user_id = user["id"]
+        email = user.get("email")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"JWT validation failed: {e}", exc_info=True)
+        raise _create_session_problem(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            title="Unauthorized",
+            detail="Session validation failed. Please log in again.",
+            request=request,
+        ) from e
+
+    return user_id, email
+
+
+async def _validate_jwt(jwt_token: str, request: Request) -> tuple[str, Optional[str]]:
+    """Validate a session JWT, offline when the token is asymmetrically signed.
+
+    Legacy HS256 tokens (shared project secret, no public key) and JWKS outages
+    fall back to the Supabase introspection call.
+
+    Raises:
+        HTTPException: 401 if the token is invalid
+    """
+    try:
+        alg = jwt.get_unverified_header(jwt_token).get("alg")
+    except jwt.PyJWTError:
+        alg = None
+
+    if alg not in _JWT_ASYMMETRIC_ALGS:
+        return await _validate_jwt_with_supabase(jwt_token, request)
+
+    try:
+        return await _verify_jwt_locally(jwt_token)
+    except (jwt.PyJWKClientConnectionError, RuntimeError) as e:
+        # RuntimeError: SUPABASE_URL unset, so no JWKS location is known
+        logger.warning(f"JWKS fetch failed, falling back to Supabase get_user: {e}")
+        return await _validate_jwt_with_supabase(jwt_token, request)
+    except (jwt.PyJWTError, KeyError) as e:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Session JWT rejected",
+                extra={"event": "session.jwt.rejected", "reason": type(e).__name__},
+            )
+        raise _create_session_problem(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            title="Unauthorized",
+            detail="Invalid or expired session token. Please log in again.",
+            request=request,
+        ) from e
+
+
 async def get_session_auth_context(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(session_security),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_auth_db),
 ) -> SessionAuthContext:
     """Get session authentication context from Supabase JWT.
 
@@ -96,7 +420,7 @@ async def get_session_auth_context(
     Args:
         request: FastAPI request
         credentials: HTTP Bearer credentials (JWT)
-        db: Database session
+        db: Auth-only database session (closed once the tenant is resolved)
 
     Returns:
         SessionAuthContext with user_id, tenant_id, role
@@ -104,6 +428,11 @@ async def get_session_auth_context(
     Raises:
         HTTPException: 401 if authentication fails (RFC 9457 Problem Detail)
     """
+    # Already resolved for this request (e.g. reached via several Depends chains)
+    memo = _session_auth_memo.get()
+    if memo is not None and memo[0] is request:
+        return memo[1]
+
     # Check credentials present
     if not credentials:
         raise _create_session_problem(
@@ -114,63 +443,23 @@ async def get_session_auth_context(
         )
 
     jwt_token = credentials.credentials
+    cache_key = _jwt_cache_key(jwt_token)
 
-    # Validate JWT with Supabase
-    try:
-        supabase = get_supabase_client()
-
-        # Get user from JWT
-        # Supabase client validates JWT signature and expiration
-        user_response = supabase.auth.get_user(jwt_token)
-
-        if not user_response or not user_response.user:
-            raise _create_session_problem(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                title="Unauthorized",
-                detail="Invalid or expired session token. Please log in again.",
-                request=request,
-            )
-
-        user = user_response.user
-        user_id = user.id
-        email = user.email
-
-        logger.info(
-            "Session JWT validated",
-            extra={
-                "event": "session.jwt.validated",
-                "user_id": user_id,
-                "email": email,
-            },
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"JWT validation failed: {e}", exc_info=True)
-        raise _create_session_problem(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            title="Unauthorized",
-            detail="Session validation failed. Please log in again.",
-            request=request,
-        )
+    cached = _jwt_cache_get(cache_key)
+    if cached is not None:
+        user_id, email = cached
+    else:
+        user_id, email = await _validate_jwt(jwt_token, request)
+        _jwt_cache_put(cache_key, jwt_token, user_id, email)
 
     # Look up user's primary tenant
-    user_tenant = (
-        db.query(UserTenant)
-        .filter(
-            UserTenant.user_id == user_id,
-            UserTenant.status == "active",
-        )
-        .order_by(
-            # Prioritize owner role, then by creation date
-            UserTenant.role.desc(),
-            UserTenant.created_at.asc(),
-        )
-        .first()
-    )
+    try:
+        resolved = _resolve_user_tenant(db, user_id)
+    finally:
+        # Release the connection before the route handler runs
+        db.close()
 
-    if not user_tenant:
+    if resolved is None:
         # User has no active tenant - this should not happen in normal flow
         # but could occur if user is deleted from tenant
         logger.warning(
@@ -189,22 +478,31 @@ async def get_session_auth_context(
             request=request,
         )
 
-    logger.info(
-        "Session authentication successful",
-        extra={
-            "event": "session.auth.success",
-            "user_id": user_id,
-            "tenant_id": user_tenant.tenant_id,
-            "role": user_tenant.role,
-        },
-    )
+    tenant_id, role = resolved
 
-    return SessionAuthContext(
+    # Single success event (JWT validation + tenant resolution); the extra dict
+    # is only built when INFO is enabled
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Session authentication successful",
+            extra={
+                "event": "session.auth.success",
+                "user_id": user_id,
+                "email": email,
+                "tenant_id": tenant_id,
+                "role": role,
+                "jwt_cached": cached is not None,
+            },
+        )
+
+    auth = SessionAuthContext(
         user_id=user_id,
-        tenant_id=user_tenant.tenant_id,
-        role=user_tenant.role,
+        tenant_id=tenant_id,
+        role=role,
         email=email,
     )
+    _session_auth_memo.set((request, auth))
+    return auth
 
 
 def require_session_owner(
@@ -6,30 +6,77 @@ SECURITY:
 - Tokens must be in Authorization: Bearer <token> header
 - Uniform 401 responses (no information leakage)
 - Supports rotating tokens with grace period
-- Updates last_used_at with rate limiting
+- Updates last_used_at with rate limiting, in the same statement as the lookup
 - Privacy-preserving request logging
+- Lookups cached in-process by token hash (60s, 5s for unknown hashes);
+  revoke/rotate in this process invalidate immediately, other workers
+  converge within the TTL
 """
 
 import logging
+import time
 import uuid
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import UUID, Row, text, update
 from sqlalchemy.orm import Session
 
-from dpp_api.auth.token_lifecycle import hash_for_logging, hash_token
+from dpp_api.auth import audit_queue
+from dpp_api.auth.token_lifecycle import hash_for_logging, hash_token, is_well_formed_token
 from dpp_api.context import request_id_var, tenant_id_var
 from dpp_api.db.models import APIToken, AuthRequestLog
-from dpp_api.db.session import get_db
-from dpp_api.schemas import ProblemDetail
+from dpp_api.db.session import get_auth_db
 
 logger = logging.getLogger(__name__)
 
 # HTTPBearer scheme for OpenAPI docs
 token_security = HTTPBearer(auto_error=False, description="API Token (opaque Bearer)")
 
+# Per-request memo: (request, resolved context). The request identity check
+# keeps a context from ever answering for a different request.
+_token_auth_memo: ContextVar[Optional[tuple[Request, "TokenAuthContext"]]] = ContextVar(
+    "token_auth_memo", default=None
+)
+
+# last_used_at is refreshed at most once per interval to avoid write amplification
+_LAST_USED_UPDATE_INTERVAL_SEC = 3600
+
+# Lookup + rate-limited last_used_at touch in one round-trip.
+# The UPDATE only matches usable, unexpired tokens whose last_used_at is stale;
+# otherwise the plain SELECT branch returns the row (touched = false).
+# Both branches read the pre-statement snapshot, so NOT EXISTS keeps it to one row.
+# id is typed like APIToken.id: untyped, psycopg 3 returns uuid.UUID, which would
+# leak into TokenAuthContext.token_id, the token cache and the audit queue.
+_LOOKUP_AND_TOUCH_SQL = text(
+    """
+    WITH touched AS (
+        UPDATE api_tokens
+        SET last_used_at = now()
+        WHERE token_hash = :token_hash
+          AND status IN ('active', 'rotating')
+          AND revoked_at IS NULL
+          AND (expires_at IS NULL OR expires_at > now())
+          AND (last_used_at IS NULL
+               OR last_used_at < now() - make_interval(secs => :interval_sec))
+        RETURNING id, tenant_id, scopes, status, expires_at
+    )
+    SELECT id, tenant_id, scopes, status, expires_at, true AS touched
+    FROM touched
+    UNION ALL
+    SELECT id, tenant_id, scopes, status, expires_at, false AS touched
+    FROM api_tokens
+    WHERE token_hash = :token_hash
+      AND status IN ('active', 'rotating')
+      AND revoked_at IS NULL
+      AND NOT EXISTS (SELECT 1 FROM touched)
+    LIMIT 1
+    """
+).columns(id=UUID(as_uuid=False))
+
 
 class TokenAuthContext:
     """Authentication context for token-authenticated requests."""
@@ -45,6 +92,24 @@ class TokenAuthContext:
         self.scopes = scopes or []
 
 
+def _problem_template(status_code: int, title: str) -> dict[str, Any]:
+    return {
+        "type": f"https://api.decisionproof.ai/problems/{title.lower().replace(' ', '-')}",
+        "title": title,
+        "status": status_code,
+    }
+
+
+# Fixed (status, title) pairs raised by this module, built once at import
+_PROBLEM_TEMPLATES: dict[tuple[int, str], dict[str, Any]] = {
+    key: _problem_template(*key)
+    for key in (
+        (401, "Unauthorized"),
+        (401, "Token Expired"),
+    )
+}
+
+
 def _create_auth_problem(
     status_code: int,
     title: str,
@@ -53,6 +118,9 @@ def _create_auth_problem(
 ) -> HTTPException:
     """Create RFC 9457 Problem Detail for auth errors.
 
+    The static part comes from _PROBLEM_TEMPLATES, so a failed attempt
+    costs one dict merge rather than a Pydantic model build and dump.
+
     Args:
         status_code: HTTP status code
         title: Problem title
@@ -62,20 +130,12 @@ def _create_auth_problem(
     Returns:
         HTTPException with problem+json response
     """
-    trace_id = request_id_var.get()
-
-    problem = ProblemDetail(
-        type=f"https://api.decisionproof.ai/problems/{title.lower().replace(' ', '-')}",
-        title=title,
-        status=status_code,
-        detail=detail,
-        instance=str(request.url.path),
-        trace_id=trace_id,
-    )
+    template = _PROBLEM_TEMPLATES.get((status_code, title)) or _problem_template(status_code, title)
+    problem = {**template, "detail": detail, "instance": str(request.url.path)}
 
     return HTTPException(
         status_code=status_code,
-        detail=problem.model_dump(exclude_none=True),
+        detail=problem,
         headers={"WWW-Authenticate": "Bearer"},
     )
 
@@ -83,16 +143,18 @@ def _create_auth_problem(
 async def get_token_auth_context(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(token_security),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_auth_db),
 ) -> TokenAuthContext:
     """Get authentication context from API token.
 
     Validates opaque Bearer token and returns principal with tenant_id.
+    The auth session is closed before returning, so its connection is not
+    held while the route handler runs.
 
     Args:
         request: FastAPI request
         credentials: HTTP Bearer credentials
-        db: Database session
+        db: Auth-only database session
 
     Returns:
         TokenAuthContext with tenant_id, token_id, scopes
@@ -100,6 +162,25 @@ async def get_token_auth_context(
     Raises:
         HTTPException: 401 if authentication fails (RFC 9457 Problem Detail)
     """
+    # Already resolved for this request (e.g. reached via several Depends chains)
+    memo = _token_auth_memo.get()
+    if memo is not None and memo[0] is request:
+        db.close()
+        return memo[1]
+
+    try:
+        auth = _authenticate_token(request, credentials, db)
+    finally:
+        db.close()
+    _token_auth_memo.set((request, auth))
+    return auth
+
+
+def _authenticate_token(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials],
+    db: Session,
+) -> TokenAuthContext:
     # Check credentials present
     if not credentials:
         raise _create_auth_problem(
@@ -111,31 +192,31 @@ async def get_token_auth_context(
 
     raw_token = credentials.credentials
 
-    # Compute token hash
-    try:
-        token_hash_value = hash_token(raw_token, pepper_version=1)
-    except Exception as e:
-        logger.error(f"Token hashing failed: {e}", exc_info=True)
-        raise _create_auth_problem(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            title="Unauthorized",
-            detail="Invalid token format",
-            request=request,
-        )
+    # Malformed tokens cannot match any stored hash: skip HMAC, cache and DB
+    # and fall through to the same uniform 401 as an unknown token
+    if not is_well_formed_token(raw_token):
+        token = None
+    else:
+        # Compute token hash
+        try:
+            token_hash_value = hash_token(raw_token, pepper_version=1)
+        except Exception as e:
+            logger.error(f"Token hashing failed: {e}", exc_info=True)
+            raise _create_auth_problem(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                title="Unauthorized",
+                detail="Invalid token format",
+                request=request,
+            )
 
-    # Lookup token in database
-    # Status: active OR rotating (grace period)
-    # Not expired (expires_at is NULL or future)
-    # Not revoked (revoked_at is NULL)
-    token = (
-        db.query(APIToken)
-        .filter(
-            APIToken.token_hash == token_hash_value,
-            APIToken.status.in_(["active", "rotating"]),
-            APIToken.revoked_at.is_(None),
-        )
-        .first()
-    )
+        # Lookup token in database (and touch last_used_at if stale)
+        # Status: active OR rotating (grace period)
+        # Not revoked (revoked_at is NULL)
+        # Expiry is checked below so expired tokens get their own 401
+        hit, token = _token_cache_get(token_hash_value)
+        if not hit:
+            token = _lookup_token_and_touch(db, token_hash_value)
+            _token_cache_put(token_hash_value, token)
 
     if not token:
         # Stealth 401: Don't reveal whether token exists
@@ -178,9 +259,15 @@ async def get_token_auth_context(
                 },
             )
 
+            invalidate_token_cache(token_hash_value)
+
             # Update status to expired (idempotent)
             if token.status != "expired":
-                token.status = "expired"
+                db.execute(
+                    update(APIToken)
+                    .where(APIToken.id == token.id, APIToken.status != "expired")
+                    .values(status="expired")
+                )
                 db.commit()
 
             # Log failed auth attempt
@@ -200,19 +287,17 @@ async def get_token_auth_context(
             )
 
     # Authentication successful
-    logger.info(
-        "Token authentication successful",
-        extra={
-            "event": "token.auth.success",
-            "token_id": token.id,
-            "tenant_id": token.tenant_id,
-            "status": token.status,
-        },
-    )
-
-    # Update last_used_at with rate limiting (once per hour)
-    # Prevents write amplification from high-traffic tokens
-    _update_last_used_if_needed(db, token)
+    # The extra dict is only built when INFO is enabled (WARNING in prod)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Token authentication successful",
+            extra={
+                "event": "token.auth.success",
+                "token_id": token.id,
+                "tenant_id": token.tenant_id,
+                "status": token.status,
+            },
+        )
 
     # Log successful auth request
     _log_auth_request(
@@ -230,35 +315,78 @@ async def get_token_auth_context(
     return TokenAuthContext(
         tenant_id=token.tenant_id,
         token_id=token.id,
-        scopes=token.scopes or [],
+        scopes=list(token.scopes or []),
     )
 
 
-def _update_last_used_if_needed(db: Session, token: APIToken) -> None:
-    """Update last_used_at if older than 1 hour (rate limiting).
+# ── Token lookup cache ──────────────────────────────────────────────────────
+# token_hash -> (row or None, cache_expires_at) on the monotonic clock.
+# None entries are negative hits: unknown hashes are remembered briefly to blunt
+# credential-stuffing floods without hiding a newly issued token for long.
+# expires_at is re-checked on every hit, so a cached row never outlives the
+# token's expiry. status is NOT re-checked: the revoke/rotate routes invalidate
+# this worker's entry, but a token revoked on another worker stays accepted
+# here for up to _TOKEN_CACHE_TTL_SEC (revocation lag).
+
+_TOKEN_CACHE_TTL_SEC = 60
+_TOKEN_NEGATIVE_TTL_SEC = 5
+_TOKEN_CACHE_MAX_ENTRIES = 50_000
+
+_token_cache: dict[str, tuple[Optional[Row], float]] = {}
+
+
+def _token_cache_get(token_hash_value: str) -> tuple[bool, Optional[Row]]:
+    """Return (hit, row); row is None on a negative hit."""
+    cached = _token_cache.get(token_hash_value)
+    if cached is None:
+        return False, None
+    row, expires_at = cached
+    if time.monotonic() >= expires_at:
+        _token_cache.pop(token_hash_value, None)
+        return False, None
+    return True, row
+
 
-    Prevents write amplification from high-frequency API calls.
+def _token_cache_put(token_hash_value: str, row: Optional[Row]) -> None:
+    ttl = _TOKEN_CACHE_TTL_SEC if row is not None else _TOKEN_NEGATIVE_TTL_SEC
+    if len(_token_cache) >= _TOKEN_CACHE_MAX_ENTRIES:
+        _token_cache.pop(next(iter(_token_cache)), None)
+    _token_cache[token_hash_value] = (row, time.monotonic() + ttl)
+
+
+def invalidate_token_cache(*token_hashes: str) -> None:
+    """Forget cached lookups (call after revoking or rotating tokens)."""
+    for token_hash_value in token_hashes:
+        _token_cache.pop(token_hash_value, None)
+
+
+def reset_token_auth_cache() -> None:
+    """Drop every cached token lookup (tests)."""
+    _token_cache.clear()
+
+
+def _lookup_token_and_touch(db: Session, token_hash_value: str) -> Optional[Row]:
+    """Fetch a usable token and refresh last_used_at if older than 1 hour.
+
+    One statement replaces the former SELECT + conditional UPDATE pair; the
+    transaction is committed only when last_used_at was actually written.
 
     Args:
         db: Database session
-        token: API token object
+        token_hash_value: HMAC hash of the presented token
+
+    Returns:
+        Row(id, tenant_id, scopes, status, expires_at, touched) or None
     """
-    now = datetime.now(timezone.utc)
+    row = db.execute(
+        _LOOKUP_AND_TOUCH_SQL,
+        {"token_hash": token_hash_value, "interval_sec": _LAST_USED_UPDATE_INTERVAL_SEC},
+    ).first()
 
-    # Only update if:
-    # - last_used_at is NULL (never used)
-    # - last_used_at is older than 1 hour
-    if token.last_used_at is None:
-        token.last_used_at = now
+    if row is not None and row.touched:
         db.commit()
-        return
 
-    seconds_since_last_update = (now - token.last_used_at).total_seconds()
-    rate_limit_seconds = 3600  # 1 hour
-
-    if seconds_since_last_update >= rate_limit_seconds:
-        token.last_used_at = now
-        db.commit()
+    return row
 
 
 def _log_auth_request(
@@ -270,6 +398,9 @@ def _log_auth_request(
 ) -> None:
     """Log authentication request to auth_request_log (privacy-preserving).
 
+    Queued for the background batch writer (auth/audit_queue.py) so the
+    request path does no INSERT/COMMIT of its own.
+
     Args:
         db: Database session
         request: FastAPI request
@@ -285,20 +416,25 @@ def _log_auth_request(
         ip_hash = hash_for_logging(client_ip) if client_ip else None
         ua_hash = hash_for_logging(user_agent) if user_agent else None
 
-        # Create log entry
-        log_entry = AuthRequestLog(
-            id=str(uuid.uuid4()),
-            token_id=token_id,
-            tenant_id=tenant_id,
-            route=str(request.url.path),
-            method=request.method,
-            status_code=status_code,
-            ip_hash=ip_hash,
-            ua_hash=ua_hash,
-            trace_id=request_id_var.get(),
-        )
-
-        db.add(log_entry)
+        entry = {
+            "id": str(uuid.uuid4()),
+            "token_id": token_id,
+            "tenant_id": tenant_id,
+            "route": str(request.url.path),
+            "method": request.method,
+            "status_code": status_code,
+            "ip_hash": ip_hash,
+            "ua_hash": ua_hash,
+            "trace_id": request_id_var.get(),
+            "created_at": datetime.now(timezone.utc),
+        }
+
+        # Hand off to the batched background writer; write inline only when
+        # it is not running (e.g. outside the app lifecycle)
+        if audit_queue.submit(entry):
+            return
+
+        db.add(AuthRequestLog(**entry))
         db.commit()
 
     except Exception as e:
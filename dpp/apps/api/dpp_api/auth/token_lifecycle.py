@@ -14,14 +14,24 @@ import hashlib
 import hmac
 import logging
 import os
+import re
 import secrets
+from functools import lru_cache
 from typing import Tuple
 
 logger = logging.getLogger(__name__)
 
 
-def get_pepper(version: int = 1) -> str:
-    """Get pepper by version for HMAC hashing.
+# Issued token shape: dp_live_/dp_test_ + base64url(32 bytes) without padding (43 chars)
+_TOKEN_FORMAT = re.compile(r"dp_(?:live|test)_[A-Za-z0-9_-]{43}")
+
+
+@lru_cache(maxsize=4)
+def get_pepper(version: int = 1) -> bytes:
+    """Get pepper by version for HMAC hashing, UTF-8 encoded and memoized.
+
+    Read from the environment once per version (a missing pepper is not
+    cached, so it is re-checked on the next call).
 
     Environment Variables:
     - TOKEN_PEPPER_V1: Required for version 1 (default)
@@ -31,7 +41,7 @@ def get_pepper(version: int = 1) -> str:
         version: Pepper version number (1 or 2)
 
     Returns:
-        Pepper string
+        Pepper bytes (HMAC key)
 
     Raises:
         ValueError: If pepper not found for version
@@ -45,7 +55,7 @@ def get_pepper(version: int = 1) -> str:
             f"Generate with: python -c 'import secrets; print(secrets.token_urlsafe(32))'"
         )
 
-    return pepper
+    return pepper.encode("utf-8")
 
 
 def generate_token(prefix: str = "dp_live") -> Tuple[str, str]:
@@ -92,6 +102,20 @@ def generate_token(prefix: str = "dp_live") -> Tuple[str, str]:
     return full_token, last4
 
 
+def is_well_formed_token(raw_token: str) -> bool:
+    """Check that a presented token has the shape generate_token() issues.
+
+    Cheap pre-filter before HMAC: anything else cannot match a stored hash.
+
+    Args:
+        raw_token: Presented token string
+
+    Returns:
+        True if prefix, alphabet and length match an issued token
+    """
+    return _TOKEN_FORMAT.fullmatch(raw_token) is not None
+
+
 def hash_token(raw_token: str, pepper_version: int = 1) -> str:
     """Hash token using HMAC-SHA256 with pepper.
 
@@ -109,12 +133,10 @@ def hash_token(raw_token: str, pepper_version: int = 1) -> str:
     """
     pepper = get_pepper(pepper_version)
 
-    # HMAC-SHA256
-    hmac_digest = hmac.new(
-        key=pepper.encode("utf-8"),
-        msg=raw_token.encode("utf-8"),
-        digestmod=hashlib.sha256,
-    ).digest()
+    # HMAC-SHA256, one-shot: hmac.digest() runs entirely in OpenSSL, unlike
+    # hmac.new().digest() which drives the inner/outer hashes from Python.
+    # Output is byte-identical, so stored token hashes stay valid.
+    hmac_digest = hmac.digest(pepper, raw_token.encode("utf-8"), "sha256")
 
     # Encode as base64url without padding
     token_hash = base64.urlsafe_b64encode(hmac_digest).decode("ascii").rstrip("=")
@@ -155,41 +177,62 @@ def parse_token_prefix(raw_token: str) -> str:
     Raises:
         ValueError: If token format is invalid
     """
-    if "_" not in raw_token:
+    first = raw_token.find("_")
+    if first < 0:
         raise ValueError("Invalid token format: missing prefix separator")
 
-    parts = raw_token.split("_", 2)
-    if len(parts) < 2:
-        raise ValueError("Invalid token format: invalid structure")
+    # Prefix runs up to the second separator (e.g., dp_live); a token with
+    # only one separator is all prefix
+    second = raw_token.find("_", first + 1)
+    if second < 0:
+        return raw_token
+
+    return raw_token[:second]
 
-    # Reconstruct prefix (e.g., dp_live)
-    prefix = f"{parts[0]}_{parts[1]}"
 
-    return prefix
+_DEFAULT_LOG_PEPPER = "default-log-pepper-change-me"
 
 
+@lru_cache(maxsize=1)
+def _log_pepper_key() -> bytes:
+    """LOG_PEPPER as a BLAKE2b key (read once; peppers over 64 bytes are pre-hashed)."""
+    log_pepper = os.getenv("LOG_PEPPER", _DEFAULT_LOG_PEPPER)
+
+    if log_pepper == _DEFAULT_LOG_PEPPER:
+        logger.warning(
+            "LOG_PEPPER not set, using default (INSECURE). "
+            "Set LOG_PEPPER environment variable."
+        )
+
+    key = log_pepper.encode("utf-8")
+    if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+        key = hashlib.blake2b(key).digest()
+    return key
+
+
+@lru_cache(maxsize=4096)
 def hash_for_logging(value: str) -> str:
     """Hash value for privacy-preserving logging.
 
     Used for IP addresses and User-Agent strings in auth_request_log.
+    Memoized: repeat callers present the same IP/UA on every request.
 
     Args:
         value: Value to hash (IP or UA string)
 
     Returns:
-        Hex-encoded SHA256 hash
+        Hex-encoded keyed BLAKE2b-128 hash (32 chars)
 
     Security:
     - Uses separate LOG_PEPPER from token pepper
-    - SHA256 for one-way hashing
+    - Keyed BLAKE2b (pepper as MAC key, no string concatenation)
     """
-    log_pepper = os.getenv("LOG_PEPPER", "default-log-pepper-change-me")
+    return hashlib.blake2b(
+        value.encode("utf-8"), key=_log_pepper_key(), digest_size=16
+    ).hexdigest()
 
-    if log_pepper == "default-log-pepper-change-me":
-        logger.warning(
-            "LOG_PEPPER not set, using default (INSECURE). "
-            "Set LOG_PEPPER environment variable."
-        )
 
-    hash_digest = hashlib.sha256(f"{log_pepper}{value}".encode("utf-8")).digest()
-    return hash_digest.hex()
+def reset_log_hash_cache() -> None:
+    """Drop the memoized LOG_PEPPER key and hashes (tests / pepper rotation)."""
+    _log_pepper_key.cache_clear()
+    hash_for_logging.cache_clear()
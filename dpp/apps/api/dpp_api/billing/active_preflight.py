@@ -17,9 +17,13 @@ Rules (NON-NEGOTIABLE)
 - Network calls happen ONCE at startup; results are cached in module-level state.
 - /health and /readyz endpoints read the *cached* result — zero extra network calls.
 - Secret values are NEVER logged. Only status codes and error codes are recorded.
-- Timeout is configurable via DPP_BILLING_PREFLIGHT_TIMEOUT_SECONDS (default: 5).
+- Timeout is configurable via DPP_BILLING_PREFLIGHT_TIMEOUT_SECONDS (default: 5);
+  each check also runs under a hard deadline of timeout + 1s.
 - DPP_BILLING_PREFLIGHT_REQUIRED=1 → failure raises RuntimeError (Fail-Fast).
 - DPP_BILLING_PREFLIGHT_REQUIRED=0 → failure logs CRITICAL and caches "degraded".
+- DPP_BILLING_PREFLIGHT_CACHE_URL (optional, redis://...) shares an all-ok result
+  across workers for 60s, so only the first worker to boot calls the providers.
+  Cache errors never fail startup; the worker just runs its own checks.
 
 Usage
 -----
@@ -35,13 +39,23 @@ Usage
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
+import hmac
 import logging
 import os
-import uuid
+import socket
+from collections.abc import AsyncIterator, Iterable, Mapping
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import httpx
+import orjson
+import redis
+import redis.asyncio
 
 logger = logging.getLogger(__name__)
 
@@ -49,34 +63,177 @@ logger = logging.getLogger(__name__)
 # Module-level cache (populated once at startup)
 # ---------------------------------------------------------------------------
 
-_preflight_result: dict[str, str] | None = None  # None = not yet run
+# Frozen view of the last result: probes get the same object back, no copy per call
+_preflight_result: Mapping[str, str] | None = None  # None = not yet run
+_SKIPPED: Mapping[str, str] = MappingProxyType({"status": "skipped"})
 
 
-def get_billing_preflight_status() -> dict[str, str]:
+def get_billing_preflight_status() -> Mapping[str, str]:
     """Return the cached billing preflight result (no network call).
 
     Phase 4 (v1.0 PayPal-only): returns {"paypal": "ok"|"err:..."}.
     Toss key is absent — a missing Toss result is not a failure.
 
     Returns:
-        Dict with key "paypal", value "ok" or "err:<code>".
+        Read-only mapping with key "paypal", value "ok" or "err:<code>".
         If preflight has not run yet (e.g., disabled), returns {"status": "skipped"}.
     """
     if _preflight_result is None:
-        return {"status": "skipped"}
-    return dict(_preflight_result)
+        return _SKIPPED
+    return _preflight_result
 
 
 def _reset_preflight_cache() -> None:
     """Reset the module-level cache. Used in tests for isolation."""
     global _preflight_result
     _preflight_result = None
+    reset_preflight_env_cache()
+
+
+def reset_preflight_env_cache() -> None:
+    """Drop the memoized env settings (test helper)."""
+    _get_timeout.cache_clear()
+    _is_required.cache_clear()
+    _paypal_base_url.cache_clear()
+    _shared_cache_url.cache_clear()
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Synthetic Toss orderId — never issued by checkout, so the probe always gets
+# "not found". Fixed per process: the preflight runs at most once anyway.
+_TOSS_PROBE_ID = f"dpp_preflight_{socket.gethostname()}_{os.getpid()}"
+
+# Outer deadline slack over the httpx timeout: httpx bounds each phase
+# (connect/read/...) separately, so DNS or TLS stalls can exceed it in total.
+_DEADLINE_GRACE_SEC = 1.0
+
+
+def _network_error_reason(exc: BaseException) -> str:
+    if isinstance(exc, TimeoutError):
+        return "ASYNCIO_TIMEOUT"
+    return f"NETWORK_ERROR:{type(exc).__name__}"
+
+
+@lru_cache(maxsize=1)
+def _shared_cache_url() -> str:
+    return os.getenv("DPP_BILLING_PREFLIGHT_CACHE_URL", "").strip()
+
+
+# ---------------------------------------------------------------------------
+# Shared (cross-worker) result cache — L2 behind _preflight_result
+# ---------------------------------------------------------------------------
+
+_SHARED_CACHE_KEY_PREFIX = "billing:preflight:result"
+_SHARED_CACHE_TTL_SEC = 60
+_SHARED_CACHE_SOCKET_TIMEOUT = 2.0
+
+
+def _shared_cache_client(url: str) -> redis.asyncio.Redis:
+    return redis.asyncio.from_url(
+        url,
+        socket_connect_timeout=_SHARED_CACHE_SOCKET_TIMEOUT,
+        socket_timeout=_SHARED_CACHE_SOCKET_TIMEOUT,
+    )
+
+
+def _provider_credentials(provider: str) -> tuple[bytes, bytes]:
+    """(key, message) fed to the HMAC that fingerprints a provider's secrets."""
+    if provider == "paypal":
+        return (
+            os.getenv("PAYPAL_CLIENT_SECRET", "").strip().encode(),
+            os.getenv("PAYPAL_CLIENT_ID", "").strip().encode(),
+        )
+    if provider == "toss":
+        return os.getenv("TOSS_SECRET_KEY", "").strip().encode(), b"toss"
+    return b"", provider.encode()
+
+
+def _shared_cache_key(providers: Iterable[str]) -> str:
+    """Redis key scoped to PAYPAL_ENV and the exact credentials being checked.
+
+    Each provider's secrets go through HMAC-SHA256 (the secret is the key), so
+    only workers holding identical credentials share a result -- a stale or
+    rotated secret, or a sandbox worker on a live Redis, runs its own checks.
+    The secrets themselves never reach Redis.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for provider in sorted(providers):
+        key, message = _provider_credentials(provider)
+        digest.update(provider.encode() + b"\0")
+        digest.update(hmac.new(key, message, hashlib.sha256).digest())
+    paypal_env = os.getenv("PAYPAL_ENV", "sandbox").strip().lower()
+    return f"{_SHARED_CACHE_KEY_PREFIX}:{paypal_env}:{digest.hexdigest()}"
+
+
+async def _load_shared_preflight(providers: set[str]) -> dict[str, str] | None:
+    """Return a fresh all-ok result written by another worker, if any."""
+    url = _shared_cache_url()
+    if not url:
+        return None
+
+    try:
+        client = _shared_cache_client(url)
+        try:
+            raw = await client.get(_shared_cache_key(providers))
+        finally:
+            await client.aclose()
+        cached = orjson.loads(raw) if raw is not None else None
+    except (redis.RedisError, OSError, orjson.JSONDecodeError) as exc:
+        logger.warning(
+            "BILLING_PREFLIGHT_SHARED_CACHE_UNAVAILABLE",
+            extra={"error_type": type(exc).__name__},
+        )
+        return None
+
+    # Only reuse a result covering exactly the providers this worker checks
+    if (
+        isinstance(cached, dict)
+        and set(cached) == providers
+        and all(v == "ok" for v in cached.values())
+    ):
+        return cached
+    return None
+
+
+async def _store_shared_preflight(result: dict[str, str]) -> None:
+    url = _shared_cache_url()
+    if not url:
+        return
+
+    try:
+        client = _shared_cache_client(url)
+        try:
+            await client.setex(
+                _shared_cache_key(result), _SHARED_CACHE_TTL_SEC, orjson.dumps(result)
+            )
+        finally:
+            await client.aclose()
+    except (redis.RedisError, OSError) as exc:
+        logger.warning(
+            "BILLING_PREFLIGHT_SHARED_CACHE_UNAVAILABLE",
+            extra={"error_type": type(exc).__name__},
+        )
+
+
+@asynccontextmanager
+async def _preflight_client(
+    client: httpx.AsyncClient | None, timeout: float
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client, or a throwaway one when a check runs standalone."""
+    if client is not None:
+        yield client
+        return
+    async with httpx.AsyncClient(timeout=timeout) as owned:
+        yield owned
+
+
+# Env settings are fixed for the process lifetime; each is parsed once.
+# _is_required() in particular is consulted in every failure branch.
+
+@lru_cache(maxsize=1)
 def _get_timeout() -> float:
     try:
         return float(os.getenv("DPP_BILLING_PREFLIGHT_TIMEOUT_SECONDS", "5"))
@@ -84,10 +241,12 @@ def _get_timeout() -> float:
         return 5.0
 
 
+@lru_cache(maxsize=1)
 def _is_required() -> bool:
     return os.getenv("DPP_BILLING_PREFLIGHT_REQUIRED", "1").strip() == "1"
 
 
+@lru_cache(maxsize=1)
 def _paypal_base_url() -> str:
     env = os.getenv("PAYPAL_ENV", "sandbox").strip().lower()
     return (
@@ -101,9 +260,13 @@ def _paypal_base_url() -> str:
 # PayPal active check
 # ---------------------------------------------------------------------------
 
-async def _check_paypal(timeout: float) -> str:
+async def _check_paypal(timeout: float, client: httpx.AsyncClient | None = None) -> str:
     """POST /v1/oauth2/token with grant_type=client_credentials.
 
+    Args:
+        timeout: Per-request timeout in seconds.
+        client: Shared preflight client; a temporary one is used if omitted.
+
     Returns:
         "ok" on success (200 + access_token present).
         "err:<code>" on auth failure (401/403) or other errors.
@@ -125,22 +288,22 @@ async def _check_paypal(timeout: float) -> str:
             raise RuntimeError(f"BILLING_SECRET_PREFLIGHT_FAILED:paypal:{reason}")
         return f"err:{reason}"
 
-    credentials = f"{client_id}:{client_secret}"
-    encoded = base64.b64encode(credentials.encode()).decode()
+    auth_header = b"Basic " + base64.b64encode(client_id.encode() + b":" + client_secret.encode())
     url = f"{_paypal_base_url()}/v1/oauth2/token"
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                url,
-                headers={
-                    "Authorization": f"Basic {encoded}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-                data={"grant_type": "client_credentials"},
-            )
-    except (httpx.TimeoutException, httpx.ConnectError, httpx.RequestError) as exc:
-        reason = f"NETWORK_ERROR:{type(exc).__name__}"
+        async with asyncio.timeout(timeout + _DEADLINE_GRACE_SEC):
+            async with _preflight_client(client, timeout) as http:
+                response = await http.post(
+                    url,
+                    headers={
+                        "Authorization": auth_header,
+                        "Content-Type": "application/x-www-form-urlencoded",
+                    },
+                    data={"grant_type": "client_credentials"},
+                )
+    except (TimeoutError, httpx.TimeoutException, httpx.ConnectError, httpx.RequestError) as exc:
+        reason = _network_error_reason(exc)
         logger.critical(
             "BILLING_PREFLIGHT_PAYPAL_NETWORK_ERROR",
             extra={"error_type": type(exc).__name__},
@@ -150,18 +313,16 @@ async def _check_paypal(timeout: float) -> str:
         return f"err:{reason}"
 
     if response.status_code == 200:
-        try:
-            body = response.json()
-            if "access_token" in body:
-                # token value is NOT logged
+        # Only the key's presence matters: scan the raw body instead of
+        # decoding it (the token value itself is never touched or logged)
+        if b'"access_token"' in response.content:
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
                     "BILLING_PREFLIGHT_PAYPAL_OK",
                     extra={"status_code": 200},
                 )
-                return "ok"
-            reason = "NO_ACCESS_TOKEN_IN_RESPONSE"
-        except Exception:
-            reason = "INVALID_JSON_RESPONSE"
+            return "ok"
+        reason = "NO_ACCESS_TOKEN_IN_RESPONSE"
     else:
         reason = f"HTTP_{response.status_code}"
 
@@ -178,13 +339,16 @@ async def _check_paypal(timeout: float) -> str:
 # Toss active check
 # Phase 4: DORMANT — not called from run_billing_secrets_active_preflight().
 # Preserved for Phase 4+ reactivation when Toss is re-enabled as a provider.
-# To reactivate: add `result["toss"] = await _check_toss(timeout)` below.
+# To reactivate: add `"toss": _check_toss` to the checks dict below.
 # ---------------------------------------------------------------------------
 
-async def _check_toss(timeout: float) -> str:  # noqa: DORMANT_PHASE4
+async def _check_toss(  # noqa: DORMANT_PHASE4
+    timeout: float, client: httpx.AsyncClient | None = None
+) -> str:
     """GET /v1/payments/orders/{probe_id} — auth probe only.
 
     Uses a synthetic orderId that will never exist in the system.
+    Shares the preflight client when one is passed, like _check_paypal.
 
     - 401/403 → authentication failure → FAIL
     - 404/400 → "order not found / bad request" → auth OK → PASS
@@ -205,21 +369,20 @@ async def _check_toss(timeout: float) -> str:  # noqa: DORMANT_PHASE4
             raise RuntimeError(f"BILLING_SECRET_PREFLIGHT_FAILED:toss:{reason}")
         return f"err:{reason}"
 
-    credentials = f"{secret_key}:"
-    encoded = base64.b64encode(credentials.encode()).decode()
+    auth_header = b"Basic " + base64.b64encode(secret_key.encode() + b":")
 
-    # Synthetic orderId — guaranteed non-existent
-    probe_id = f"dpp_preflight_{uuid.uuid4().hex}"
+    probe_id = _TOSS_PROBE_ID
     url = f"https://api.tosspayments.com/v1/payments/orders/{probe_id}"
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(
-                url,
-                headers={"Authorization": f"Basic {encoded}"},
-            )
-    except (httpx.TimeoutException, httpx.ConnectError, httpx.RequestError) as exc:
-        reason = f"NETWORK_ERROR:{type(exc).__name__}"
+        async with asyncio.timeout(timeout + _DEADLINE_GRACE_SEC):
+            async with _preflight_client(client, timeout) as http:
+                response = await http.get(
+                    url,
+                    headers={"Authorization": auth_header},
+                )
+    except (TimeoutError, httpx.TimeoutException, httpx.ConnectError, httpx.RequestError) as exc:
+        reason = _network_error_reason(exc)
         logger.critical(
             "BILLING_PREFLIGHT_TOSS_NETWORK_ERROR",
             extra={"error_type": type(exc).__name__},
@@ -237,10 +400,11 @@ async def _check_toss(timeout: float) -> str:  # noqa: DORMANT_PHASE4
             err_code = body.get("code", "UNKNOWN")  # only code, never full body
         except Exception:
             err_code = "NO_JSON"
-        logger.info(
-            "BILLING_PREFLIGHT_TOSS_OK",
-            extra={"status_code": status, "toss_error_code": err_code, "probe_id": probe_id},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "BILLING_PREFLIGHT_TOSS_OK",
+                extra={"status_code": status, "toss_error_code": err_code, "probe_id": probe_id},
+            )
         return "ok"
 
     if status in (401, 403):
@@ -274,6 +438,11 @@ async def run_billing_secrets_active_preflight() -> dict[str, Any]:
     Called ONCE from startup_event(). Results cached in module state.
     Subsequent calls are no-ops (idempotent guard).
 
+    Provider checks run concurrently, so startup waits for the slowest
+    check rather than the sum of all of them. Fail-Fast errors are raised
+    only after every check has finished, so each provider's failure is
+    logged before startup aborts.
+
     Phase 4: Toss check is EXCLUDED from this path.
     A missing or invalid Toss secret does NOT block startup or readyz.
 
@@ -291,22 +460,48 @@ async def run_billing_secrets_active_preflight() -> dict[str, Any]:
         return dict(_preflight_result)
 
     timeout = _get_timeout()
-    result: dict[str, str] = {}
 
-    # PayPal — launch-critical for v1.0 beta
-    paypal_status = await _check_paypal(timeout)
-    result["paypal"] = paypal_status
+    checks = {
+        # PayPal — launch-critical for v1.0 beta
+        "paypal": _check_paypal,
+        # Toss — Phase 4: EXCLUDED (not launch-critical for v1.0 PayPal-only beta)
+        # To re-enable Toss: "toss": _check_toss,
+    }
+
+    # Another worker passed the same checks moments ago: reuse its result
+    shared = await _load_shared_preflight(set(checks))
+    if shared is not None:
+        _preflight_result = MappingProxyType(shared)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "BILLING_SECRET_PREFLIGHT_OK",
+                extra={"providers": ",".join(shared), "source": "shared_cache"},
+            )
+        return dict(shared)
 
-    # Toss — Phase 4: EXCLUDED (not launch-critical for v1.0 PayPal-only beta)
-    # To re-enable Toss: result["toss"] = await _check_toss(timeout)
+    # One client (SSL context, pool) for all providers
+    async with httpx.AsyncClient(timeout=timeout, http2=True) as client:
+        outcomes = await asyncio.gather(
+            *(check(timeout, client=client) for check in checks.values()),
+            return_exceptions=True,
+        )
 
-    _preflight_result = result
+    # REQUIRED=1 failures surface as exceptions; raise the first one only
+    # after all checks completed
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+    result: dict[str, str] = dict(zip(checks, outcomes, strict=True))
+    _preflight_result = MappingProxyType(result)
 
     if result.get("paypal") == "ok":
-        logger.info(
-            "BILLING_SECRET_PREFLIGHT_OK",
-            extra={"providers": "paypal"},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "BILLING_SECRET_PREFLIGHT_OK",
+                extra={"providers": "paypal"},
+            )
+        await _store_shared_preflight(result)
     else:
         failed = [k for k, v in result.items() if v != "ok"]
         logger.critical(
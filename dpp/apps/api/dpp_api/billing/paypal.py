@@ -9,15 +9,42 @@ PayPal API Reference:
 - Webhooks: https://developer.paypal.com/api/rest/webhooks/
 """
 
+import asyncio
 import base64
 import logging
 import os
+import socket
+import threading
+import time
 from typing import Optional
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool shared by every call on a client: one TCP+TLS handshake to
+# api-m.paypal.com per pooled connection instead of one per API call.
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=120.0
+)
+# Idle connections are held 120s (httpx default: 5s) so sporadic checkouts
+# reuse a warm TLS session; SO_KEEPALIVE keeps NAT/LB paths open meanwhile.
+_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+_HTTP_TIMEOUT = 30.0
+
+# Refresh the cached OAuth token this long before PayPal says it expires
+_TOKEN_EXPIRY_SKEW_SEC = 60
+# Form body of every token request, already url-encoded
+_TOKEN_REQUEST_BODY = b"grant_type=client_credentials"
+
+# Fixed part of every order's application_context; only the redirect URLs vary
+_ORDER_APPLICATION_CONTEXT = {
+    "brand_name": "Decisionproof",
+    "landing_page": "NO_PREFERENCE",
+    "user_action": "PAY_NOW",
+}
+
 
 class PayPalClient:
     """PayPal Orders API client (CAPTURE flow).
@@ -47,34 +74,69 @@ class PayPalClient:
             else "https://api-m.paypal.com"
         )
 
+        # HTTP/2: token + order calls multiplex over one TLS connection
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True, limits=_HTTP_LIMITS, socket_options=_SOCKET_OPTIONS
+            ),
+            timeout=_HTTP_TIMEOUT,
+        )
+
+        # Basic Auth for the token endpoint: base64(client_id:client_secret), built once
+        self._basic_auth_header = b"Basic " + base64.b64encode(
+            self.client_id.encode() + b":" + self.client_secret.encode()
+        )
+
+        # OAuth token cache (monotonic expiry); the lock coalesces refreshes
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._client.aclose()
+
     async def get_access_token(self) -> str:
         """Get OAuth 2.0 access token from PayPal.
 
+        The token is reused until _TOKEN_EXPIRY_SKEW_SEC before its
+        expires_in; concurrent callers wait for a single refresh.
+
         Returns:
             Access token string
 
         Raises:
             httpx.HTTPStatusError: If token request fails
         """
-        url = f"{self.base_url}/v1/oauth2/token"
+        if self._token and time.monotonic() < self._token_expires_at:
+            return self._token
 
-        # Basic Auth: base64(client_id:client_secret)
-        credentials = f"{self.client_id}:{self.client_secret}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
+        async with self._token_lock:
+            # Another caller may have refreshed while we waited
+            if self._token and time.monotonic() < self._token_expires_at:
+                return self._token
+            return await self._fetch_access_token()
 
+    async def _fetch_access_token(self) -> str:
+        """POST /v1/oauth2/token and cache the token with its expiry."""
         headers = {
-            "Authorization": f"Basic {encoded_credentials}",
+            "Authorization": self._basic_auth_header,
             "Content-Type": "application/x-www-form-urlencoded",
         }
 
-        data = {"grant_type": "client_credentials"}
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, data=data, timeout=30.0)
-            response.raise_for_status()
+        response = await self._client.post(
+            "/v1/oauth2/token", headers=headers, content=_TOKEN_REQUEST_BODY
+        )
+        response.raise_for_status()
 
-            result = response.json()
-            return result["access_token"]
+        # One orjson pass over the small body; only access_token/expires_in are kept
+        result = orjson.loads(response.content)
+        self._token = result["access_token"]
+        self._token_expires_at = (
+            time.monotonic() + int(result.get("expires_in", 0)) - _TOKEN_EXPIRY_SKEW_SEC
+        )
+        return self._token
 
     async def create_order(
         self,
@@ -106,8 +168,6 @@ class PayPalClient:
             httpx.HTTPStatusError: If create order fails
         """
         access_token = await self.get_access_token()
-        url = f"{self.base_url}/v2/checkout/orders"
-
         # CHECKOUT_SITE_BASE_URL is locked to https://decisionproof.io.kr (DEC-V1-16)
         site_base = os.getenv("CHECKOUT_SITE_BASE_URL", "https://decisionproof.io.kr")
 
@@ -132,21 +192,19 @@ class PayPalClient:
                 }
             ],
             "application_context": {
-                "brand_name": "Decisionproof",
-                "landing_page": "NO_PREFERENCE",
-                "user_action": "PAY_NOW",
+                **_ORDER_APPLICATION_CONTEXT,
                 "return_url": return_url or f"{site_base}/payment-pending.html",
                 "cancel_url": cancel_url or f"{site_base}/payment-pending.html?cancelled=1",
             },
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url, headers=headers, json=order_request, timeout=30.0
-            )
-            response.raise_for_status()
+        response = await self._client.post(
+            "/v2/checkout/orders", headers=headers, content=orjson.dumps(order_request)
+        )
+        response.raise_for_status()
 
-            result = response.json()
+        result = orjson.loads(response.content)
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 "PayPal order created",
                 extra={
@@ -155,7 +213,7 @@ class PayPalClient:
                     "internal_order_id": internal_order_id,
                 },
             )
-            return result
+        return result
 
     async def capture_order(self, paypal_order_id: str, request_id: str) -> dict:
         """Capture payment for approved PayPal order.
@@ -172,19 +230,19 @@ class PayPalClient:
             httpx.HTTPStatusError: If capture fails
         """
         access_token = await self.get_access_token()
-        url = f"{self.base_url}/v2/checkout/orders/{paypal_order_id}/capture"
-
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {access_token}",
             "PayPal-Request-Id": request_id,  # Mandatory — DEC-V1-15
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json={}, timeout=30.0)
-            response.raise_for_status()
+        response = await self._client.post(
+            f"/v2/checkout/orders/{paypal_order_id}/capture", headers=headers, content=b"{}"
+        )
+        response.raise_for_status()
 
-            result = response.json()
+        result = orjson.loads(response.content)
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 "PayPal order captured",
                 extra={
@@ -193,7 +251,7 @@ class PayPalClient:
                     "status": result.get("status"),
                 },
             )
-            return result
+        return result
 
     async def show_order_details(self, paypal_order_id: str) -> dict:
         """Get order details from PayPal (for verification).
@@ -210,17 +268,16 @@ class PayPalClient:
             httpx.HTTPStatusError: If show order fails
         """
         access_token = await self.get_access_token()
-        url = f"{self.base_url}/v2/checkout/orders/{paypal_order_id}"
-
         headers = {
             "Authorization": f"Bearer {access_token}",
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            response.raise_for_status()
+        response = await self._client.get(
+            f"/v2/checkout/orders/{paypal_order_id}", headers=headers
+        )
+        response.raise_for_status()
 
-            return response.json()
+        return orjson.loads(response.content)
 
     async def verify_webhook_signature(
         self,
@@ -260,8 +317,6 @@ class PayPalClient:
             )
 
         access_token = await self.get_access_token()
-        url = f"{self.base_url}/v1/notifications/verify-webhook-signature"
-
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {access_token}",
@@ -277,13 +332,15 @@ class PayPalClient:
             "webhook_event": webhook_event,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url, headers=headers, json=verification_request, timeout=30.0
-            )
-            response.raise_for_status()
+        response = await self._client.post(
+            "/v1/notifications/verify-webhook-signature",
+            headers=headers,
+            content=orjson.dumps(verification_request),
+        )
+        response.raise_for_status()
 
-            result = response.json()
+        result = orjson.loads(response.content)
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 "PayPal webhook signature verified",
                 extra={
@@ -292,11 +349,13 @@ class PayPalClient:
                     "transmission_id": transmission_id,
                 },
             )
-            return result
+        return result
 
 
-# Global client instance (singleton)
+# Global client instance (singleton); the lock guards first construction
+# against threadpool (sync endpoint) callers racing the event loop
 _paypal_client: Optional[PayPalClient] = None
+_paypal_client_lock = threading.Lock()
 
 
 def get_paypal_client() -> PayPalClient:
@@ -307,5 +366,15 @@ def get_paypal_client() -> PayPalClient:
     """
     global _paypal_client
     if _paypal_client is None:
-        _paypal_client = PayPalClient()
+        with _paypal_client_lock:
+            if _paypal_client is None:
+                _paypal_client = PayPalClient()
     return _paypal_client
+
+
+async def close_paypal_client() -> None:
+    """Close the singleton's connection pool, if it was created (app shutdown)."""
+    global _paypal_client
+    if _paypal_client is not None:
+        await _paypal_client.aclose()
+        _paypal_client = None
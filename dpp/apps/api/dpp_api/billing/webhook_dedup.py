@@ -1,25 +1,32 @@
 """Webhook dedup gate: atomic INSERT ON CONFLICT for concurrent idempotency.
 
-P6.3: Replaces the SELECT-then-INSERT pattern with a two-step atomic operation that
+P6.3: Replaces the SELECT-then-INSERT pattern with an atomic claim that
 guarantees at most one successful processing per (provider, dedup_key) pair, even
 under concurrent webhook delivery from PayPal/Toss retry storms.
 
 Design (DEC-P02-6):
-  1. INSERT ON CONFLICT (provider, dedup_key) DO NOTHING RETURNING id
+  1. INSERT ON CONFLICT (provider, dedup_key_hash) DO NOTHING RETURNING id
        → row returned  : this request is the FIRST processor → continue
        → no row        : conflict exists → check if it's a re-processable failure
   2. If no row (conflict): UPDATE ... WHERE status='failed' RETURNING id
        → row returned  : previous attempt failed; re-claim for re-processing
        → no row        : status is 'done' or 'processing' (true duplicate) → 200 immediately
+  Steps 1 and 2 are chained CTEs in a single statement: one round-trip, one commit.
+  A SELECT ahead of step 1 short-circuits redeliveries of 'done' events with no write,
+  and each worker remembers those keys for a while so further redeliveries skip the DB.
+  Rows are matched on dedup_key_hash (16 bytes of SHA-256), so the unique index
+  stays fixed-width however long provider IDs get; dedup_key itself is unindexed.
 
 Thread/process safety: PostgreSQL UNIQUE constraint guarantees exactly one INSERT wins
-under concurrent load. The UPDATE in step 2 is also atomic (row-level lock).
+under concurrent load. The UPDATE in step 2 is also atomic (row-level lock), and
+both CTEs share one snapshot, so step 2 never sees a row inserted by step 1.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from datetime import datetime, timezone
+import time
 from typing import Optional
 
 from sqlalchemy import text
@@ -27,6 +34,129 @@ from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Per-worker cache of keys known to be 'done'.
+# Providers redeliver a finished event many times within minutes. Once this
+# worker has read status='done' for a key, later redeliveries are answered
+# from memory without touching Postgres. Only a committed 'done' read back
+# from the DB is cached, so a rolled-back success can never be masked.
+_DONE_CACHE_TTL_SEC = 600
+_DONE_CACHE_MAX_ENTRIES = 100_000
+
+_done_cache: dict[tuple[str, bytes], float] = {}
+
+
+def _done_cache_hit(key: tuple[str, bytes]) -> bool:
+    expires_at = _done_cache.get(key)
+    if expires_at is None:
+        return False
+    if time.monotonic() >= expires_at:
+        _done_cache.pop(key, None)
+        return False
+    return True
+
+
+def _done_cache_put(key: tuple[str, bytes]) -> None:
+    if len(_done_cache) >= _DONE_CACHE_MAX_ENTRIES:
+        # Drop the oldest insertion; dicts preserve insertion order.
+        _done_cache.pop(next(iter(_done_cache)), None)
+    _done_cache[key] = time.monotonic() + _DONE_CACHE_TTL_SEC
+
+
+def reset_dedup_cache() -> None:
+    """Drop the in-process 'done' cache (tests)."""
+    _done_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Statements (built once at import; text() parsing stays off the request path)
+#
+# Timestamps come from the server's clock_timestamp() rather than a bound
+# client-side datetime or SQL now(): now() is frozen at transaction start, and
+# mark_dedup_done/failed run late in a longer business transaction, so only
+# clock_timestamp() records when the write itself happened (and on the DB's
+# clock, not each worker's).
+# ---------------------------------------------------------------------------
+
+_STATUS_SQL = text(
+    """
+    SELECT status FROM webhook_dedup_events
+    WHERE provider = :provider AND dedup_key_hash = :dedup_key_hash
+    """
+)
+
+# ins claims a new row; upd reclaims a 'failed' one only when ins did not insert
+_ACQUIRE_SQL = text(
+    """
+    WITH ins AS (
+        INSERT INTO webhook_dedup_events
+            (provider, dedup_key, dedup_key_hash, first_seen_at, status, request_hash)
+        VALUES
+            (:provider, :dedup_key, :dedup_key_hash, clock_timestamp(), 'processing', :request_hash)
+        ON CONFLICT (provider, dedup_key_hash) DO NOTHING
+        RETURNING id, 'inserted' AS src
+    ), upd AS (
+        UPDATE webhook_dedup_events
+        SET status = 'processing', last_seen_at = clock_timestamp()
+        WHERE provider = :provider AND dedup_key_hash = :dedup_key_hash AND status = 'failed'
+          AND NOT EXISTS (SELECT 1 FROM ins)
+        RETURNING id, 'reclaimed' AS src
+    )
+    SELECT id, src FROM ins
+    UNION ALL
+    SELECT id, src FROM upd
+    """
+)
+
+# Batch form of _ACQUIRE_SQL: the keys arrive as parallel arrays and every
+# claimed row reports its dedup_key_hash. Callers pass distinct keys only
+# (a second copy of a key in one INSERT would just be skipped by ON CONFLICT).
+_ACQUIRE_BATCH_SQL = text(
+    """
+    WITH input AS (
+        SELECT *
+        FROM unnest(
+            CAST(:dedup_keys AS text[]),
+            CAST(:dedup_key_hashes AS bytea[]),
+            CAST(:request_hashes AS text[])
+        ) AS t(dedup_key, dedup_key_hash, request_hash)
+    ), ins AS (
+        INSERT INTO webhook_dedup_events
+            (provider, dedup_key, dedup_key_hash, first_seen_at, status, request_hash)
+        SELECT :provider, dedup_key, dedup_key_hash, clock_timestamp(), 'processing', request_hash
+        FROM input
+        ON CONFLICT (provider, dedup_key_hash) DO NOTHING
+        RETURNING dedup_key_hash
+    ), upd AS (
+        UPDATE webhook_dedup_events e
+        SET status = 'processing', last_seen_at = clock_timestamp()
+        FROM input i
+        WHERE e.provider = :provider AND e.dedup_key_hash = i.dedup_key_hash
+          AND e.status = 'failed'
+          AND NOT EXISTS (SELECT 1 FROM ins WHERE ins.dedup_key_hash = i.dedup_key_hash)
+        RETURNING e.dedup_key_hash
+    )
+    SELECT dedup_key_hash FROM ins
+    UNION ALL
+    SELECT dedup_key_hash FROM upd
+    """
+)
+
+_DONE_SQL = text(
+    """
+    UPDATE webhook_dedup_events
+    SET status = 'done', last_seen_at = clock_timestamp()
+    WHERE provider = :provider AND dedup_key_hash = :dedup_key_hash
+    """
+)
+
+_FAILED_SQL = text(
+    """
+    UPDATE webhook_dedup_events
+    SET status = 'failed', last_seen_at = clock_timestamp()
+    WHERE provider = :provider AND dedup_key_hash = :dedup_key_hash
+    """
+)
+
 
 # ---------------------------------------------------------------------------
 # Dedup key extraction (deterministic per provider)
@@ -88,6 +218,25 @@ def get_toss_dedup_key(payload: dict, headers: dict) -> str:
 # ---------------------------------------------------------------------------
 
 
+def dedup_key_hash(dedup_key: str) -> bytes:
+    """Fixed-width (16-byte) form of dedup_key used by the unique gate.
+
+    Must match the backfill in migrations/20260417_04_webhook_dedup_key_hash.sql:
+    substring(sha256(convert_to(dedup_key, 'UTF8')) FROM 1 FOR 16).
+    """
+    return hashlib.sha256(dedup_key.encode()).digest()[:16]
+
+
+def _log_key(level: int, event: str, provider: str, dedup_key: str, **extra: str) -> None:
+    """Log a per-key gate decision; the extra dict is only built if the level is on."""
+    if logger.isEnabledFor(level):
+        logger.log(
+            level,
+            event,
+            extra={"provider": provider, "dedup_key_prefix": dedup_key[:16], **extra},
+        )
+
+
 def try_acquire_dedup(
     db: Session,
     provider: str,
@@ -102,94 +251,128 @@ def try_acquire_dedup(
         False — A 'done' or concurrent 'processing' record already exists.
                 The caller is a duplicate → ACK with 200, zero side effects.
 
-    Step 1: INSERT ON CONFLICT DO NOTHING RETURNING id
-      - UNIQUE constraint on (provider, dedup_key) ensures exactly one wins.
-    Step 2: If conflict: UPDATE ... WHERE status='failed' RETURNING id
-      - Allows PG retry of genuinely failed events without manual intervention.
+    Both steps run as ONE statement (data-modifying CTEs), so a duplicate
+    costs a single round-trip:
+      ins: INSERT ON CONFLICT DO NOTHING RETURNING id
+        - UNIQUE index on (provider, dedup_key_hash) ensures exactly one wins.
+      upd: only if ins returned nothing, UPDATE ... WHERE status='failed' RETURNING id
+        - Allows PG retry of genuinely failed events without manual intervention.
+    The returned src column tells which branch claimed the row; no row = duplicate.
+
+    Fast path: retry storms are mostly redeliveries of events already 'done', so a
+    plain SELECT runs first and answers those with no write at all. Any other state
+    (miss, 'processing', 'failed') falls through to the atomic claim, which still
+    serializes concurrent first-writers — the SELECT is only an optimization.
+    Keys seen 'done' are then answered from a per-worker cache for
+    _DONE_CACHE_TTL_SEC without any DB round-trip.
     """
-    now = datetime.now(timezone.utc)
-
-    # Step 1: atomic insert
-    insert_sql = text("""
-        INSERT INTO webhook_dedup_events
-            (provider, dedup_key, first_seen_at, status, request_hash)
-        VALUES
-            (:provider, :dedup_key, :now, 'processing', :request_hash)
-        ON CONFLICT (provider, dedup_key) DO NOTHING
-        RETURNING id
-    """)
-    result = db.execute(insert_sql, {
+    key_hash = dedup_key_hash(dedup_key)
+    if _done_cache_hit((provider, key_hash)):
+        _log_key(logging.DEBUG, "WEBHOOK_DEDUP_DUPLICATE", provider, dedup_key, source="cache")
+        return False
+
+    status = db.execute(
+        _STATUS_SQL, {"provider": provider, "dedup_key_hash": key_hash}
+    ).scalar()
+    if status == "done":
+        # Read-only so far: end the transaction without a commit record
+        db.rollback()
+        _done_cache_put((provider, key_hash))
+        _log_key(logging.INFO, "WEBHOOK_DEDUP_DUPLICATE", provider, dedup_key)
+        return False
+
+    row = db.execute(_ACQUIRE_SQL, {
         "provider": provider,
         "dedup_key": dedup_key,
-        "now": now,
+        "dedup_key_hash": key_hash,
         "request_hash": request_hash,
-    })
-    row = result.fetchone()
+    }).fetchone()
+    db.commit()
 
-    if row is not None:
-        db.commit()
-        logger.debug(
-            "WEBHOOK_DEDUP_ACQUIRED",
-            extra={"provider": provider, "dedup_key_prefix": dedup_key[:16]},
-        )
-        return True
+    if row is None:
+        # True duplicate (status = 'done' or concurrent 'processing')
+        _log_key(logging.INFO, "WEBHOOK_DEDUP_DUPLICATE", provider, dedup_key)
+        return False
 
-    # Step 2: check if it's a re-processable failure
-    retry_sql = text("""
-        UPDATE webhook_dedup_events
-        SET status = 'processing', last_seen_at = :now
-        WHERE provider = :provider AND dedup_key = :dedup_key AND status = 'failed'
-        RETURNING id
-    """)
-    retry_result = db.execute(retry_sql, {
-        "provider": provider,
-        "dedup_key": dedup_key,
-        "now": now,
-    })
-    retry_row = retry_result.fetchone()
+    if row.src == "reclaimed":
+        _log_key(logging.INFO, "WEBHOOK_DEDUP_RETRY_RECLAIMED", provider, dedup_key)
+    else:
+        _log_key(logging.DEBUG, "WEBHOOK_DEDUP_ACQUIRED", provider, dedup_key)
+    return True
+
+
+def try_acquire_dedup_batch(
+    db: Session,
+    provider: str,
+    keys: list[tuple[str, Optional[str]]],
+) -> list[bool]:
+    """Claim processing rights for several events of one delivery at once.
+
+    Same outcome per key as try_acquire_dedup(), but every key is claimed (or
+    reclaimed from 'failed') by ONE statement and one commit instead of one
+    round-trip per event.
 
-    if retry_row is not None:
+    Args:
+        keys: (dedup_key, request_hash) per event, in payload order
+
+    Returns:
+        One bool per input key, in input order. A key repeated within the batch
+        is claimed at most once (its first occurrence).
+    """
+    if not keys:
+        return []
+
+    key_hashes = [dedup_key_hash(dedup_key) for dedup_key, _ in keys]
+
+    # First occurrence of each key not already known to be 'done'
+    pending: dict[bytes, tuple[str, Optional[str]]] = {}
+    for key_hash, (dedup_key, request_hash) in zip(key_hashes, keys, strict=True):
+        if key_hash not in pending and not _done_cache_hit((provider, key_hash)):
+            pending[key_hash] = (dedup_key, request_hash)
+
+    claimed: set[bytes] = set()
+    if pending:
+        rows = db.execute(_ACQUIRE_BATCH_SQL, {
+            "provider": provider,
+            "dedup_keys": [dedup_key for dedup_key, _ in pending.values()],
+            "dedup_key_hashes": list(pending),
+            "request_hashes": [request_hash for _, request_hash in pending.values()],
+        }).fetchall()
         db.commit()
+        claimed = {bytes(row.dedup_key_hash) for row in rows}
+
+    results: list[bool] = []
+    for key_hash in key_hashes:
+        acquired = key_hash in claimed
+        claimed.discard(key_hash)  # later copies of the same key are duplicates
+        results.append(acquired)
+
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
-            "WEBHOOK_DEDUP_RETRY_RECLAIMED",
-            extra={"provider": provider, "dedup_key_prefix": dedup_key[:16]},
+            "WEBHOOK_DEDUP_BATCH",
+            extra={"provider": provider, "events": len(keys), "acquired": sum(results)},
         )
-        return True
-
-    # True duplicate (status = 'done' or concurrent 'processing')
-    db.commit()
-    logger.info(
-        "WEBHOOK_DEDUP_DUPLICATE",
-        extra={"provider": provider, "dedup_key_prefix": dedup_key[:16]},
-    )
-    return False
+    return results
 
 
 def mark_dedup_done(db: Session, provider: str, dedup_key: str) -> None:
-    """Mark dedup record as 'done' after successful business processing."""
-    sql = text("""
-        UPDATE webhook_dedup_events
-        SET status = 'done', last_seen_at = :now
-        WHERE provider = :provider AND dedup_key = :dedup_key
-    """)
-    db.execute(sql, {
+    """Mark dedup record as 'done' after successful business processing.
+
+    Does NOT commit: the caller commits it together with its business writes,
+    so the success path costs one transaction instead of two.
+    """
+    db.execute(_DONE_SQL, {
         "provider": provider,
-        "dedup_key": dedup_key,
-        "now": datetime.now(timezone.utc),
+        "dedup_key_hash": dedup_key_hash(dedup_key),
     })
-    db.commit()
 
 
 def mark_dedup_failed(db: Session, provider: str, dedup_key: str) -> None:
-    """Mark dedup record as 'failed' on processing error (allows PG retry)."""
-    sql = text("""
-        UPDATE webhook_dedup_events
-        SET status = 'failed', last_seen_at = :now
-        WHERE provider = :provider AND dedup_key = :dedup_key
-    """)
-    db.execute(sql, {
+    """Mark dedup record as 'failed' on processing error (allows PG retry).
+
+    Does NOT commit; the caller must commit (after rolling back any business writes).
+    """
+    db.execute(_FAILED_SQL, {
         "provider": provider,
-        "dedup_key": dedup_key,
-        "now": datetime.now(timezone.utc),
+        "dedup_key_hash": dedup_key_hash(dedup_key),
     })
-    db.commit()
@@ -1,12 +1,28 @@
 """Environment variable resolution utilities.
 
 Ops Hardening: Canonical env names + fail-fast validation.
+
+Env vars are fixed once a process has started, so the plain getters are
+memoized (lru_cache) and the guardrail flags are read from one EnvConfig
+snapshot. Code that mutates os.environ afterwards (tests) must call
+reset_env_cache(). Getters that raise are not cached and re-check.
 """
 
 import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
+# One case-insensitive pass over the endpoint instead of lower() + a scan per marker
+_LOCALSTACK_RE = re.compile(r"localhost|127\.0\.0\.1|localstack|host\.docker\.internal", re.I)
+
+_PROD_ENV_NAMES = frozenset({"prod", "production"})
+_SSE_MODES_NONE = frozenset({"none", "off"})
+_SSE_MODES_KMS = frozenset({"aws:kms", "kms"})
 
+
+@lru_cache(maxsize=1)
 def get_s3_result_bucket() -> str:
     """Get S3 result bucket from environment.
 
@@ -28,6 +44,7 @@ def get_s3_result_bucket() -> str:
     return bucket
 
 
+@lru_cache(maxsize=1)
 def get_sqs_queue_url() -> str:
     """Get SQS queue URL from environment.
 
@@ -59,12 +76,45 @@ def is_localstack_endpoint(endpoint: Optional[str]) -> bool:
     Returns:
         True if endpoint appears to be LocalStack, False otherwise
     """
-    if endpoint is None:
-        return False
+    return endpoint is not None and _LOCALSTACK_RE.search(endpoint) is not None
+
 
-    endpoint_lower = endpoint.lower()
-    markers = ["localhost", "127.0.0.1", "localstack", "host.docker.internal"]
-    return any(marker in endpoint_lower for marker in markers)
+@dataclass(frozen=True, slots=True)
+class EnvConfig:
+    """Snapshot of the env vars behind the AWS/production guardrails.
+
+    Read once from os.environ with the derived flags precomputed, so a
+    guardrail check is attribute reads instead of a chain of getenv calls.
+    """
+
+    dpp_env: str
+    is_irsa: bool
+    is_production: bool
+    has_static_creds: bool
+    region: Optional[str]
+
+    @classmethod
+    def from_env(cls) -> "EnvConfig":
+        environ = os.environ
+        dpp_env = (environ.get("DPP_ENV") or environ.get("DP_ENV") or "local").lower()
+        is_irsa = bool(environ.get("AWS_ROLE_ARN") or environ.get("AWS_WEB_IDENTITY_TOKEN_FILE"))
+        return cls(
+            dpp_env=dpp_env,
+            is_irsa=is_irsa,
+            is_production=dpp_env in _PROD_ENV_NAMES or is_irsa,
+            has_static_creds=bool(
+                environ.get("AWS_ACCESS_KEY_ID")
+                or environ.get("AWS_SECRET_ACCESS_KEY")
+                or environ.get("AWS_SESSION_TOKEN")
+            ),
+            region=environ.get("AWS_REGION") or environ.get("AWS_DEFAULT_REGION"),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_env_config() -> EnvConfig:
+    """Get the process env snapshot (built on first use)."""
+    return EnvConfig.from_env()
 
 
 def is_irsa_environment() -> bool:
@@ -81,9 +131,7 @@ def is_irsa_environment() -> bool:
     Returns:
         True if IRSA markers detected (production EKS), False otherwise
     """
-    return bool(
-        os.getenv("AWS_ROLE_ARN") or os.getenv("AWS_WEB_IDENTITY_TOKEN_FILE")
-    )
+    return get_env_config().is_irsa
 
 
 def get_dpp_env() -> str:
@@ -97,11 +145,7 @@ def get_dpp_env() -> str:
     Returns:
         Environment name (lowercase)
     """
-    return (
-        os.getenv("DPP_ENV")
-        or os.getenv("DP_ENV")
-        or "local"
-    ).lower()
+    return get_env_config().dpp_env
 
 
 def is_production_env() -> bool:
@@ -114,8 +158,7 @@ def is_production_env() -> bool:
     Returns:
         True if production environment, False otherwise
     """
-    env = get_dpp_env()
-    return env in {"prod", "production"} or is_irsa_environment()
+    return get_env_config().is_production
 
 
 def has_static_aws_credentials() -> bool:
@@ -129,11 +172,7 @@ def has_static_aws_credentials() -> bool:
     Returns:
         True if any static credentials detected, False otherwise
     """
-    return bool(
-        os.getenv("AWS_ACCESS_KEY_ID")
-        or os.getenv("AWS_SECRET_ACCESS_KEY")
-        or os.getenv("AWS_SESSION_TOKEN")
-    )
+    return get_env_config().has_static_creds
 
 
 def get_aws_region(require_in_prod: bool = True) -> str:
@@ -152,7 +191,7 @@ def get_aws_region(require_in_prod: bool = True) -> str:
     Raises:
         ValueError: If region missing and required in production
     """
-    region = os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
+    region = get_env_config().region
 
     if not region and require_in_prod and is_production_env():
         raise ValueError(
@@ -163,6 +202,17 @@ def get_aws_region(require_in_prod: bool = True) -> str:
     return region or "us-east-1"  # Default fallback for local/dev
 
 
+def reset_env_cache() -> None:
+    """Drop memoized env lookups (tests that mutate os.environ)."""
+    for getter in (
+        get_s3_result_bucket,
+        get_sqs_queue_url,
+        get_env_config,
+        _s3_sse_kwargs,
+    ):
+        getter.cache_clear()
+
+
 def assert_no_static_aws_creds(service_name: str) -> None:
     """Assert no static AWS credentials in production (A1, A5).
 
@@ -228,6 +278,30 @@ def assert_no_custom_endpoint_in_prod(endpoint_url: Optional[str], service_name:
             )
 
 
+@lru_cache(maxsize=1)
+def _s3_sse_kwargs() -> dict[str, str]:
+    # Determine SSE mode
+    sse_mode = os.getenv("S3_SSE_MODE", "").lower()
+
+    # Default: production=AES256, non-production=none
+    if not sse_mode:
+        sse_mode = "aes256" if is_production_env() else "none"
+
+    # S2: Apply SSE mode
+    if sse_mode in _SSE_MODES_NONE:
+        return {}
+
+    if sse_mode in _SSE_MODES_KMS:
+        kwargs = {"ServerSideEncryption": "aws:kms"}
+        kms_key_id = os.getenv("S3_SSE_KMS_KEY_ID")
+        if kms_key_id:
+            kwargs["SSEKMSKeyId"] = kms_key_id
+        return kwargs
+
+    # Default: AES256
+    return {"ServerSideEncryption": "AES256"}
+
+
 def get_s3_server_side_encryption_kwargs(endpoint_url: Optional[str]) -> dict[str, str]:
     """Get S3 ServerSideEncryption kwargs for put_object (S1, S2, S3).
 
@@ -240,6 +314,9 @@ def get_s3_server_side_encryption_kwargs(endpoint_url: Optional[str]) -> dict[st
     - S3_SSE_MODE: "AES256" (default prod), "aws:kms"/"kms", "none"/"off"
     - S3_SSE_KMS_KEY_ID: KMS key ID (only if mode=kms)
 
+    The non-LocalStack result is memoized and shared between callers: unpack
+    it into put_object(**kwargs), never mutate it.
+
     Args:
         endpoint_url: S3 endpoint URL (for LocalStack detection)
 
@@ -250,23 +327,4 @@ def get_s3_server_side_encryption_kwargs(endpoint_url: Optional[str]) -> dict[st
     if is_localstack_endpoint(endpoint_url):
         return {}
 
-    # Determine SSE mode
-    sse_mode = os.getenv("S3_SSE_MODE", "").lower()
-
-    # Default: production=AES256, non-production=none
-    if not sse_mode:
-        sse_mode = "aes256" if is_production_env() else "none"
-
-    # S2: Apply SSE mode
-    if sse_mode in {"none", "off"}:
-        return {}
-
-    if sse_mode in {"aws:kms", "kms"}:
-        kwargs = {"ServerSideEncryption": "aws:kms"}
-        kms_key_id = os.getenv("S3_SSE_KMS_KEY_ID")
-        if kms_key_id:
-            kwargs["SSEKMSKeyId"] = kms_key_id
-        return kwargs
-
-    # Default: AES256
-    return {"ServerSideEncryption": "AES256"}
+    return _s3_sse_kwargs()
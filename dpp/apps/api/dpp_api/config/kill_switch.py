@@ -14,16 +14,21 @@ Modes:
 
 import logging
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-import yaml
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# dpp/config/kill_switch.yaml, resolved once
+_CONFIG_PATH = Path(__file__).resolve().parents[4] / "config" / "kill_switch.yaml"
+
+# Display timezone for admin responses (UTC+9, no DST)
+_KST = timezone(timedelta(hours=9))
+
 
 class KillSwitchMode(str, Enum):
     """Kill switch operational modes."""
@@ -76,40 +81,37 @@ class KillSwitchState(BaseModel):
     def to_kst_display(self) -> dict:
         """Convert timestamps to KST for display.
 
+        Built by hand rather than via model_dump(): admin polling hits this,
+        and the model is small enough to list its fields directly.
+
         Returns:
-            Dictionary with KST-formatted timestamps
+            Dictionary with KST-formatted timestamps (None fields omitted)
         """
-        from datetime import timedelta
-
-        kst_offset = timedelta(hours=9)
-
-        result = self.model_dump(exclude_none=True)
-
-        if self.set_at:
-            kst_time = self.set_at + kst_offset
-            result["set_at"] = kst_time.isoformat()
-
-        if self.expires_at:
-            kst_time = self.expires_at + kst_offset
-            result["expires_at"] = kst_time.isoformat()
-
+        result = {
+            "mode": self.mode.value,
+            "reason": self.reason,
+            "ttl_minutes": self.ttl_minutes,
+        }
+        if self.set_at is not None:
+            result["set_at"] = self.set_at.astimezone(_KST).isoformat()
+        if self.set_by_ip is not None:
+            result["set_by_ip"] = self.set_by_ip
+        if self.expires_at is not None:
+            result["expires_at"] = self.expires_at.astimezone(_KST).isoformat()
         return result
 
 
 class KillSwitchConfig:
     """Kill switch configuration manager.
 
-    Singleton pattern for global state management.
+    The process-wide instance is created once at import (_KILL_SWITCH below);
+    use get_kill_switch_config() rather than constructing new ones.
     """
 
-    _instance: Optional["KillSwitchConfig"] = None
     _state: KillSwitchState
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._state = cls._load_initial_state()
-        return cls._instance
+    def __init__(self) -> None:
+        self._state = self._load_initial_state()
 
     @classmethod
     def _load_initial_state(cls) -> KillSwitchState:
@@ -142,31 +144,34 @@ class KillSwitchConfig:
                     extra={"event": "kill_switch.invalid_env_mode", "mode": env_mode},
                 )
 
-        # Try loading from config file
-        config_path = Path(__file__).parent.parent.parent.parent.parent / "config" / "kill_switch.yaml"
+        # Try loading from config file. It is opened directly (no exists() stat
+        # first) and yaml is imported only here, so the env-override path above
+        # does no filesystem or parser work.
+        try:
+            import yaml
 
-        if config_path.exists():
-            try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config_data = yaml.safe_load(f)
+            with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
+                config_data = yaml.safe_load(f)
 
-                mode_str = config_data.get("mode", "NORMAL").upper()
-                mode = KillSwitchMode(mode_str)
+            mode_str = config_data.get("mode", "NORMAL").upper()
+            mode = KillSwitchMode(mode_str)
 
-                logger.info(
-                    f"Kill switch mode loaded from config: {mode.value}",
-                    extra={"event": "kill_switch.loaded_from_config", "mode": mode.value},
-                )
+            logger.info(
+                f"Kill switch mode loaded from config: {mode.value}",
+                extra={"event": "kill_switch.loaded_from_config", "mode": mode.value},
+            )
 
-                return KillSwitchState(
-                    mode=mode,
-                    reason=config_data.get("reason", "Loaded from config file"),
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to load kill_switch.yaml: {e}. Using default.",
-                    extra={"event": "kill_switch.config_load_error", "error": str(e)},
-                )
+            return KillSwitchState(
+                mode=mode,
+                reason=config_data.get("reason", "Loaded from config file"),
+            )
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(
+                f"Failed to load kill_switch.yaml: {e}. Using default.",
+                extra={"event": "kill_switch.config_load_error", "error": str(e)},
+            )
 
         # Default fallback
         logger.info(
@@ -201,6 +206,20 @@ class KillSwitchConfig:
 
         return self._state
 
+    def get_mode(self) -> KillSwitchMode:
+        """Get current kill switch mode (per-request hot path).
+
+        Reads the mode straight off the current state; only a state with a TTL
+        goes through get_state() for the expiry check and auto-restore.
+
+        Returns:
+            Current kill switch mode
+        """
+        state = self._state
+        if state.expires_at is None:
+            return state.mode
+        return self.get_state().mode
+
     def set_state(
         self,
         mode: KillSwitchMode,
@@ -237,8 +256,6 @@ class KillSwitchConfig:
         expires_at = None
 
         if ttl_minutes > 0:
-            from datetime import timedelta
-
             expires_at = now + timedelta(minutes=ttl_minutes)
 
         old_mode = self._state.mode
@@ -267,8 +284,8 @@ class KillSwitchConfig:
         return self._state
 
 
-# Global singleton instance
-_kill_switch_config: Optional[KillSwitchConfig] = None
+# Global instance, built at import: the middleware reads it on every request
+_KILL_SWITCH = KillSwitchConfig()
 
 
 def get_kill_switch_config() -> KillSwitchConfig:
@@ -277,10 +294,15 @@ def get_kill_switch_config() -> KillSwitchConfig:
     Returns:
         Kill switch configuration singleton
     """
-    global _kill_switch_config
-    if _kill_switch_config is None:
-        _kill_switch_config = KillSwitchConfig()
-    return _kill_switch_config
+    return _KILL_SWITCH
+
+
+def reset_kill_switch_config() -> None:
+    """Reload the initial state (env/config file) into the global instance (tests).
+
+    The instance itself is kept, so references held by callers stay valid.
+    """
+    _KILL_SWITCH._state = KillSwitchConfig._load_initial_state()
 
 
 def get_current_mode() -> KillSwitchMode:
@@ -289,4 +311,4 @@ def get_current_mode() -> KillSwitchMode:
     Returns:
         Current kill switch mode
     """
-    return get_kill_switch_config().get_state().mode
+    return _KILL_SWITCH.get_mode()
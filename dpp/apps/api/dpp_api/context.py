@@ -3,21 +3,76 @@
 P1-9: Context variables for request tracking across async boundaries.
 MS-6: Add run_id and tenant_id for complete observability.
 RC-6: Add plan_key and budget_decision for observability.
+
+All fields live in one immutable RequestCtx held by a single ContextVar, so
+the JSON log formatter enriches each line with one ContextVar.get() instead
+of one per field. The per-field *_var names remain as ContextVar-style views
+(get/set) over that snapshot.
 """
 
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, replace
+from typing import overload
+
+
+@dataclass(frozen=True, slots=True)
+class RequestCtx:
+    """Observability context for the current request/run."""
+
+    # Request ID - unique per HTTP request
+    request_id: str = ""
+    # MS-6: Run ID - current run being processed
+    run_id: str = ""
+    # MS-6: Tenant ID - current tenant context
+    tenant_id: str = ""
+    # RC-6: Plan key - format: "{plan_id}:{profile_version}"
+    plan_key: str = ""
+    # RC-6: Budget decision - "reserve.ok" or "reserve.deny"
+    budget_decision: str = ""
+
+
+# The shared default is safe: RequestCtx is frozen, and set_ctx() always
+# stores a replaced copy, so the default instance is never mutated.
+ctx_var: ContextVar[RequestCtx] = ContextVar(
+    "request_ctx", default=RequestCtx()  # noqa: B039
+)
+
+
+def get_ctx() -> RequestCtx:
+    """Get the current request context snapshot."""
+    return ctx_var.get()
+
+
+def set_ctx(**fields: str) -> Token[RequestCtx]:
+    """Replace the given fields in the current context (copy-on-write)."""
+    return ctx_var.set(replace(ctx_var.get(), **fields))
+
+
+class _CtxField:
+    """ContextVar-like view of one RequestCtx field."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
 
-# Request ID - unique per HTTP request
-request_id_var: ContextVar[str] = ContextVar("request_id", default="")
+    @overload
+    def get(self) -> str: ...
+    @overload
+    def get(self, default: str) -> str: ...
+    @overload
+    def get(self, default: None) -> str | None: ...
 
-# MS-6: Run ID - current run being processed
-run_id_var: ContextVar[str] = ContextVar("run_id", default="")
+    def get(self, default: str | None = "") -> str | None:
+        """Field value, or default while the field is unset (empty)."""
+        return getattr(ctx_var.get(), self.name) or default
 
-# MS-6: Tenant ID - current tenant context
-tenant_id_var: ContextVar[str] = ContextVar("tenant_id", default="")
+    def set(self, value: str) -> Token[RequestCtx]:
+        return set_ctx(**{self.name: value})
 
-# RC-6: Plan key - format: "{plan_id}:{profile_version}"
-plan_key_var: ContextVar[str] = ContextVar("plan_key", default="")
 
-# RC-6: Budget decision - "reserve.ok" or "reserve.deny"
-budget_decision_var: ContextVar[str] = ContextVar("budget_decision", default="")
+request_id_var = _CtxField("request_id")
+run_id_var = _CtxField("run_id")
+tenant_id_var = _CtxField("tenant_id")
+plan_key_var = _CtxField("plan_key")
+budget_decision_var = _CtxField("budget_decision")
@@ -1,14 +1,20 @@
 """Database engine builder (SSOT).
 
-Spec Lock: Supabase pooler + NullPool policy + Production guardrails.
-- Default: NullPool (client-side pooling disabled)
+Spec Lock: Supabase pooler + client pool policy + Production guardrails.
+- Default: small QueuePool (warm connections in front of the Supabase pooler)
 - Supabase PROD: sslmode=verify-full enforced + CA bundle required (DPP_DB_SSLROOTCERT)
 - Supabase non-PROD: sslmode=require (default when DPP_DB_SSLMODE unset)
 - PROD: Pooler Transaction mode (port 6543) enforced
 - PROD: ACK variables required for deployment safety
-- ENV: DPP_DB_POOL=nullpool|queuepool (default: nullpool)
+- ENV: DPP_DB_POOL=queuepool|nullpool (default: queuepool; nullpool for one-shot jobs)
+- ENV: DPP_DB_PRE_PING=1|0, DPP_DB_POOL_RECYCLE=<sec> (QueuePool only; default 1 / 1800)
 - ENV: DPP_DB_SSLMODE=require|verify-ca|verify-full (PROD+Supabase default: "verify-full")
 - ENV: DPP_DB_SSLROOTCERT=<path> (required for verify-ca/verify-full)
+- ENV: DPP_DB_DISABLE_PREPARED_STATEMENTS=1|0 (default: on for Supabase port 6543)
+- ENV: DPP_DB_DRIVER=psycopg|psycopg2 (default: psycopg; applies to bare postgresql:// URLs)
+- ENV: DPP_DB_STATEMENT_TIMEOUT_MS, DPP_DB_IDLE_IN_TX_TIMEOUT_MS (opt-in, unset by
+  default) — sent with jit=off in the startup packet (not via the transaction
+  pooler; set those per role there)
 
 SSL Policy (Spec Lock) — delegated to dpp_api.db.ssl_policy:
   DPP_DB_SSLMODE set   → ENV is authoritative (SSOT).
@@ -17,15 +23,31 @@ SSL Policy (Spec Lock) — delegated to dpp_api.db.ssl_policy:
   DPP_DB_SSLMODE unset → URL sslmode (if present) used (legacy compat).
                            Neither set → verify-full (PROD+Supabase) or require (else).
   PROD + Supabase host → sslmode MUST be verify-full; sslrootcert MUST be readable.
+
+Pooling vs Supabase Transaction mode (port 6543):
+  The client pool keeps TCP+TLS sessions to the pooler warm; the pooler still
+  hands each transaction whatever backend is free. Nothing may rely on
+  session-level state surviving a COMMIT: no SET (use SET LOCAL), no
+  session advisory locks, no LISTEN/NOTIFY, no server-side prepared
+  statements (psycopg2 creates none; psycopg 3 is told not to).
+
+Driver:
+  A bare postgresql:// URL resolves to psycopg2 on SQLAlchemy 2.0 and to
+  psycopg (3) on 2.1. build_engine pins it to postgresql+psycopg:// (native
+  SQLAlchemy 2.0 dialect; libpq pipeline mode available) unless DPP_DB_DRIVER
+  names another driver. URLs that already carry "+driver" are left alone.
+
+SQLAlchemy is imported inside the functions that need it, so importing this
+module (e.g. for EngineConfig or the guardrails) does not load it.
 """
 
-import os
-import re
-from typing import Any
-from urllib.parse import urlparse
+from __future__ import annotations
 
-from sqlalchemy import Engine, NullPool, QueuePool, create_engine
-from sqlalchemy.orm import Session, sessionmaker
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from dpp_api.db.ssl_policy import (
     effective_sslmode,
@@ -33,23 +55,208 @@ from dpp_api.db.ssl_policy import (
     resolve_ssl_settings,
     validate_ssl_settings,
 )
-from dpp_api.db.url_policy import is_supabase_host
+from dpp_api.db.url_policy import is_supabase_hostname
+
+if TYPE_CHECKING:
+    from sqlalchemy import URL, Engine
+    from sqlalchemy.orm import Session, sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Env vars read by ssl_policy itself (shared with alembic, so not in EngineConfig).
+# Their values join the engine cache key alongside the EngineConfig.
+_SSL_ENV_VARS = ("DPP_DB_SSLMODE", "DPP_DB_SSLROOTCERT", "DATABASE_SSL_ROOT_CERT")
+
+# QueuePool tuning: recycle connections every 30 min (DPP_DB_POOL_RECYCLE); fail a
+# checkout after 10s instead of queueing requests indefinitely when exhausted.
+_POOL_RECYCLE_SEC = 1800
+_POOL_TIMEOUT_SEC = 10
+
+# Driver pinned onto bare postgresql:// URLs (DPP_DB_DRIVER overrides).
+_DEFAULT_DB_DRIVER = "psycopg"
+
+
+def _optional_int(value: str | None) -> int | None:
+    """int(value), or None when unset/blank."""
+    return int(value) if value and value.strip() else None
+
+
+@dataclass(frozen=True, slots=True)
+class EngineConfig:
+    """
+    Env-driven engine policy, read from os.environ in one pass.
+
+    Hashable, so build_engine() can key its cache on it; tests may pass one
+    built directly instead of patching os.environ. SSL settings are not here:
+    ssl_policy resolves those from the environment itself.
+    """
+
+    dp_env: str = ""
+    pool_mode: str = "queuepool"
+    pool_size: int = 15
+    max_overflow: int = 10
+    pool_recycle: int = _POOL_RECYCLE_SEC
+    # QueuePool only: NullPool connections are fresh, a ping would be wasted
+    pre_ping: bool = True
+    application_name: str = "decisionproof-api"
+    driver: str = _DEFAULT_DB_DRIVER
+    # Startup timeouts; None = not sent (server/role default). Opt-in per
+    # deployment: worker, reaper and migrations hold long statements/transactions.
+    statement_timeout_ms: int | None = None
+    idle_in_transaction_timeout_ms: int | None = None
+    # None = auto (on for Supabase port 6543)
+    disable_prepared_statements: bool | None = None
+    log_debug: bool = False
+    # Production guardrail toggles / ACKs
+    allow_non_6543: bool = False
+    allow_direct: bool = False
+    has_supabase_api_keys: bool = False
+    allow_supabase_api_keys: bool = False
+    ack_bypass: bool = False
+    ack_network_restrictions: bool = False
+    ack_backup_policy: bool = False
+
+    @classmethod
+    def from_env(cls) -> EngineConfig:
+        environ = os.environ
+        toggle = environ.get("DPP_DB_DISABLE_PREPARED_STATEMENTS")
+        return cls(
+            dp_env=environ.get("DP_ENV", "").lower(),
+            # Unset or empty → default
+            pool_mode=(environ.get("DPP_DB_POOL") or "queuepool").lower(),
+            pool_size=int(environ.get("DPP_DB_POOL_SIZE", "15")),
+            max_overflow=int(environ.get("DPP_DB_MAX_OVERFLOW", "10")),
+            pool_recycle=int(environ.get("DPP_DB_POOL_RECYCLE", str(_POOL_RECYCLE_SEC))),
+            pre_ping=environ.get("DPP_DB_PRE_PING", "1") != "0",
+            application_name=environ.get("DPP_DB_APPLICATION_NAME", "decisionproof-api"),
+            driver=(environ.get("DPP_DB_DRIVER") or _DEFAULT_DB_DRIVER).lower(),
+            statement_timeout_ms=_optional_int(environ.get("DPP_DB_STATEMENT_TIMEOUT_MS")),
+            idle_in_transaction_timeout_ms=_optional_int(
+                environ.get("DPP_DB_IDLE_IN_TX_TIMEOUT_MS")
+            ),
+            disable_prepared_statements=(toggle == "1") if toggle else None,
+            log_debug=environ.get("LOG_LEVEL") == "DEBUG",
+            allow_non_6543=environ.get("DPP_SUPABASE_ALLOW_NON_6543") == "1",
+            allow_direct=environ.get("DPP_SUPABASE_ALLOW_DIRECT") == "1",
+            has_supabase_api_keys=bool(
+                environ.get("SUPABASE_SERVICE_ROLE_KEY") or environ.get("SUPABASE_ANON_KEY")
+            ),
+            allow_supabase_api_keys=environ.get("DPP_ALLOW_SUPABASE_API_KEYS") == "1",
+            ack_bypass=environ.get("DPP_ACK_BYPASS") == "1",
+            ack_network_restrictions=environ.get("DPP_ACK_SUPABASE_NETWORK_RESTRICTIONS") == "1",
+            ack_backup_policy=environ.get("DPP_ACK_SUPABASE_BACKUP_POLICY") == "1",
+        )
+
+
+@lru_cache(maxsize=8)
+def _parse_db_url(url: str) -> URL:
+    """Parse a DB URL once per build; URL is an immutable NamedTuple, safe to share.
+
+    SQLAlchemy's parser also accepts passwords urlparse rejects (e.g. '[...]').
+    """
+    from sqlalchemy import make_url
+
+    return make_url(url)
+
 
+def _as_url(url: str | URL) -> URL:
+    """URL object for url; already-parsed URLs pass straight through."""
+    return _parse_db_url(url) if isinstance(url, str) else url
 
-def _is_supabase_host(url: str) -> bool:
-    """Check if URL points to Supabase host. Delegates to url_policy.is_supabase_host."""
-    return is_supabase_host(url)
 
+def _with_driver(url: str, driver: str) -> str:
+    """Pin a bare postgresql:// URL to postgresql+<driver>://; other URLs unchanged."""
+    if driver and url.startswith("postgresql://"):
+        return f"postgresql+{driver}://{url[len('postgresql://'):]}"
+    return url
 
-def _mask_password(url: str) -> str:
-    """Mask password in database URL for safe logging."""
-    return re.sub(r"://([^:]+):([^@]+)@", r"://\1:***@", url)
 
+def _is_supabase_host(url: str | URL) -> bool:
+    """Check if URL points to Supabase host, matching the parsed hostname's suffix."""
+    return is_supabase_hostname(_as_url(url).host)
 
-def _validate_supabase_production_config(url: str, dp_env: str) -> None:
+
+def _prepared_statement_connect_args(
+    url: str | URL, config: EngineConfig | None = None
+) -> dict[str, Any]:
+    """
+    connect_args that stop the driver from creating server-side prepared statements.
+
+    A transaction-mode pooler (Supabase port 6543) may run each transaction on a
+    different backend, so a statement prepared on one is missing (or already
+    exists) on the next. psycopg2 never prepares server-side and needs nothing;
+    psycopg 3 auto-prepares after 5 executions, and build_engine pins it for
+    a bare postgresql:// URL (see _with_driver).
+
+    Environment toggle:
+        DPP_DB_DISABLE_PREPARED_STATEMENTS: "1" force on, "0" force off.
+        Unset: on for Supabase hosts on port 6543.
+    """
+    cfg = config or EngineConfig.from_env()
+    parsed = _as_url(url)
+    disable = cfg.disable_prepared_statements
+    if disable is None:
+        disable = _is_supabase_host(parsed) and parsed.port == 6543
+    if not disable:
+        return {}
+
+    if parsed.get_driver_name() == "psycopg":
+        return {"prepare_threshold": None}
+    return {}
+
+
+def _server_settings_connect_args(
+    url: str | URL, config: EngineConfig | None = None
+) -> dict[str, Any]:
+    """
+    connect_args that set jit=off (and any configured timeouts) at startup.
+
+    The settings ride in the startup packet, so a fresh connection needs no
+    extra SET round-trip, and JIT compilation never kicks in for the small
+    OLTP queries this service issues. statement_timeout and
+    idle_in_transaction_session_timeout are only sent when configured
+    (DPP_DB_STATEMENT_TIMEOUT_MS / DPP_DB_IDLE_IN_TX_TIMEOUT_MS): the worker
+    keeps a transaction open across a run's execution timebox and migrations
+    run long statements, so no engine user gets them by default.
+
+    Not applied behind the Supabase transaction pooler (port 6543): the pooler
+    does not forward startup options to the backends it multiplexes onto.
+    Configure those per role instead (ALTER ROLE ... SET statement_timeout).
+    """
+    cfg = config or EngineConfig.from_env()
+    parsed = _as_url(url)
+    if _is_supabase_host(parsed) and parsed.port == 6543:
+        return {}
+
+    settings = {"jit": "off"}
+    if cfg.statement_timeout_ms is not None:
+        settings["statement_timeout"] = str(cfg.statement_timeout_ms)
+    if cfg.idle_in_transaction_timeout_ms is not None:
+        settings["idle_in_transaction_session_timeout"] = str(cfg.idle_in_transaction_timeout_ms)
+    if parsed.get_driver_name() == "asyncpg":
+        return {"server_settings": settings}
+    # libpq drivers (psycopg / psycopg2)
+    return {"options": " ".join(f"-c {name}={value}" for name, value in settings.items())}
+
+
+def _mask_password(url: str | URL) -> str:
+    """Mask password in database URL for safe logging.
+
+    Structured (userinfo is parsed, not pattern-matched), so passwords holding
+    percent-encoded '@' or ':' are masked whole.
+    """
+    return _as_url(url).render_as_string(hide_password=True)
+
+
+def _validate_supabase_production_config(
+    url: str | URL, dp_env: str, config: EngineConfig | None = None
+) -> None:
     """
     Validate Supabase production configuration (P0 guardrails).
 
+    url may be a string or an already-parsed URL (build_engine passes the one
+    it parsed up front).
+
     Raises:
         RuntimeError: If production requirements not met.
 
@@ -64,16 +271,18 @@ def _validate_supabase_production_config(url: str, dp_env: str) -> None:
     if dp_env not in {"prod", "production"}:
         return  # Guardrails only apply to production
 
-    if not _is_supabase_host(url):
+    parsed = _as_url(url)
+    if not _is_supabase_host(parsed):
         return  # Not Supabase, skip validation
 
-    # Parse URL
-    parsed = urlparse(url)
+    cfg = config or EngineConfig.from_env()
 
     # P0-1: SSL Mode enforcement (PROD + Supabase requires verify-full).
     # Spec Lock: effective_sslmode() applies ENV-SSOT precedence (DPP_DB_SSLMODE over URL).
     #   May raise RuntimeError if ENV and URL conflict in PROD.
-    eff_mode = effective_sslmode(url, dp_env)
+    # ssl_policy is string-based (shared with alembic).
+    raw_url = url if isinstance(url, str) else url.render_as_string(hide_password=False)
+    eff_mode = effective_sslmode(raw_url, dp_env)
     if eff_mode != "verify-full":
         raise RuntimeError(
             f"PRODUCTION GUARDRAIL: Supabase DB connection requires sslmode=verify-full "
@@ -95,9 +304,7 @@ def _validate_supabase_production_config(url: str, dp_env: str) -> None:
         )
 
     if port != 6543:
-        if os.getenv("DPP_SUPABASE_ALLOW_NON_6543") == "1":
-            import logging
-            logger = logging.getLogger(__name__)
+        if cfg.allow_non_6543:
             logger.warning(
                 "PRODUCTION WARNING: Using non-6543 port (%d) with DPP_SUPABASE_ALLOW_NON_6543=1. "
                 "Recommended: Pooler Transaction mode port 6543.",
@@ -112,11 +319,9 @@ def _validate_supabase_production_config(url: str, dp_env: str) -> None:
             )
 
     # P0-1: Pooler host enforcement
-    hostname = parsed.hostname or ""
+    hostname = parsed.host or ""
     if "pooler" not in hostname.lower():
-        if os.getenv("DPP_SUPABASE_ALLOW_DIRECT") == "1":
-            import logging
-            logger = logging.getLogger(__name__)
+        if cfg.allow_direct:
             logger.warning(
                 "PRODUCTION WARNING: Using direct connection (non-pooler) with DPP_SUPABASE_ALLOW_DIRECT=1. "
                 "Recommended: Pooler Transaction mode for production runtime."
@@ -130,8 +335,8 @@ def _validate_supabase_production_config(url: str, dp_env: str) -> None:
             )
 
     # P0-3: API Keys hygiene
-    if os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_ANON_KEY"):
-        if os.getenv("DPP_ALLOW_SUPABASE_API_KEYS") != "1":
+    if cfg.has_supabase_api_keys:
+        if not cfg.allow_supabase_api_keys:
             raise RuntimeError(
                 "PRODUCTION GUARDRAIL: SUPABASE_SERVICE_ROLE_KEY or SUPABASE_ANON_KEY detected in environment. "
                 "This project uses direct Postgres connections only (server-side). "
@@ -141,9 +346,7 @@ def _validate_supabase_production_config(url: str, dp_env: str) -> None:
             )
 
     # P0-2, P0-4: ACK checks (manual configuration verification)
-    if os.getenv("DPP_ACK_BYPASS") == "1":
-        import logging
-        logger = logging.getLogger(__name__)
+    if cfg.ack_bypass:
         logger.warning(
             "PRODUCTION WARNING: ACK checks bypassed with DPP_ACK_BYPASS=1. "
             "This should NEVER be used in production deployments."
@@ -151,7 +354,7 @@ def _validate_supabase_production_config(url: str, dp_env: str) -> None:
         return
 
     # P0-2: Network Restrictions ACK
-    if os.getenv("DPP_ACK_SUPABASE_NETWORK_RESTRICTIONS") != "1":
+    if not cfg.ack_network_restrictions:
         raise RuntimeError(
             "PRODUCTION GUARDRAIL: DPP_ACK_SUPABASE_NETWORK_RESTRICTIONS=1 required. "
             "This confirms Supabase Network Restrictions (IP allowlist) configured in dashboard. "
@@ -160,7 +363,7 @@ def _validate_supabase_production_config(url: str, dp_env: str) -> None:
         )
 
     # P0-4: Backup Policy ACK
-    if os.getenv("DPP_ACK_SUPABASE_BACKUP_POLICY") != "1":
+    if not cfg.ack_backup_policy:
         raise RuntimeError(
             "PRODUCTION GUARDRAIL: DPP_ACK_SUPABASE_BACKUP_POLICY=1 required. "
             "This confirms backup/restore procedures tested and scheduled. "
@@ -169,18 +372,21 @@ def _validate_supabase_production_config(url: str, dp_env: str) -> None:
         )
 
 
-def build_engine(database_url: str | None = None) -> Engine:
+def build_engine(
+    database_url: str | None = None, config: EngineConfig | None = None
+) -> Engine:
     """
     Build SQLAlchemy engine with Supabase SSOT policy.
 
     Spec Lock (Hard Locks):
-    1. Default pool: NullPool (poolclass=NullPool)
-    2. pool_pre_ping=True (always verify connections)
+    1. Default pool: QueuePool (pool_size=15, max_overflow=10, recycle 30 min)
+    2. pool_pre_ping: QueuePool only (DPP_DB_PRE_PING, default on); never on NullPool
     3. Supabase host → sslmode=require enforced (connect_args)
     4. No QueuePool params (pool_size/max_overflow) when using NullPool
 
     Args:
         database_url: Database URL. If None, reads from env DATABASE_URL.
+        config: Engine policy. If None, EngineConfig.from_env().
 
     Returns:
         SQLAlchemy Engine instance.
@@ -190,15 +396,23 @@ def build_engine(database_url: str | None = None) -> Engine:
 
     Environment Variables:
         DATABASE_URL: Runtime connection string (required if not passed as arg)
-        DPP_DB_POOL: Pool mode - "nullpool" (default) | "queuepool"
-        DPP_DB_POOL_SIZE: QueuePool size (default: 5, only for queuepool)
+        DPP_DB_POOL: Pool mode - "queuepool" (default) | "nullpool"
+        DPP_DB_POOL_SIZE: QueuePool size (default: 15, only for queuepool)
         DPP_DB_MAX_OVERFLOW: QueuePool overflow (default: 10, only for queuepool)
+        DPP_DB_POOL_RECYCLE: QueuePool recycle seconds (default: 1800)
+        DPP_DB_PRE_PING: "0" skips the checkout ping (default: "1", only for queuepool)
+        DPP_DB_DRIVER: Driver for bare postgresql:// URLs (default: psycopg)
+
+    Repeat calls with the same URL, an equal EngineConfig and the same SSL env
+    (_SSL_ENV_VARS) return the same Engine (and pool) instead of building a
+    duplicate. Since the engine is shared, dispose() resets the pool for
+    every holder (the engine itself stays usable).
 
     Examples:
-        >>> # Default NullPool
+        >>> # Default QueuePool
         >>> engine = build_engine()
-        >>> # QueuePool (internal dev only)
-        >>> os.environ["DPP_DB_POOL"] = "queuepool"
+        >>> # NullPool (migrations / one-shot jobs)
+        >>> os.environ["DPP_DB_POOL"] = "nullpool"
         >>> engine = build_engine()
     """
     # Determine URL
@@ -209,43 +423,67 @@ def build_engine(database_url: str | None = None) -> Engine:
             "Pass as argument or set DATABASE_URL environment variable."
         )
 
+    cfg = config or EngineConfig.from_env()
+    ssl_env = tuple(os.getenv(name) for name in _SSL_ENV_VARS)
+    return _build_engine_cached(_with_driver(url, cfg.driver), cfg, ssl_env)
+
+
+@lru_cache(maxsize=4)
+def _build_engine_cached(
+    url: str, cfg: EngineConfig, ssl_env: tuple[str | None, ...]
+) -> Engine:
+    """Build the engine for url; ssl_env only keys the cache (see build_engine)."""
+    from sqlalchemy import NullPool, QueuePool, create_engine
+
+    # Parse once; the helpers below take the URL object instead of re-parsing.
+    parsed = _parse_db_url(url)
+
     # Production guardrails (P0-1, P0-2, P0-3, P0-4)
-    dp_env = os.getenv("DP_ENV", "").lower()
-    _validate_supabase_production_config(url, dp_env)
+    dp_env = cfg.dp_env
+    _validate_supabase_production_config(parsed, dp_env, cfg)
 
     # Supabase SSL enforcement via connect_args (SSOT: ssl_policy.resolve_ssl_settings).
     # Handles sslmode + sslrootcert from ENV, applies PROD defaults (verify-full),
     # and fails fast if the CA bundle is missing for CA-required modes.
     # Non-Supabase hosts return {} (no enforcement from this layer).
     connect_args: dict[str, Any] = {}
-    if _is_supabase_host(url):
+    if _is_supabase_host(parsed):
         connect_args = resolve_ssl_settings(url, dp_env)
 
     # Application name (P0-1: connection tagging for observability)
-    app_name = os.getenv("DPP_DB_APPLICATION_NAME", "decisionproof-api")
+    app_name = cfg.application_name
     if app_name:
         connect_args["application_name"] = app_name
 
+    # Transaction-mode pooler: no server-side prepared statements
+    connect_args.update(_prepared_statement_connect_args(parsed, cfg))
+
+    # jit=off (+ opt-in statement/idle-in-transaction timeouts) in the startup packet
+    connect_args.update(_server_settings_connect_args(parsed, cfg))
+
     # Pool mode selection
-    pool_mode = os.getenv("DPP_DB_POOL", "nullpool").lower()
+    pool_mode = cfg.pool_mode
 
-    if pool_mode == "nullpool":
-        # Spec Lock: NullPool (default, recommended for Supabase pooler transaction mode)
+    if pool_mode == "queuepool":
+        # Default: reuse warm connections so requests skip the TCP+TLS+startup
+        # round-trip to the pooler. Recycle before the pooler's idle timeout.
         engine = create_engine(
-            url,
-            poolclass=NullPool,
-            pool_pre_ping=True,
+            parsed,
+            poolclass=QueuePool,
+            pool_pre_ping=cfg.pre_ping,
+            pool_size=cfg.pool_size,
+            max_overflow=cfg.max_overflow,
+            pool_recycle=cfg.pool_recycle,
+            pool_timeout=_POOL_TIMEOUT_SEC,
             connect_args=connect_args,
         )
-    elif pool_mode == "queuepool":
-        # QueuePool (internal dev/special cases only)
-        pool_size = int(os.getenv("DPP_DB_POOL_SIZE", "5"))
-        max_overflow = int(os.getenv("DPP_DB_MAX_OVERFLOW", "10"))
+    elif pool_mode == "nullpool":
+        # NullPool: connect per checkout (migrations, one-shot ops jobs).
+        # No pre-ping: every checkout is a brand-new connection.
         engine = create_engine(
-            url,
-            pool_pre_ping=True,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
+            parsed,
+            poolclass=NullPool,
+            pool_pre_ping=False,
             connect_args=connect_args,
         )
     else:
@@ -258,22 +496,24 @@ def build_engine(database_url: str | None = None) -> Engine:
     pool_class_name = engine.pool.__class__.__name__
     # DO NOT log full URL with password
     # Only log masked version for diagnostics
-    if os.getenv("LOG_LEVEL") == "DEBUG":
-        import logging
-
-        logger = logging.getLogger(__name__)
+    if cfg.log_debug:
         logger.debug(
             "Database engine created: pool=%s, url=%s",
             pool_class_name,
-            _mask_password(url),
+            _mask_password(parsed),
         )
 
     return engine
 
 
+@lru_cache(maxsize=4)
 def build_sessionmaker(engine: Engine) -> sessionmaker[Session]:
     """
-    Build SQLAlchemy sessionmaker.
+    Build SQLAlchemy sessionmaker (one per engine).
+
+    Memoized on the engine (hashed by identity; engines are long-lived and
+    build_engine already shares them), so repeated calls return the same
+    sessionmaker instead of deriving a fresh Session subclass each time.
 
     Args:
         engine: SQLAlchemy Engine instance.
@@ -287,4 +527,6 @@ def build_sessionmaker(engine: Engine) -> sessionmaker[Session]:
         >>> with SessionLocal() as session:
         ...     # use session
     """
+    from sqlalchemy.orm import sessionmaker
+
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
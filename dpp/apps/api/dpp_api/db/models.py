@@ -3,7 +3,20 @@
 from datetime import date, datetime, timezone
 from typing import Optional
 
-from sqlalchemy import ARRAY, BIGINT, DATE, FLOAT, JSON, TEXT, TIMESTAMP, UUID, Index, UniqueConstraint
+from sqlalchemy import (
+    ARRAY,
+    BIGINT,
+    DATE,
+    FLOAT,
+    JSON,
+    TEXT,
+    TIMESTAMP,
+    UUID,
+    Index,
+    LargeBinary,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 # ---------------------------------------------------------------------------
@@ -146,8 +159,15 @@ class Run(Base):
         Index("idx_runs_tenant_created", "tenant_id", "created_at"),
         Index("idx_runs_status_lease", "status", "lease_expires_at"),
         # P0-B: Prevent duplicate idempotency_key per tenant (INT-01, DEC-4201)
-        # Note: UniqueConstraint already creates an index, so idx_runs_idem is redundant
-        UniqueConstraint("tenant_id", "idempotency_key", name="uq_runs_tenant_idempotency"),
+        # Note: this unique index makes idx_runs_idem redundant. Partial: runs without
+        # an idempotency_key are not indexed (see migration 3c1e7a9d5f20).
+        Index(
+            "uq_runs_tenant_idempotency",
+            "tenant_id",
+            "idempotency_key",
+            unique=True,
+            postgresql_where=text("idempotency_key IS NOT NULL"),
+        ),
     )
 
 
@@ -387,7 +407,7 @@ class WebhookDedupEvent(Base):
     Guarantees at most one business-processing per (provider, dedup_key) pair
     even under concurrent delivery (PayPal/Toss retry storms).
 
-    Atomic gate: INSERT ON CONFLICT (provider, dedup_key) DO NOTHING RETURNING id
+    Atomic gate: INSERT ON CONFLICT (provider, dedup_key_hash) DO NOTHING RETURNING id
       → row returned  : first/re-processing handler → continue
       → no row        : duplicate/concurrent → 200 immediately (zero side effects)
     """
@@ -398,6 +418,8 @@ class WebhookDedupEvent(Base):
 
     provider: Mapped[str] = mapped_column(TEXT, nullable=False)     # paypal | toss
     dedup_key: Mapped[str] = mapped_column(TEXT, nullable=False)    # ev_<event_id> | tx_<tid> | pkey_<key>
+    # sha256(dedup_key)[:16]: fixed-width key for the unique gate (dedup_key is not indexed)
+    dedup_key_hash: Mapped[bytes] = mapped_column(LargeBinary(16), nullable=False)
 
     first_seen_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
@@ -415,8 +437,17 @@ class WebhookDedupEvent(Base):
     request_hash: Mapped[Optional[str]] = mapped_column(TEXT, nullable=True)
 
     __table_args__ = (
-        UniqueConstraint("provider", "dedup_key", name="uq_webhook_dedup_events"),
-        Index("idx_webhook_dedup_provider_key", "provider", "dedup_key"),
+        # The atomic gate (migrations/20260417_04_webhook_dedup_key_hash.sql)
+        Index(
+            "uq_webhook_dedup_events_key_hash", "provider", "dedup_key_hash", unique=True
+        ),
+        # Reclaim-'failed' probe (migrations/20260417_05_webhook_dedup_failed_partial_index.sql)
+        Index(
+            "idx_webhook_dedup_failed",
+            "provider",
+            "dedup_key_hash",
+            postgresql_where=text("status = 'failed'"),
+        ),
         Index("idx_webhook_dedup_status", "status"),
         Index("idx_webhook_dedup_first_seen", "first_seen_at"),
     )
@@ -556,7 +587,15 @@ class APIToken(Base):
 
     __table_args__ = (
         Index("idx_api_tokens_tenant_status", "tenant_id", "status"),
-        Index("idx_api_tokens_token_hash", "token_hash"),
+        # Live-token lookup for token auth (index-only on the SELECT branch)
+        # (migrations/20260417_02_api_tokens_live_hash_index.sql)
+        Index(
+            "ix_api_tokens_live_hash",
+            "token_hash",
+            unique=True,
+            postgresql_include=["id", "tenant_id", "scopes", "expires_at", "status"],
+            postgresql_where=text("status IN ('active', 'rotating') AND revoked_at IS NULL"),
+        ),
         Index("idx_api_tokens_expires_at", "expires_at"),
     )
 
@@ -630,7 +669,9 @@ class AuthRequestLog(Base):
 
     __table_args__ = (
         Index("idx_auth_request_log_token_id", "token_id"),
-        Index("idx_auth_request_log_created_at", "created_at"),
+        # Append-only time series: BRIN instead of btree. The table itself is
+        # UNLOGGED in Postgres (migrations/20260417_03_auth_request_log_unlogged_brin.sql)
+        Index("ix_auth_request_log_created_brin", "created_at", postgresql_using="brin"),
         Index("idx_auth_request_log_status_code", "status_code"),
     )
 
@@ -672,6 +713,16 @@ class UserTenant(Base):
         Index("idx_user_tenants_user_id", "user_id"),
         Index("idx_user_tenants_tenant_id", "tenant_id"),
         Index("idx_user_tenants_user_status", "user_id", "status"),
+        # Covering partial index for session-auth primary tenant resolution
+        # (migrations/20260417_01_user_tenants_active_lookup_index.sql)
+        Index(
+            "ix_user_tenants_active_lookup",
+            "user_id",
+            text("role DESC"),
+            "created_at",
+            postgresql_include=["tenant_id"],
+            postgresql_where=text("status = 'active'"),
+        ),
     )
 
 
@@ -10,6 +10,7 @@ SSL Mode Precedence (Spec Lock):
   If URL has no sslmode AND host is Supabase -> inject default_mode via ensure_sslmode().
 """
 
+import re
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
@@ -19,6 +20,18 @@ SAFE_SSL_MODES: frozenset = frozenset({"require", "verify-ca", "verify-full"})
 # SSL modes that are explicitly unsafe (no encryption or degraded).
 UNSAFE_SSL_MODES: frozenset = frozenset({"disable", "allow", "prefer"})
 
+# Hostname suffixes of Supabase-managed Postgres endpoints.
+SUPABASE_HOST_SUFFIXES: tuple = (".supabase.co", ".pooler.supabase.com")
+
+# scheme://[userinfo@]host — userinfo runs to the last '@' before the path, so a
+# password containing ':' or '[...]' never leaks into the host group.
+_URL_HOST_RE = re.compile(r"^[^:/?#]+://(?:[^/?#]*@)?(\[[^\]]*\]|[^:/?#]*)")
+
+
+def is_supabase_hostname(host: Optional[str]) -> bool:
+    """Return True if a bare hostname is a Supabase endpoint (case-insensitive)."""
+    return bool(host) and host.lower().endswith(SUPABASE_HOST_SUFFIXES)
+
 
 def is_supabase_host(url: str) -> bool:
     """Return True if the URL points to a Supabase-managed host.
@@ -27,13 +40,17 @@ def is_supabase_host(url: str) -> bool:
       - *.supabase.co             (direct / session pooler)
       - *.pooler.supabase.com     (transaction pooler / PgBouncer, port 6543)
 
+    Only the hostname is checked, so a password, path or query string that
+    happens to contain "supabase.co" does not count.
+
     Args:
         url: Database connection URL string.
 
     Returns:
         True if the host is a known Supabase endpoint.
     """
-    return ".supabase.co" in url or ".pooler.supabase.com" in url
+    match = _URL_HOST_RE.match(url)
+    return match is not None and is_supabase_hostname(match.group(1))
 
 
 def get_sslmode_from_url(url: str) -> Optional[str]:
@@ -14,15 +14,24 @@ from fastapi.responses import JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from dpp_api.audit.sinks import AuditSinkConfigError, validate_audit_required_config
+from dpp_api.audit.sinks import (
+    AuditSinkConfigError,
+    audit_required,
+    audit_strict,
+    validate_audit_required_config,
+)
 from dpp_api.audit.kill_switch_audit import validate_kill_switch_audit_fingerprint_config
+from dpp_api.auth.audit_queue import start_auth_log_writer, stop_auth_log_writer
 from dpp_api.billing.active_preflight import run_billing_secrets_active_preflight
+from dpp_api.billing.paypal import close_paypal_client, get_paypal_client
+from dpp_api.billing.toss import close_toss_client, get_toss_client
 from dpp_api.context import budget_decision_var, plan_key_var, request_id_var, run_id_var
 from dpp_api.enforce import PlanViolationError
 from dpp_api.utils.sanitize import sanitize_str
 from dpp_api.rate_limiter import NoOpRateLimiter, RateLimiter
 from dpp_api.routers import admin, auth, billing, demo_runs, health, internal, onboarding, runs, tokens, usage, webhooks
 from dpp_api.schemas import ProblemDetail
+from dpp_api.supabase_client import close_supabase_http_client, warm_supabase_http_client
 from dpp_api.utils import configure_json_logging
 
 # MTS-3.1 / MT0A-1: Base URL from environment variables.
@@ -1080,9 +1089,7 @@ async def startup_event():
         raise
 
     # P6.1: Boot-time fingerprint (kid/pepper) validation — Fail-closed
-    _ks_required = os.getenv("KILL_SWITCH_AUDIT_REQUIRED", "0").strip() == "1"
-    _ks_strict = os.getenv("KILL_SWITCH_AUDIT_STRICT", "0").strip() == "1"
-    if _ks_required or _ks_strict:
+    if audit_required() or audit_strict():
         try:
             validate_kill_switch_audit_fingerprint_config()
         except (RuntimeError, Exception) as fp_exc:
@@ -1100,6 +1107,29 @@ async def startup_event():
     if _billing_pf_flag == "1":
         await run_billing_secrets_active_preflight()
 
+    # P0-3: Batched auth_request_log writer (off the request path)
+    start_auth_log_writer()
+
+    # Session auth: open the pooled Supabase connection before the first request
+    await warm_supabase_http_client()
+
+    # Billing: build the provider clients before the first request. A provider
+    # without credentials is skipped; its accessor raises on first use as before.
+    for get_billing_client in (get_paypal_client, get_toss_client):
+        try:
+            get_billing_client()
+        except ValueError:
+            pass
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush queued auth_request_log rows and close pooled clients before exit."""
+    await stop_auth_log_writer()
+    await close_supabase_http_client()
+    await close_paypal_client()
+    await close_toss_client()
+
 
 # ============================================================================
 # MTS-3: Static File Serving (llms.txt, docs)
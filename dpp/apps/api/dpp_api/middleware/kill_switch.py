@@ -54,10 +54,8 @@ class KillSwitchMiddleware(BaseHTTPMiddleware):
         Returns:
             HTTP response (either 503 blocked or normal response)
         """
-        # Get current kill switch mode
-        config = get_kill_switch_config()
-        state = config.get_state()
-        mode = state.mode
+        # Get current kill switch mode (reason/timestamps are not needed here)
+        mode = get_kill_switch_config().get_mode()
 
         # NORMAL mode: allow all
         if mode == KillSwitchMode.NORMAL:
@@ -10,13 +10,20 @@ WARNING: These endpoints are for authorized operators only.
 import logging
 import os
 import secrets
+from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Header, Request, status
 from pydantic import BaseModel, Field
 
 from dpp_api.audit.kill_switch_audit import build_kill_switch_audit_record
-from dpp_api.audit.sinks import AuditSink, AuditSinkConfigError, get_default_audit_sink
+from dpp_api.audit.sinks import (
+    AuditSink,
+    AuditSinkConfigError,
+    audit_strict,
+    get_default_audit_sink,
+    serialize_audit_record,
+)
 from dpp_api.config.kill_switch import (
     KillSwitchMode,
     KillSwitchState,
@@ -243,6 +250,8 @@ async def set_kill_switch(
     config = get_kill_switch_config()
     old_state = config.get_state()
     request_id = request_id_var.get()
+    # One clock read shared by the audit record timestamp and the WORM retention base
+    now = datetime.now(timezone.utc)
 
     # Step 4: Build WORM audit record (before any state change)
     # P5.9: build_kill_switch_audit_record() calls fingerprint_token() which may raise
@@ -258,6 +267,7 @@ async def set_kill_switch(
             reason=request_body.reason,
             ttl_minutes=request_body.ttl_minutes,
             result="ok",
+            now=now,
         )
     except RuntimeError as fp_exc:
         # Extract deterministic error code (first token before ":") for structured logging
@@ -276,7 +286,7 @@ async def set_kill_switch(
         ) from fp_exc
 
     # Step 5: Write WORM audit record BEFORE state change (P5.3 fail-closed)
-    strict_mode = os.getenv("KILL_SWITCH_AUDIT_STRICT", "0").strip() == "1"
+    strict_mode = audit_strict()
     audit_write_ok: Optional[bool] = None
 
     # P5.6: Obtain sink — AuditSinkConfigError means REQUIRED=1 but no bucket (hard config error)
@@ -296,9 +306,11 @@ async def set_kill_switch(
         ) from cfg_exc
 
     audit_key = f"kill-switch/{audit_record['timestamp']}-{request_id or 'noid'}.json"
+    # Serialize once; the sink writes these bytes as-is
+    audit_body = serialize_audit_record(audit_record)
 
     try:
-        sink.put_record(audit_key, audit_record)
+        sink.put_record(audit_key, audit_body, now=now)
         audit_write_ok = True
     except Exception as sink_exc:
         if strict_mode:
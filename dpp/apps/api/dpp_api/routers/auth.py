@@ -27,6 +27,7 @@ from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
+from dpp_api.auth.session_auth import invalidate_user_tenant_cache
 from dpp_api.context import request_id_var
 from dpp_api.db.models import Tenant, UserTenant
 from dpp_api.db.session import get_db
@@ -184,6 +185,7 @@ async def provision_tenant(
         )
         db.add(user_tenant)
         db.commit()
+        invalidate_user_tenant_cache(user_id)
 
         logger.info(
             "auth.provision.tenant_created",
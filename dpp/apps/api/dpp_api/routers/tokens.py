@@ -24,6 +24,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from dpp_api.auth.session_auth import SessionAuthContext, get_session_auth_context, require_admin_role
+from dpp_api.auth.token_auth import invalidate_token_cache
 from dpp_api.auth.token_lifecycle import generate_token, hash_token
 from dpp_api.context import request_id_var
 from dpp_api.db.models import APIToken, Tenant, TokenEvent
@@ -286,6 +287,7 @@ async def revoke_token(
     db.add(token_event)
 
     db.commit()
+    invalidate_token_cache(token.token_hash)
 
     logger.warning(
         "Token revoked",
@@ -420,6 +422,7 @@ async def rotate_token(
     db.add(token_event)
 
     db.commit()
+    invalidate_token_cache(old_token.token_hash)
     db.refresh(new_token)
 
     logger.info(
@@ -504,6 +507,7 @@ async def revoke_all_tokens(
     db.add(token_event)
 
     db.commit()
+    invalidate_token_cache(*(token.token_hash for token in tokens))
 
     logger.warning(
         "All tokens revoked (panic button)",
@@ -16,6 +16,7 @@ P5.7: Webhook error taxonomy (retry storm prevention)
   500 is ONLY for (D)(E)(F). Signature mismatch is NEVER 500.
 """
 
+import asyncio
 import hashlib
 import hmac
 import json as _json
@@ -315,8 +316,12 @@ async def paypal_webhook(
 
     db: Session = next(get_db())
     try:
-        # Atomic INSERT ON CONFLICT DO NOTHING — exactly 1 succeeds under concurrency
-        is_first = try_acquire_dedup(db, "paypal", dedup_key, payload_hash)
+        # Atomic INSERT ON CONFLICT DO NOTHING — exactly 1 succeeds under concurrency.
+        # Runs in a worker thread so duplicate storms don't block the event loop
+        # on Postgres round-trips (the session is only used by this request).
+        is_first = await asyncio.to_thread(
+            try_acquire_dedup, db, "paypal", dedup_key, payload_hash
+        )
         if not is_first:
             # Duplicate or concurrent duplicate — ACK immediately, zero side effects
             logger.info(
@@ -340,14 +345,16 @@ async def paypal_webhook(
         await _process_paypal_event(db, billing_event, webhook_body)
 
         billing_event.processed_at = db.query(BillingEvent).filter_by(id=billing_event.id).first().received_at
-        db.commit()
+        # Dedup 'done' rides the same commit as processed_at: one WAL flush
         mark_dedup_done(db, "paypal", dedup_key)
+        db.commit()
 
         return {"status": "processed"}
 
     except Exception as exc:
         db.rollback()
         mark_dedup_failed(db, "paypal", dedup_key)
+        db.commit()
         return _webhook_problem(
             request, 500,
             code="WEBHOOK_INTERNAL_ERROR",
@@ -635,7 +642,10 @@ async def tosspayments_webhook(
     db: Session = next(get_db())
     try:
         # Atomic INSERT ON CONFLICT DO NOTHING — skip Toss API call for duplicates
-        is_first = try_acquire_dedup(db, "toss", dedup_key, payload_hash)
+        # (off the event loop, as in the PayPal handler)
+        is_first = await asyncio.to_thread(
+            try_acquire_dedup, db, "toss", dedup_key, payload_hash
+        )
         if not is_first:
             logger.info(
                 "WEBHOOK_ALREADY_PROCESSED",
@@ -649,6 +659,7 @@ async def tosspayments_webhook(
             toss_client = get_toss_client()
         except ValueError:
             mark_dedup_failed(db, "toss", dedup_key)
+            db.commit()
             return _webhook_problem(
                 request, 500,
                 code="WEBHOOK_PROVIDER_MISCONFIG",
@@ -663,6 +674,7 @@ async def tosspayments_webhook(
             payment_details = await toss_client.get_payment(payment_key)
         except httpx.RequestError:
             mark_dedup_failed(db, "toss", dedup_key)
+            db.commit()
             return _webhook_problem(
                 request, 500,
                 code="WEBHOOK_VERIFY_UPSTREAM_FAILED",
@@ -675,6 +687,7 @@ async def tosspayments_webhook(
             upstream_status = upstream_exc.response.status_code
             if upstream_status == 404:
                 mark_dedup_failed(db, "toss", dedup_key)
+                db.commit()
                 return _webhook_problem(
                     request, 400,
                     code="WEBHOOK_INVALID_PAYMENT_KEY",
@@ -685,6 +698,7 @@ async def tosspayments_webhook(
                 )
             if upstream_status == 401:
                 mark_dedup_failed(db, "toss", dedup_key)
+                db.commit()
                 return _webhook_problem(
                     request, 500,
                     code="WEBHOOK_PROVIDER_MISCONFIG",
@@ -694,6 +708,7 @@ async def tosspayments_webhook(
                     payload_hash=payload_hash,
                 )
             mark_dedup_failed(db, "toss", dedup_key)
+            db.commit()
             return _webhook_problem(
                 request, 500,
                 code="WEBHOOK_VERIFY_UPSTREAM_FAILED",
@@ -718,14 +733,16 @@ async def tosspayments_webhook(
         await _process_toss_event(db, billing_event, payment_details)
 
         billing_event.processed_at = db.query(BillingEvent).filter_by(id=billing_event.id).first().received_at
-        db.commit()
+        # Dedup 'done' rides the same commit as processed_at: one WAL flush
         mark_dedup_done(db, "toss", dedup_key)
+        db.commit()
 
         return {"status": "processed"}
 
     except Exception as exc:
         db.rollback()
         mark_dedup_failed(db, "toss", dedup_key)
+        db.commit()
         return _webhook_problem(
             request, 500,
             code="WEBHOOK_INTERNAL_ERROR",
@@ -18,6 +18,7 @@ import logging
 import os
 from functools import lru_cache
 
+import httpx
 from supabase import Client, create_client
 
 logger = logging.getLogger(__name__)
@@ -206,3 +207,47 @@ def get_supabase_admin_client() -> Client:
     )
 
     return create_client(url, secret_key)
+
+
+# Keep-alive pool for direct Supabase REST calls on hot paths (session auth).
+# One client per process over HTTP/2: a single TLS handshake per connection is
+# amortized over the process lifetime and concurrent calls multiplex as streams.
+_HTTP_TIMEOUT = httpx.Timeout(5.0, connect=3.0)
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=100, keepalive_expiry=3600
+)
+
+
+@lru_cache(maxsize=1)
+def get_supabase_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client for Supabase REST calls.
+
+    Returns:
+        httpx.AsyncClient: Process-wide HTTP/2 client with keep-alive connection pool
+    """
+    return httpx.AsyncClient(http2=True, timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+
+
+async def warm_supabase_http_client() -> None:
+    """Open the pooled connection at startup (TCP + TLS + HTTP/2 negotiation).
+
+    Best-effort: skipped when SUPABASE_URL is not configured, and a failed
+    probe only logs a warning -- the first request will connect instead.
+    """
+    if not os.getenv("SUPABASE_URL"):
+        return
+
+    try:
+        await get_supabase_http_client().head(f"{get_supabase_url()}/auth/v1/health")
+    except httpx.HTTPError as e:
+        logger.warning(
+            f"Supabase HTTP client warm-up failed: {e}",
+            extra={"event": "startup.supabase_warmup_failed"},
+        )
+
+
+async def close_supabase_http_client() -> None:
+    """Close the shared HTTP client, if it was created (app shutdown)."""
+    if get_supabase_http_client.cache_info().currsize:
+        await get_supabase_http_client().aclose()
+        get_supabase_http_client.cache_clear()
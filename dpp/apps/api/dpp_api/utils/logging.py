@@ -11,13 +11,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Any
 
-from dpp_api.context import (
-    budget_decision_var,
-    plan_key_var,
-    request_id_var,
-    run_id_var,
-    tenant_id_var,
-)
+from dpp_api.context import get_ctx
 from dpp_api.utils.sanitize import sanitize_exc, sanitize_obj, sanitize_str
 
 
@@ -52,46 +46,20 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # P1-9: Add request_id from context variable
-        try:
-            request_id = request_id_var.get()
-            if request_id:
-                log_data["request_id"] = request_id
-        except LookupError:
-            # Context variable not set (non-request context like worker/reaper)
-            pass
-
-        # MS-6: Add run_id from context variable (CRITICAL for debugging)
-        try:
-            run_id = run_id_var.get()
-            if run_id:
-                log_data["run_id"] = run_id
-        except LookupError:
-            pass
-
-        # MS-6: Add tenant_id from context variable (CRITICAL for debugging)
-        try:
-            tenant_id = tenant_id_var.get()
-            if tenant_id:
-                log_data["tenant_id"] = tenant_id
-        except LookupError:
-            pass
-
-        # RC-6: Add plan_key from context variable
-        try:
-            plan_key = plan_key_var.get()
-            if plan_key:
-                log_data["plan_key"] = plan_key
-        except LookupError:
-            pass
-
-        # RC-6: Add budget_decision from context variable
-        try:
-            budget_decision = budget_decision_var.get()
-            if budget_decision:
-                log_data["budget_decision"] = budget_decision
-        except LookupError:
-            pass
+        # P1-9 / MS-6 / RC-6: request context, read with a single ContextVar.get().
+        # Unset fields are empty strings (non-request contexts like worker/reaper).
+        ctx = get_ctx()
+        if ctx.request_id:
+            log_data["request_id"] = ctx.request_id
+        # MS-6: run_id and tenant_id are CRITICAL for debugging
+        if ctx.run_id:
+            log_data["run_id"] = ctx.run_id
+        if ctx.tenant_id:
+            log_data["tenant_id"] = ctx.tenant_id
+        if ctx.plan_key:
+            log_data["plan_key"] = ctx.plan_key
+        if ctx.budget_decision:
+            log_data["budget_decision"] = ctx.budget_decision
 
         # P1-9 + RC-7: Add trace_id and span_id
         # Priority: OTel injected IDs > explicit extra kwargs
@@ -74,6 +74,45 @@ def setup_test_env_vars():
             os.environ[key] = original_value
 
 
+@pytest.fixture(autouse=True)
+def reset_env_derived_caches():
+    """
+    Drop module-level caches derived from env vars so each test sees its own env.
+
+    Tests mutate os.environ freely; without this, a value cached by an earlier
+    test would leak into later ones. In-process auth and webhook-dedup caches
+    are dropped too so one test's mocked rows never answer another's lookup.
+    """
+    from dpp_api.audit.kill_switch_audit import reset_fingerprint_cache
+    from dpp_api.audit.sinks import reset_sink_cache
+    from dpp_api.auth.session_auth import reset_session_auth_cache
+    from dpp_api.auth.token_auth import reset_token_auth_cache
+    from dpp_api.auth.token_lifecycle import get_pepper, reset_log_hash_cache
+    from dpp_api.billing.active_preflight import reset_preflight_env_cache
+    from dpp_api.billing.webhook_dedup import reset_dedup_cache
+    from dpp_api.config.env import reset_env_cache
+
+    reset_env_cache()
+    reset_fingerprint_cache()
+    reset_sink_cache()
+    reset_preflight_env_cache()
+    reset_dedup_cache()
+    reset_session_auth_cache()
+    reset_token_auth_cache()
+    get_pepper.cache_clear()
+    reset_log_hash_cache()
+    yield
+    reset_env_cache()
+    reset_fingerprint_cache()
+    reset_sink_cache()
+    reset_preflight_env_cache()
+    reset_dedup_cache()
+    reset_session_auth_cache()
+    reset_token_auth_cache()
+    get_pepper.cache_clear()
+    reset_log_hash_cache()
+
+
 @pytest.fixture(scope="function")
 def db_session() -> Session:
     """
@@ -83,7 +122,7 @@ def db_session() -> Session:
     """
     # Create engine (using SSOT builder for PostgreSQL, StaticPool for SQLite)
     if "postgresql" in TEST_DATABASE_URL:
-        # PostgreSQL: use SSOT engine builder (respects NullPool policy)
+        # PostgreSQL: use SSOT engine builder (respects DPP_DB_POOL policy)
         engine = build_engine(TEST_DATABASE_URL)
     else:
         # SQLite: use in-memory with special settings (StaticPool required for :memory:)
@@ -122,6 +161,8 @@ def db_session() -> Session:
         # Only drop tables for SQLite (PostgreSQL tables persist)
         if "sqlite" in TEST_DATABASE_URL:
             Base.metadata.drop_all(engine)
+        # Close pooled connections between tests (build_engine shares the engine)
+        engine.dispose()
 
 
 @pytest.fixture(scope="function")
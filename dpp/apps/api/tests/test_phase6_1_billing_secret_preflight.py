@@ -11,6 +11,7 @@ All tests use monkeypatching — no real paypal.com / tosspayments.com calls.
 
 from __future__ import annotations
 
+import json
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -26,8 +27,10 @@ def _mock_response(status_code: int, json_body: dict | None = None) -> MagicMock
     resp.status_code = status_code
     if json_body is not None:
         resp.json.return_value = json_body
+        resp.content = json.dumps(json_body).encode()
     else:
         resp.json.side_effect = ValueError("no body")
+        resp.content = b""
     return resp
 
 
@@ -6,6 +6,7 @@ Test matrix:
   C – sanitize_str performance: 50 000-char string < 1 s, returns [TRUNCATED:...]
   D – STRICT=1 + FailingAuditSink → HTTP 500, state unchanged, no raw token in logs
   E – STRICT=0 + FailingAuditSink → HTTP 200, audit_write_ok=false
+  F – FileAuditSink appends one JSON line per record to a per-day audit-YYYYMMDD.jsonl
 """
 
 import json
@@ -278,3 +279,21 @@ class TestRC10LogMaskingAndWormAudit:
         body = response.json()
         assert body.get("audit_write_ok") is False, \
             f"Expected audit_write_ok=false, got: {body.get('audit_write_ok')}"
+
+    # ── Test F ──────────────────────────────────────────────────────────────────
+
+    def test_f_file_sink_appends_jsonl(self, tmp_path) -> None:
+        """F: FileAuditSink writes one {"key", "record"} JSON line per record to a daily log."""
+        from dpp_api.audit.sinks import FileAuditSink, serialize_audit_record
+
+        with FileAuditSink(directory=str(tmp_path)) as sink:
+            sink.put_record("kill-switch/one.json", {"result": "ok", "n": 1})
+            sink.put_record("kill-switch/two.json", serialize_audit_record({"result": "failed"}))
+
+        files = list(tmp_path.glob("audit-*.jsonl"))
+        assert len(files) == 1, f"Expected one daily JSONL log, got {files}"
+        lines = files[0].read_bytes().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"key": "kill-switch/one.json", "record": {"result": "ok", "n": 1}},
+            {"key": "kill-switch/two.json", "record": {"result": "failed"}},
+        ]
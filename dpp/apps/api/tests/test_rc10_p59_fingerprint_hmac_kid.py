@@ -1,17 +1,21 @@
-"""RC-10.P5.9 Contract Gate: Kill-switch audit fingerprint HMAC(pepper) + Key-ID prefix.
+"""RC-10.P5.9 Contract Gate: Kill-switch audit fingerprint keyed-hash(pepper) + Key-ID prefix.
 
 Ensures the kill-switch audit sink stores actor_token fingerprint as:
   "<KID>:<TRUNC_HEX>"
-where TRUNC_HEX is a truncated HMAC-SHA256 digest with a secret pepper.
+where TRUNC_HEX is a 6-byte keyed BLAKE2b digest with a secret pepper
+(originally HMAC-SHA256[:12]; the algorithm is recorded in actor.token_fingerprint_algo).
 This enables safe key rotation without breaking historical record verification.
 
 Test matrix:
   T1 – fingerprint_token() format is exactly <kid>:<12 lowercase hex chars>
-  T2 – HMAC is deterministic (same inputs → same output) and pepper-sensitive
+  T2 – Keyed hash is deterministic (same inputs → same output) and pepper-sensitive
   T3 – Missing pepper with REQUIRED=1 or STRICT=1 → RuntimeError(FINGERPRINT_PEPPER_NOT_SET)
        Kill-switch state unchanged — fail-closed semantics preserved.
   T3b – STRICT=1 path also fails with same deterministic error code.
   T4 – Audit record JSON contains NO raw token string; fingerprint field is present and safe.
+  T5 – kid/pepper are cached after first use; reset_fingerprint_cache() forces an env re-read.
+  T6 – Malformed kid values → RuntimeError(INVALID_FINGERPRINT_KID).
+  T7 – fingerprint_token_batch() matches per-token fingerprint_token() element-wise.
 
 Facts (documented in DEC-P05-FINGERPRINT-HMAC.md):
   - HMAC pepper must never be logged or committed to repo; inject at runtime.
@@ -21,7 +25,6 @@ Facts (documented in DEC-P05-FINGERPRINT-HMAC.md):
 """
 
 import hashlib
-import hmac
 import json
 import os
 import re
@@ -32,6 +35,8 @@ import pytest
 from dpp_api.audit.kill_switch_audit import (
     build_kill_switch_audit_record,
     fingerprint_token,
+    fingerprint_token_batch,
+    reset_fingerprint_cache,
 )
 
 # ── Constants ─────────────────────────────────────────────────────────────────
@@ -106,7 +111,7 @@ class TestRC10P59FingerprintHmacKid:
         Pepper sensitivity is required for the HMAC to be meaningful — if the
         fingerprint were pepper-invariant, the secret key would provide no security.
 
-        The expected values are computed via Python stdlib hmac (independent verification).
+        The expected values are computed via Python stdlib hashlib (independent verification).
         """
         token = "tok_live_SAME_TOKEN_FOR_DETERMINISM"
         pepper_a = "pepper_alpha_2026"
@@ -115,26 +120,27 @@ class TestRC10P59FingerprintHmacKid:
 
         os.environ["KILL_SWITCH_AUDIT_FINGERPRINT_KID"] = kid
 
-        # Compute expected HMAC values independently (spec-level cross-check)
-        expected_a = hmac.new(
-            pepper_a.encode("utf-8"),
+        # Compute expected keyed-hash values independently (spec-level cross-check)
+        expected_a = hashlib.blake2b(
             token.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()[:_TRUNC_LEN]
+            key=pepper_a.encode("utf-8"),
+            digest_size=_TRUNC_LEN // 2,
+        ).hexdigest()
 
-        expected_b = hmac.new(
-            pepper_b.encode("utf-8"),
+        expected_b = hashlib.blake2b(
             token.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()[:_TRUNC_LEN]
+            key=pepper_b.encode("utf-8"),
+            digest_size=_TRUNC_LEN // 2,
+        ).hexdigest()
 
         # Run with pepper_a (twice — must be identical)
         os.environ["KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER"] = pepper_a
         result_a1 = fingerprint_token(token)
         result_a2 = fingerprint_token(token)  # second call must be identical
 
-        # Run with pepper_b
+        # Run with pepper_b (kid/pepper are cached — drop the cache after the env change)
         os.environ["KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER"] = pepper_b
+        reset_fingerprint_cache()
         result_b = fingerprint_token(token)
 
         # Determinism: two calls with same pepper → same result
@@ -143,9 +149,9 @@ class TestRC10P59FingerprintHmacKid:
             f"Call 1: {result_a1!r}, Call 2: {result_a2!r}"
         )
 
-        # Exact match with independently computed HMAC
+        # Exact match with independently computed keyed hash
         assert result_a1 == f"{kid}:{expected_a}", (
-            f"Expected {kid}:{expected_a!r} (HMAC-SHA256 with pepper_a), "
+            f"Expected {kid}:{expected_a!r} (keyed BLAKE2b with pepper_a), "
             f"got {result_a1!r}"
         )
 
@@ -159,7 +165,7 @@ class TestRC10P59FingerprintHmacKid:
 
         # Verify pepper_b result is also correct
         assert result_b == f"{kid}:{expected_b}", (
-            f"Expected {kid}:{expected_b!r} (HMAC-SHA256 with pepper_b), "
+            f"Expected {kid}:{expected_b!r} (keyed BLAKE2b with pepper_b), "
             f"got {result_b!r}"
         )
 
@@ -268,12 +274,70 @@ class TestRC10P59FingerprintHmacKid:
             "actor.token_fingerprint must not equal the raw token string"
         )
 
-        # Verify HMAC is correct (independent computation)
-        expected_hex = hmac.new(
-            pepper.encode("utf-8"),
+        # Verify keyed hash is correct (independent computation)
+        expected_hex = hashlib.blake2b(
             raw_token.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()[:_TRUNC_LEN]
+            key=pepper.encode("utf-8"),
+            digest_size=_TRUNC_LEN // 2,
+        ).hexdigest()
         assert token_fp == f"{kid}:{expected_hex}", (
             f"Fingerprint value is wrong. Expected {kid}:{expected_hex!r}, got {token_fp!r}"
         )
+        assert actor.get("token_fingerprint_algo") == "blake2b", (
+            "actor.token_fingerprint_algo must name the keyed hash used for the fingerprint"
+        )
+
+    # ── T5: Config cache ──────────────────────────────────────────────────────
+
+    def test_t5_fingerprint_config_cached_until_reset(self) -> None:
+        """T5: kid/pepper are read from env once; reset_fingerprint_cache() re-reads.
+
+        fingerprint_token() must not re-parse env vars on every call, but a
+        reset (boot validation or test helper) must pick up rotated values.
+        """
+        os.environ["KILL_SWITCH_AUDIT_FINGERPRINT_KID"] = "kid_t5a"
+        os.environ["KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER"] = "pepper_t5a"
+        first = fingerprint_token("tok_t5")
+
+        os.environ["KILL_SWITCH_AUDIT_FINGERPRINT_KID"] = "kid_t5b"
+        os.environ["KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER"] = "pepper_t5b"
+        assert fingerprint_token("tok_t5") == first, (
+            "Cached kid/pepper must be reused until the cache is reset"
+        )
+
+        reset_fingerprint_cache()
+        rotated = fingerprint_token("tok_t5")
+        assert rotated is not None and rotated.startswith("kid_t5b:"), (
+            f"After reset the new kid must be used, got {rotated!r}"
+        )
+        assert rotated.split(":", 1)[1] != first.split(":", 1)[1]
+
+    # ── T6: Kid validation ────────────────────────────────────────────────────
+
+    @pytest.mark.parametrize(
+        "bad_kid",
+        ["", "kid:202602", "k" * 33, "kid 2026", "kid/2026", "kid_ü", "kid_2026\n"],
+    )
+    def test_t6_malformed_kid_rejected(self, bad_kid: str) -> None:
+        """T6: kid must be 1–32 chars of [A-Za-z0-9._-]; anything else fails closed."""
+        os.environ["KILL_SWITCH_AUDIT_FINGERPRINT_KID"] = bad_kid
+        os.environ["KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER"] = "pepper_t6"
+
+        with pytest.raises(RuntimeError, match="INVALID_FINGERPRINT_KID"):
+            fingerprint_token("tok_t6")
+
+    # ── T7: Batch API ─────────────────────────────────────────────────────────
+
+    def test_t7_batch_matches_single(self) -> None:
+        """T7: fingerprint_token_batch() == [fingerprint_token(t) for t in tokens]."""
+        os.environ["KILL_SWITCH_AUDIT_FINGERPRINT_KID"] = "kid_t7"
+        os.environ["KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER"] = "pepper_t7"
+        tokens = ["tok_a", None, "", "tok_b", "tok_a"]
+
+        assert fingerprint_token_batch(tokens) == [fingerprint_token(t) for t in tokens]
+
+        os.environ.pop("KILL_SWITCH_AUDIT_FINGERPRINT_PEPPER", None)
+        reset_fingerprint_cache()
+        assert fingerprint_token_batch(tokens) == [None] * len(tokens), (
+            "Dev/CI mode without pepper yields None for every token"
+        )
@@ -12,6 +12,11 @@ Test matrix:
   B – GOVERNANCE / COMPLIANCE modes correctly passed to S3 PutObject (parameterized)
   C – REQUIRED=1 + BUCKET set but WORM_MODE unset → AuditSinkConfigError (fail-closed)
   D – put_record never includes BypassGovernanceRetention or any bypass-related params
+  E – Body is the serialized record (seekable, with ContentLength/ContentMD5);
+      pre-serialized bytes are sent unchanged
+  F – Sinks in the same region share one cached boto3 client (built once)
+  G – Retention is computed from the caller's `now` (shared with the record timestamp)
+  H – Non-JSON-native values in a record are coerced with str(), natives kept as-is
 
 Facts (documented in runbook + DEC):
   - Governance mode: can be overridden ONLY with s3:BypassGovernanceRetention IAM permission
@@ -20,6 +25,9 @@ Facts (documented in runbook + DEC):
   - CloudTrail data events (not management events) required for object-level audit trail.
 """
 
+import base64
+import hashlib
+import json
 import os
 from typing import Generator
 from unittest.mock import MagicMock, call, patch
@@ -29,6 +37,7 @@ import pytest
 from dpp_api.audit.sinks import (
     AuditSinkConfigError,
     S3WormAuditSink,
+    serialize_audit_record,
     validate_audit_required_config,
 )
 
@@ -205,7 +214,8 @@ class TestRC10WormModeHardening:
 
         # Also verify no extra headers are being passed that could contain bypass directives
         # (boto3 allows custom headers via RequestPayer or ChecksumAlgorithm but not bypass)
-        allowed_param_prefixes = {"Bucket", "Key", "Body", "ContentType", "ObjectLock",
+        allowed_param_prefixes = {"Bucket", "Key", "Body", "ContentType", "ContentLength",
+                                   "ContentMD5", "ObjectLock",
                                    "Metadata", "ServerSideEncryption", "StorageClass",
                                    "Tagging", "ChecksumAlgorithm"}
         unexpected = [
@@ -216,3 +226,78 @@ class TestRC10WormModeHardening:
             f"Unexpected put_object parameters found: {unexpected}. "
             "Review to ensure no unintended capabilities are being invoked."
         )
+
+    # ── Test E: Body serialization ────────────────────────────────────────────
+
+    def test_e_body_serialized_once_and_bytes_passthrough(self) -> None:
+        """E: Body is UTF-8 JSON of the record; pre-serialized bytes are not re-encoded."""
+        mock_s3 = MagicMock()
+        record = {"action": "kill_switch_change", "reason": "점검"}
+
+        with patch("boto3.client", return_value=mock_s3):
+            sink = S3WormAuditSink(bucket="test-bucket", mode="GOVERNANCE")
+            sink.put_record("test-key-dict", record)
+            dict_kwargs = mock_s3.put_object.call_args.kwargs
+
+            pre = serialize_audit_record(record)
+            sink.put_record("test-key-bytes", pre)
+            bytes_kwargs = mock_s3.put_object.call_args.kwargs
+
+        dict_body = dict_kwargs["Body"].getvalue()
+        assert json.loads(dict_body) == record
+        assert "점검".encode("utf-8") in dict_body, "Non-ASCII must not be escaped"
+        assert bytes_kwargs["Body"].getvalue() == pre, "Pre-serialized bytes must be sent as-is"
+        assert bytes_kwargs["ContentLength"] == len(pre)
+        assert bytes_kwargs["ContentMD5"] == base64.b64encode(hashlib.md5(pre).digest()).decode()
+
+    # ── Test F: Shared S3 client ──────────────────────────────────────────────
+
+    def test_f_s3_client_built_once_per_region(self) -> None:
+        """F: boto3.client() is built once per region and shared across sinks."""
+        with patch("boto3.client", side_effect=lambda *a, **kw: MagicMock()) as mock_factory:
+            a = S3WormAuditSink(bucket="bucket-a", region="ap-northeast-2")
+            b = S3WormAuditSink(bucket="bucket-b", region="ap-northeast-2")
+            c = S3WormAuditSink(bucket="bucket-c", region="us-east-1")
+
+        assert mock_factory.call_count == 2, "One client per region expected"
+        assert a._client is b._client
+        assert a._client is not c._client
+        config = mock_factory.call_args.kwargs["config"]
+        assert config.tcp_keepalive is True
+        assert config.retries["mode"] == "adaptive"
+
+    # ── Test G: Retention base ────────────────────────────────────────────────
+
+    def test_g_retain_until_uses_caller_now(self) -> None:
+        """G: ObjectLockRetainUntilDate = now + 2555 days, formatted YYYY-MM-DDThh:mm:ssZ."""
+        from datetime import datetime, timedelta, timezone
+
+        mock_s3 = MagicMock()
+        now = datetime(2026, 2, 21, 12, 0, 0, 654321, tzinfo=timezone.utc)
+
+        with patch("boto3.client", return_value=mock_s3):
+            sink = S3WormAuditSink(bucket="test-bucket", mode="GOVERNANCE")
+            sink.put_record("test-key", {"action": "test"}, now=now)
+
+        kwargs = mock_s3.put_object.call_args.kwargs
+        assert kwargs["ObjectLockRetainUntilDate"] == "2033-02-19T12:00:00Z"
+
+        # Same second (cached) and next second (recomputed)
+        later = now.replace(microsecond=999999)
+        assert S3WormAuditSink._retain_until(later) == "2033-02-19T12:00:00Z"
+        assert S3WormAuditSink._retain_until(later + timedelta(seconds=1)) == "2033-02-19T12:00:01Z"
+
+    # ── Test H: Non-native values ─────────────────────────────────────────────
+
+    def test_h_serialize_coerces_non_native_values(self) -> None:
+        """H: serialize_audit_record() str()s non-native leaves without touching natives."""
+        from decimal import Decimal
+
+        record = {"n": 1, "ok": True, "error": ValueError("boom"), "items": [Decimal("1.5"), None]}
+
+        assert json.loads(serialize_audit_record(record)) == {
+            "n": 1,
+            "ok": True,
+            "error": "boom",
+            "items": ["1.5", None],
+        }
@@ -5,11 +5,12 @@ Validates that all logs include run_id and tenant_id for 1-minute root cause ana
 
 import json
 import logging
+from contextvars import copy_context
 from io import StringIO
 
 import pytest
 
-from dpp_api.context import request_id_var, run_id_var, tenant_id_var
+from dpp_api.context import get_ctx, request_id_var, run_id_var, tenant_id_var
 from dpp_api.utils.logging import JSONFormatter, configure_json_logging
 
 
@@ -259,3 +260,25 @@ def test_context_isolation_between_requests() -> None:
     # Ensure no cross-contamination
     assert log2["run_id"] != log1["run_id"]
     assert log2["tenant_id"] != log1["tenant_id"]
+
+
+def test_context_fields_share_one_snapshot() -> None:
+    """Field setters swap in a new RequestCtx; copied contexts keep their own."""
+    run_id_var.set("")
+    request_id_var.set("req_outer")
+    tenant_id_var.set("tenant_outer")
+    outer = get_ctx()
+
+    def _inner() -> None:
+        run_id_var.set("run_inner")
+        assert get_ctx().request_id == "req_outer"
+        assert get_ctx().run_id == "run_inner"
+
+    copy_context().run(_inner)
+
+    assert get_ctx() is outer
+    assert run_id_var.get() == ""
+    assert run_id_var.get(None) is None
+
+    request_id_var.set("")
+    tenant_id_var.set("")
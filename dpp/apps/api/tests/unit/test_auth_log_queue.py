@@ -0,0 +1,52 @@
+"""Tests for the batched auth_request_log writer.
+
+Test Coverage:
+T1: submit() returns False when the writer is not running (inline fallback)
+T2: Queued entries are flushed together in one batch
+T3: stop_auth_log_writer() flushes entries still queued
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from dpp_api.auth import audit_queue
+
+
+def _entry(n: int) -> dict:
+    return {"id": f"id-{n}", "route": "/v1/runs", "method": "GET", "status_code": 200}
+
+
+def test_t1_submit_without_writer_returns_false():
+    """T1: No running writer -> caller must write the row itself."""
+    assert audit_queue._queue is None
+    assert audit_queue.submit(_entry(0)) is False
+
+
+async def test_t2_entries_flushed_as_one_batch():
+    """T2: Entries submitted within the flush window land in a single INSERT."""
+    batches: list[list[dict]] = []
+
+    with patch.object(audit_queue, "_write_batch", side_effect=batches.append):
+        audit_queue.start_auth_log_writer()
+        try:
+            for n in range(5):
+                assert audit_queue.submit(_entry(n)) is True
+            await asyncio.sleep(audit_queue._FLUSH_INTERVAL_SEC + 0.2)
+        finally:
+            await audit_queue.stop_auth_log_writer()
+
+    assert [[e["id"] for e in b] for b in batches] == [[f"id-{n}" for n in range(5)]]
+
+
+async def test_t3_stop_flushes_pending_entries():
+    """T3: Shutdown writes out whatever was queued but not yet flushed."""
+    batches: list[list[dict]] = []
+
+    with patch.object(audit_queue, "_write_batch", side_effect=batches.append):
+        audit_queue.start_auth_log_writer()
+        for n in range(3):
+            audit_queue.submit(_entry(n))
+        await audit_queue.stop_auth_log_writer()
+
+    assert sorted(e["id"] for b in batches for e in b) == ["id-0", "id-1", "id-2"]
+    assert audit_queue._queue is None
@@ -0,0 +1,101 @@
+"""Unit tests for config/env.py helpers.
+
+Test Coverage:
+T1: is_localstack_endpoint matches every local marker, case-insensitively
+T2: Env getters are memoized until reset_env_cache()
+T3: get_aws_region still enforces require_in_prod on the cached region
+T4: SSE kwargs computed once for AWS endpoints; LocalStack always gets none
+T5: EnvConfig snapshot derives the guardrail flags and is immutable
+"""
+
+import dataclasses
+
+import pytest
+
+from dpp_api.config import env
+from dpp_api.config.env import is_localstack_endpoint
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected",
+    [
+        ("http://localhost:4566", True),
+        ("http://127.0.0.1:4566", True),
+        ("http://LocalStack:4566", True),
+        ("http://HOST.DOCKER.INTERNAL:4566", True),
+        ("https://s3.ap-northeast-2.amazonaws.com", False),
+        ("http://127x0x0x1:4566", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_t1_localstack_endpoint_detection(endpoint, expected):
+    """T1: Same verdicts as the old lower() + substring scan."""
+    assert is_localstack_endpoint(endpoint) is expected
+
+
+def test_t2_getters_memoized_until_reset(monkeypatch):
+    """T2: A later env change is invisible until the cache is reset."""
+    monkeypatch.setenv("DPP_ENV", "Staging")
+    assert env.get_dpp_env() == "staging"
+    assert env.is_production_env() is False
+
+    monkeypatch.setenv("DPP_ENV", "prod")
+    assert env.get_dpp_env() == "staging"
+
+    env.reset_env_cache()
+    assert env.get_dpp_env() == "prod"
+    assert env.is_production_env() is True
+
+
+def test_t3_region_required_in_prod(monkeypatch):
+    """T3: Missing region raises in prod (every call) and defaults elsewhere."""
+    monkeypatch.delenv("AWS_REGION", raising=False)
+    monkeypatch.delenv("AWS_DEFAULT_REGION", raising=False)
+    monkeypatch.delenv("AWS_ROLE_ARN", raising=False)
+    monkeypatch.delenv("AWS_WEB_IDENTITY_TOKEN_FILE", raising=False)
+    monkeypatch.setenv("DPP_ENV", "production")
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="AWS_REGION"):
+            env.get_aws_region()
+    assert env.get_aws_region(require_in_prod=False) == "us-east-1"
+
+
+def test_t4_sse_kwargs_shared_for_aws_endpoints(monkeypatch):
+    """T4: Repeat calls return the same dict; LocalStack bypasses the cache."""
+    monkeypatch.setenv("S3_SSE_MODE", "kms")
+    monkeypatch.setenv("S3_SSE_KMS_KEY_ID", "key-1")
+    aws = "https://s3.ap-northeast-2.amazonaws.com"
+
+    first = env.get_s3_server_side_encryption_kwargs(aws)
+    assert first == {"ServerSideEncryption": "aws:kms", "SSEKMSKeyId": "key-1"}
+    assert env.get_s3_server_side_encryption_kwargs(None) is first
+    assert env.get_s3_server_side_encryption_kwargs("http://localhost:4566") == {}
+
+    monkeypatch.setenv("S3_SSE_MODE", "off")
+    env.reset_env_cache()
+    assert env.get_s3_server_side_encryption_kwargs(aws) == {}
+
+
+def test_t5_env_config_snapshot(monkeypatch):
+    """T5: IRSA implies production; the snapshot is shared and frozen."""
+    monkeypatch.setenv("DPP_ENV", "staging")
+    monkeypatch.setenv("AWS_ROLE_ARN", "arn:aws:iam::123:role/dpp")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "tok")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "ap-northeast-2")
+    monkeypatch.delenv("AWS_REGION", raising=False)
+
+    cfg = env.get_env_config()
+    assert cfg == env.EnvConfig(
+        dpp_env="staging",
+        is_irsa=True,
+        is_production=True,
+        has_static_creds=True,
+        region="ap-northeast-2",
+    )
+    assert env.get_env_config() is cfg
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.is_production = False
+    with pytest.raises(ValueError, match="A1"):
+        env.assert_no_static_aws_creds("s3")
@@ -20,6 +20,7 @@ from dpp_api.config.kill_switch import (
     KillSwitchConfig,
     KillSwitchMode,
     KillSwitchState,
+    reset_kill_switch_config,
 )
 from dpp_api.main import app
 from dpp_api.middleware.kill_switch import KillSwitchMiddleware
@@ -33,17 +34,15 @@ app.add_middleware(KillSwitchMiddleware)
 @pytest.fixture(autouse=True)
 def reset_kill_switch():
     """Reset kill switch to NORMAL before each test."""
-    # Reset singleton instance
-    KillSwitchConfig._instance = None
-
-    # Reset environment variable
+    # Reset environment variable, then reload the global instance's state
     os.environ.pop("KILL_SWITCH_MODE", None)
+    reset_kill_switch_config()
 
     yield
 
     # Cleanup after test
-    KillSwitchConfig._instance = None
     os.environ.pop("KILL_SWITCH_MODE", None)
+    reset_kill_switch_config()
 
 
 @pytest.fixture
@@ -315,6 +314,53 @@ def test_hard_stop_ignores_ttl():
     assert state.expires_at is None
 
 
+def test_get_mode_fast_path_and_ttl_restore():
+    """get_mode() skips the expiry check without a TTL and still auto-restores with one."""
+    config = KillSwitchConfig()
+    config.set_state(
+        mode=KillSwitchMode.SAFE_MODE,
+        reason="Testing get_mode",
+        actor_ip="127.0.0.1",
+    )
+
+    with patch.object(KillSwitchState, "is_expired", side_effect=AssertionError):
+        assert config.get_mode() == KillSwitchMode.SAFE_MODE
+
+    config.set_state(
+        mode=KillSwitchMode.SAFE_MODE,
+        reason="Testing get_mode TTL",
+        actor_ip="127.0.0.1",
+        ttl_minutes=5,
+    )
+    assert config.get_mode() == KillSwitchMode.SAFE_MODE
+
+    config._state.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    assert config.get_mode() == KillSwitchMode.NORMAL
+    assert "auto-restored" in config.get_state().reason.lower()
+
+
+def test_initial_state_env_override_skips_config_file(monkeypatch):
+    """KILL_SWITCH_MODE wins without opening kill_switch.yaml."""
+    monkeypatch.setenv("KILL_SWITCH_MODE", "safe_mode")
+
+    with patch("builtins.open", side_effect=AssertionError("config file opened")):
+        state = KillSwitchConfig._load_initial_state()
+
+    assert state.mode == KillSwitchMode.SAFE_MODE
+
+
+def test_initial_state_missing_config_file_defaults_normal(tmp_path, monkeypatch):
+    """No env override and no kill_switch.yaml -> NORMAL default."""
+    from dpp_api.config import kill_switch
+
+    monkeypatch.setattr(kill_switch, "_CONFIG_PATH", tmp_path / "missing.yaml")
+
+    state = KillSwitchConfig._load_initial_state()
+
+    assert state.mode == KillSwitchMode.NORMAL
+    assert state.reason == "Default configuration"
+
+
 # ============================================================================
 # Test 5: Audit log records mode changes
 # ============================================================================
@@ -414,3 +460,7 @@ def test_state_to_kst_display():
     assert "14:30:00" in kst_data["set_at"]
     # 6:30 UTC = 15:30 KST
     assert "15:30:00" in kst_data["expires_at"]
+    # Offset travels with the value; None fields are omitted
+    assert kst_data["set_at"] == "2026-02-18T14:30:00+09:00"
+    assert kst_data["mode"] == "SAFE_MODE"
+    assert "set_by_ip" not in KillSwitchState().to_kst_display()
@@ -0,0 +1,175 @@
+"""Unit tests for PayPalClient connection reuse and OAuth token caching.
+
+Test Coverage:
+T1: All API calls go through the one pooled client, against base_url
+T2: close_paypal_client() closes the pool and drops the singleton
+T3: OAuth token minted once and reused across API calls
+T4: Concurrent callers share a single token refresh
+T5: Token inside the expiry skew window is refreshed
+T6: Racing first calls from worker threads construct a single client
+T7: Pool keeps idle connections 120s with HTTP/2 and TCP keepalive
+"""
+
+import asyncio
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from dpp_api.billing import paypal
+from dpp_api.billing.paypal import PayPalClient, close_paypal_client, get_paypal_client
+
+
+@pytest.fixture(autouse=True)
+def paypal_env(monkeypatch):
+    monkeypatch.setenv("PAYPAL_ENV", "sandbox")
+    monkeypatch.setenv("PAYPAL_CLIENT_ID", "client-id")
+    monkeypatch.setenv("PAYPAL_CLIENT_SECRET", "client-secret")
+    monkeypatch.setattr(paypal, "_paypal_client", None)
+
+
+class _PayPalStub:
+    """PayPal sandbox served from an httpx MockTransport, recording requests."""
+
+    def __init__(self, expires_in: int = 32400):
+        self.requests: list[tuple[str, str, str]] = []
+        self.expires_in = expires_in
+
+    @property
+    def token_calls(self) -> int:
+        return sum(1 for _, _, path in self.requests if path == "/v1/oauth2/token")
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.url.host, request.url.path))
+        if request.url.path == "/v1/oauth2/token":
+            assert request.content == b"grant_type=client_credentials"
+            assert request.headers["Content-Type"] == "application/x-www-form-urlencoded"
+            return httpx.Response(
+                200, json={"access_token": "A21-token", "expires_in": self.expires_in}
+            )
+        return httpx.Response(200, json={"id": "ORDER-1", "status": "COMPLETED"})
+
+    def install(self, client: PayPalClient) -> None:
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(self.handle)
+        )
+
+
+async def test_t1_calls_share_pooled_client():
+    """T1: Relative paths resolve against the sandbox base_url on one client."""
+    client = PayPalClient()
+    stub = _PayPalStub()
+    stub.install(client)
+
+    await client.create_order(
+        amount="10.00",
+        currency="USD",
+        internal_order_id="ord-1",
+        plan_id="plan-basic",
+        request_id="req-create",
+    )
+    await client.capture_order("ORDER-1", request_id="req-capture")
+
+    hosts = {host for _, host, _ in stub.requests}
+    paths = [(method, path) for method, _, path in stub.requests]
+    assert hosts == {"api-m.sandbox.paypal.com"}
+    assert ("POST", "/v2/checkout/orders") in paths
+    assert ("POST", "/v2/checkout/orders/ORDER-1/capture") in paths
+    await client.aclose()
+
+
+async def test_t2_close_drops_singleton():
+    """T2: Shutdown closes the pool; the next caller gets a fresh client."""
+    first = get_paypal_client()
+    assert get_paypal_client() is first
+
+    await close_paypal_client()
+
+    assert first._client.is_closed
+    assert paypal._paypal_client is None
+    second = get_paypal_client()
+    assert second is not first
+    await close_paypal_client()
+
+
+async def test_t3_token_reused_across_calls():
+    """T3: create + capture + show mint one OAuth token between them."""
+    client = PayPalClient()
+    stub = _PayPalStub()
+    stub.install(client)
+
+    await client.create_order(
+        amount="10.00",
+        currency="USD",
+        internal_order_id="ord-1",
+        plan_id="plan-basic",
+        request_id="req-create",
+    )
+    await client.capture_order("ORDER-1", request_id="req-capture")
+    await client.show_order_details("ORDER-1")
+
+    assert stub.token_calls == 1
+    assert len(stub.requests) == 4
+    await client.aclose()
+
+
+async def test_t4_concurrent_refresh_coalesced():
+    """T4: A burst of cold callers triggers one token POST."""
+    client = PayPalClient()
+    stub = _PayPalStub()
+    stub.install(client)
+
+    tokens = await asyncio.gather(*(client.get_access_token() for _ in range(10)))
+
+    assert set(tokens) == {"A21-token"}
+    assert stub.token_calls == 1
+    await client.aclose()
+
+
+async def test_t5_token_near_expiry_refreshed():
+    """T5: expires_in within the skew window is never served from cache."""
+    client = PayPalClient()
+    stub = _PayPalStub(expires_in=paypal._TOKEN_EXPIRY_SKEW_SEC)
+    stub.install(client)
+
+    await client.get_access_token()
+    await client.get_access_token()
+
+    assert stub.token_calls == 2
+    await client.aclose()
+
+
+def test_t6_threaded_first_calls_build_one_client(monkeypatch):
+    """T6: The accessor's lock keeps concurrent threads to one PayPalClient()."""
+    barrier = threading.Barrier(8)
+    built: list[PayPalClient] = []
+    real_init = PayPalClient.__init__
+
+    def counting_init(self):
+        real_init(self)
+        built.append(self)
+
+    monkeypatch.setattr(PayPalClient, "__init__", counting_init)
+
+    def first_call():
+        barrier.wait()
+        return get_paypal_client()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: first_call(), range(8)))
+
+    assert len(built) == 1
+    assert all(c is built[0] for c in clients)
+
+
+async def test_t7_pool_keeps_idle_connections_warm():
+    """T7: Idle TLS sessions outlive httpx's 5s default between sporadic orders."""
+    client = PayPalClient()
+    pool = client._client._transport._pool
+
+    assert pool._keepalive_expiry == 120.0
+    assert pool._http2 is True
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool._socket_options
+    await client.aclose()
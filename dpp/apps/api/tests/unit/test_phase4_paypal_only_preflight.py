@@ -13,6 +13,12 @@ Verifies that Phase 4 Toss isolation changes are correct:
    Pilot and production both run with REQUIRED=1 (fail-fast).
    This test covers the fallback branch that exists in the codebase;
    it is NOT the expected normal pilot behaviour.
+7. A provider call that stalls past the httpx timeout is cut off by the
+   outer asyncio deadline and reported as err:ASYNCIO_TIMEOUT.
+8. With DPP_BILLING_PREFLIGHT_CACHE_URL set, a worker reuses another worker's
+   all-ok result (no provider call) and publishes its own; an unreachable
+   cache falls back to running the checks. Workers with a different
+   PAYPAL_ENV or different credentials never share a result.
 
 Normal pilot expected readyz: {"status": "ok", "billing_preflight": {"paypal": "ok"}}
 REQUIRED=1 is the only accepted state for pilot / production startup.
@@ -63,6 +69,7 @@ def paypal_ok_response():
     mock_resp = MagicMock()
     mock_resp.status_code = 200
     mock_resp.json.return_value = {"access_token": "A21AAXXXXXX", "token_type": "Bearer"}
+    mock_resp.content = b'{"access_token": "A21AAXXXXXX", "token_type": "Bearer"}'
     return mock_resp
 
 
@@ -148,6 +155,11 @@ async def test_preflight_status_cached_after_run(paypal_env, paypal_ok_response)
     assert status == {"paypal": "ok"}
     assert "toss" not in status
 
+    # Probes share one read-only view instead of copying per call
+    assert get_billing_preflight_status() is status
+    with pytest.raises(TypeError):
+        status["paypal"] = "err:tampered"  # type: ignore[index]
+
 
 # ---------------------------------------------------------------------------
 # Test 5: Preflight is idempotent — second call is a no-op
@@ -225,3 +237,140 @@ def test_preflight_status_before_run_returns_skipped():
     # cache is reset by autouse fixture
     status = get_billing_preflight_status()
     assert status == {"status": "skipped"}
+
+
+# ---------------------------------------------------------------------------
+# Test 8: Outer asyncio deadline bounds a stalled provider call
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_stalled_paypal_call_hits_outer_deadline(monkeypatch):
+    """A hang the httpx timeout does not catch still ends at timeout + grace."""
+    import asyncio
+
+    from dpp_api.billing import active_preflight
+
+    monkeypatch.setenv("PAYPAL_CLIENT_ID", "test-client-id")
+    monkeypatch.setenv("PAYPAL_CLIENT_SECRET", "test-client-secret")
+    monkeypatch.setenv("DPP_BILLING_PREFLIGHT_REQUIRED", "0")
+    monkeypatch.setenv("DPP_BILLING_PREFLIGHT_TIMEOUT_SECONDS", "0.05")
+    monkeypatch.setattr(active_preflight, "_DEADLINE_GRACE_SEC", 0.0)
+
+    async def stalled_post(*args, **kwargs):
+        await asyncio.sleep(60)
+
+    with patch("httpx.AsyncClient") as mock_client_cls:
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+        mock_client.post = stalled_post
+        mock_client_cls.return_value = mock_client
+
+        result = await asyncio.wait_for(run_billing_secrets_active_preflight(), 5)
+
+    assert result == {"paypal": "err:ASYNCIO_TIMEOUT"}
+
+
+# ---------------------------------------------------------------------------
+# Test 9: Shared (Redis) preflight result across workers
+# ---------------------------------------------------------------------------
+
+class _FakeSharedCache:
+    """Stands in for redis.asyncio.Redis: get/setex/aclose over a dict."""
+
+    def __init__(self, fail: bool = False):
+        self.data: dict[str, bytes] = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            import redis
+
+            raise redis.ConnectionError("unreachable")
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def aclose(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_second_worker_reuses_shared_result(paypal_env, paypal_ok_response, monkeypatch):
+    """First worker checks PayPal and publishes; the next one skips the call."""
+    from dpp_api.billing import active_preflight
+
+    monkeypatch.setenv("DPP_BILLING_PREFLIGHT_CACHE_URL", "redis://cache:6379/0")
+    cache = _FakeSharedCache()
+    monkeypatch.setattr(active_preflight, "_shared_cache_client", lambda url: cache)
+
+    with patch("httpx.AsyncClient") as mock_client_cls:
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+        mock_client.post = AsyncMock(return_value=paypal_ok_response)
+        mock_client_cls.return_value = mock_client
+
+        first = await run_billing_secrets_active_preflight()
+        _reset_preflight_cache()  # simulate a second worker process
+        second = await run_billing_secrets_active_preflight()
+
+    assert first == second == {"paypal": "ok"}
+    assert mock_client.post.await_count == 1
+    assert list(cache.data) == [active_preflight._shared_cache_key({"paypal"})]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "env_name, value",
+    [("PAYPAL_CLIENT_SECRET", "rotated-secret"), ("PAYPAL_ENV", "live")],
+)
+async def test_different_credentials_do_not_share_result(
+    paypal_env, paypal_ok_response, monkeypatch, env_name, value
+):
+    """A worker with another secret or PAYPAL_ENV runs its own check."""
+    from dpp_api.billing import active_preflight
+
+    monkeypatch.setenv("DPP_BILLING_PREFLIGHT_CACHE_URL", "redis://cache:6379/0")
+    cache = _FakeSharedCache()
+    monkeypatch.setattr(active_preflight, "_shared_cache_client", lambda url: cache)
+
+    with patch("httpx.AsyncClient") as mock_client_cls:
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+        mock_client.post = AsyncMock(return_value=paypal_ok_response)
+        mock_client_cls.return_value = mock_client
+
+        await run_billing_secrets_active_preflight()
+        _reset_preflight_cache()
+        monkeypatch.setenv(env_name, value)
+        await run_billing_secrets_active_preflight()
+
+    assert mock_client.post.await_count == 2
+    assert len(cache.data) == 2
+    assert not any(b"secret" in key.encode() for key in cache.data)
+
+
+@pytest.mark.asyncio
+async def test_unreachable_shared_cache_runs_checks(paypal_env, paypal_ok_response, monkeypatch):
+    """A cache outage never blocks startup; the worker checks PayPal itself."""
+    from dpp_api.billing import active_preflight
+
+    monkeypatch.setenv("DPP_BILLING_PREFLIGHT_CACHE_URL", "redis://cache:6379/0")
+    monkeypatch.setattr(
+        active_preflight, "_shared_cache_client", lambda url: _FakeSharedCache(fail=True)
+    )
+
+    with patch("httpx.AsyncClient") as mock_client_cls:
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+        mock_client.post = AsyncMock(return_value=paypal_ok_response)
+        mock_client_cls.return_value = mock_client
+
+        result = await run_billing_secrets_active_preflight()
+
+    assert result == {"paypal": "ok"}
+    assert mock_client.post.await_count == 1
@@ -0,0 +1,276 @@
+"""Tests for session auth caching and offline JWT verification.
+
+Test Coverage:
+T1: Repeat JWT skips Supabase get_user (verified-JWT cache hit)
+T2: Token expiring within the skew window is not cached
+T3: Rejected token is never cached; 401 body keeps the problem+json shape
+T4: RS256 token verified offline via JWKS (no Supabase call)
+T5: RS256 token with wrong audience rejected offline with 401
+T6: Tenant resolution cached per user_id; missing tenant is not cached
+T7: Same request resolved once across repeated dependency calls
+T8: Startup warm-up probes /auth/v1/health and never raises
+T9: Unknown kids refetch the JWKS at most once per refresh window
+"""
+
+import base64
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from dpp_api import supabase_client
+from dpp_api.auth import session_auth
+from dpp_api.auth.session_auth import get_session_auth_context
+
+
+def _make_jwt(exp: float) -> str:
+    """Build an unsigned compact JWT carrying only an exp claim."""
+
+    def _seg(obj: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(obj).encode()).rstrip(b"=").decode()
+
+    return f"{_seg({'alg': 'HS256', 'typ': 'JWT'})}.{_seg({'exp': int(exp)})}.sig"
+
+
+def _creds(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _db_with_tenant(tenant_id: str = "tenant-001", role: str = "owner") -> MagicMock:
+    user_tenant = MagicMock(tenant_id=tenant_id, role=role)
+    db = MagicMock()
+    db.execute.return_value.first.return_value = user_tenant
+    return db
+
+
+class _SupabaseStub:
+    """GET /auth/v1/user served from an httpx MockTransport, counting calls."""
+
+    def __init__(self, status_code: int = 200, user: dict | None = None):
+        self.calls = 0
+        self.status_code = status_code
+        self.user = user if user is not None else {"id": "user-001", "email": "u@example.com"}
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        assert request.url.path == "/auth/v1/user"
+        assert request.headers["apikey"] == "anon-key"
+        return httpx.Response(self.status_code, json=self.user)
+
+    def patch(self):
+        return patch.multiple(
+            session_auth,
+            get_supabase_http_client=lambda: self.client,
+            get_supabase_url=lambda: "https://project.supabase.co",
+            get_supabase_api_key=lambda: "anon-key",
+        )
+
+
+def _supabase_returning() -> _SupabaseStub:
+    return _SupabaseStub()
+
+
+def _request() -> MagicMock:
+    """A fresh request per call, so the per-request memo never short-circuits."""
+    request = MagicMock()
+    request.url.path = "/v1/tokens"
+    return request
+
+
+async def test_t1_repeat_jwt_skips_supabase():
+    """T1: Second request with the same JWT is served from the cache."""
+    token = _make_jwt(time.time() + 3600)
+    supabase = _supabase_returning()
+
+    with supabase.patch():
+        first = await get_session_auth_context(_request(), _creds(token), _db_with_tenant())
+        second = await get_session_auth_context(_request(), _creds(token), _db_with_tenant())
+
+    assert supabase.calls == 1
+    assert first.user_id == second.user_id == "user-001"
+    assert second.email == "u@example.com"
+    assert second.tenant_id == "tenant-001"
+
+
+async def test_t2_near_expiry_token_not_cached():
+    """T2: A token inside the exp skew window is re-validated every time."""
+    token = _make_jwt(time.time() + session_auth._JWT_EXP_SKEW_SEC - 1)
+    supabase = _supabase_returning()
+
+    with supabase.patch():
+        await get_session_auth_context(_request(), _creds(token), _db_with_tenant())
+        await get_session_auth_context(_request(), _creds(token), _db_with_tenant())
+
+    assert supabase.calls == 2
+
+
+async def test_t3_rejected_token_not_cached():
+    """T3: A token Supabase rejects raises 401 and leaves the cache empty."""
+    token = _make_jwt(time.time() + 3600)
+    supabase = _SupabaseStub(status_code=401, user={"msg": "invalid JWT"})
+
+    with supabase.patch():
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_session_auth_context(_request(), _creds(token), _db_with_tenant())
+            assert exc_info.value.status_code == 401
+            assert exc_info.value.detail == {
+                "type": "https://api.decisionproof.ai/problems/unauthorized",
+                "title": "Unauthorized",
+                "status": 401,
+                "detail": "Invalid or expired session token. Please log in again.",
+                "instance": "/v1/tokens",
+            }
+
+    assert supabase.calls == 2
+    assert session_auth._jwt_cache == {}
+
+
+@pytest.fixture(scope="module")
+def rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+class _JWKSStub:
+    """JWKS endpoint served from an httpx MockTransport, counting fetches."""
+
+    def __init__(self, public_key, kid: str = "k1"):
+        self.fetches = 0
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(public_key))
+        self.body = {"keys": [{**jwk, "kid": kid, "alg": "RS256", "use": "sig"}]}
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.fetches += 1
+        assert request.url.path == "/auth/v1/.well-known/jwks.json"
+        return httpx.Response(200, json=self.body)
+
+    def patch(self):
+        return patch.multiple(
+            session_auth,
+            get_supabase_http_client=lambda: self.client,
+            get_supabase_url=lambda: "https://project.supabase.co",
+        )
+
+
+def _rs256(rsa_key, claims: dict, kid: str = "k1") -> str:
+    return jwt.encode(claims, rsa_key, algorithm="RS256", headers={"kid": kid})
+
+
+async def test_t4_rs256_verified_offline(rsa_key):
+    """T4: Asymmetric tokens are verified against JWKS without get_user."""
+    token = _rs256(
+        rsa_key,
+        {"sub": "user-rs", "email": "rs@example.com", "aud": "authenticated",
+         "exp": int(time.time()) + 3600},
+    )
+    jwks = _JWKSStub(rsa_key.public_key())
+
+    with jwks.patch():
+        ctx = await get_session_auth_context(_request(), _creds(token), _db_with_tenant())
+
+    assert jwks.fetches == 1
+    assert ctx.user_id == "user-rs"
+    assert ctx.email == "rs@example.com"
+
+
+async def test_t5_rs256_wrong_audience_rejected(rsa_key):
+    """T5: Offline verification enforces the 'authenticated' audience."""
+    token = _rs256(rsa_key, {"sub": "user-rs", "aud": "anon", "exp": int(time.time()) + 3600})
+    jwks = _JWKSStub(rsa_key.public_key())
+
+    with jwks.patch():
+        with pytest.raises(HTTPException) as exc_info:
+            await get_session_auth_context(_request(), _creds(token), _db_with_tenant())
+
+    assert exc_info.value.status_code == 401
+
+
+async def test_t6_tenant_resolution_cached_per_user():
+    """T6: One user_tenants query per user per TTL; 'no tenant' stays uncached."""
+    token = _make_jwt(time.time() + 3600)
+    supabase = _supabase_returning()
+    db = _db_with_tenant(tenant_id="tenant-cached", role="admin")
+    first_query = db.execute.return_value.first
+
+    empty_db = MagicMock()
+    empty_db.execute.return_value.first.return_value = None
+
+    with supabase.patch():
+        with pytest.raises(HTTPException) as exc_info:
+            await get_session_auth_context(_request(), _creds(token), empty_db)
+        assert exc_info.value.status_code == 403
+
+        await get_session_auth_context(_request(), _creds(token), db)
+        ctx = await get_session_auth_context(_request(), _creds(token), db)
+
+    assert first_query.call_count == 1
+    assert (ctx.tenant_id, ctx.role) == ("tenant-cached", "admin")
+
+
+async def test_t7_same_request_memoized():
+    """T7: Re-entering the dependency for the same request skips all work."""
+    token = _make_jwt(time.time() + 3600)
+    supabase = _supabase_returning()
+    db = _db_with_tenant()
+    request = _request()
+
+    with supabase.patch():
+        first = await get_session_auth_context(request, _creds(token), db)
+        session_auth.reset_session_auth_cache()
+        again = await get_session_auth_context(request, _creds(token), db)
+
+    assert again is first
+    assert supabase.calls == 1
+
+
+async def test_t8_warmup_probes_health_and_fails_open(monkeypatch):
+    """T8: Warm-up HEADs the health endpoint; a connect error only logs."""
+    seen: list[tuple[str, str]] = []
+
+    def _handle(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path))
+        raise httpx.ConnectError("unreachable", request=request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handle))
+    monkeypatch.setenv("SUPABASE_URL", "https://project.supabase.co")
+
+    with patch.object(supabase_client, "get_supabase_http_client", return_value=client), \
+            patch.object(supabase_client, "get_supabase_url", return_value="https://project.supabase.co"):
+        await supabase_client.warm_supabase_http_client()
+        monkeypatch.delenv("SUPABASE_URL")
+        await supabase_client.warm_supabase_http_client()
+
+    assert seen == [("HEAD", "/auth/v1/health")]
+
+
+async def test_t9_unknown_kids_rate_limit_jwks_refetch(rsa_key, monkeypatch):
+    """T9: Random kids are rejected without a fetch each; one refetch per window."""
+    claims = {"sub": "user-rs", "aud": "authenticated", "exp": int(time.time()) + 3600}
+    jwks = _JWKSStub(rsa_key.public_key())
+    clock = [1000.0]
+    monkeypatch.setattr(session_auth.time, "monotonic", lambda: clock[0])
+
+    with jwks.patch():
+        await get_session_auth_context(_request(), _creds(_rs256(rsa_key, claims)), _db_with_tenant())
+        for i in range(5):
+            with pytest.raises(HTTPException) as exc_info:
+                bogus = _rs256(rsa_key, claims, kid=f"random-{i}")
+                await get_session_auth_context(_request(), _creds(bogus), _db_with_tenant())
+            assert exc_info.value.status_code == 401
+        assert jwks.fetches == 1
+
+        clock[0] += session_auth._JWKS_MISS_REFRESH_SEC
+        for i in range(3):
+            with pytest.raises(HTTPException):
+                bogus = _rs256(rsa_key, claims, kid=f"late-{i}")
+                await get_session_auth_context(_request(), _creds(bogus), _db_with_tenant())
+
+    assert jwks.fetches == 2
@@ -0,0 +1,60 @@
+"""Unit tests for TossPaymentsClient HTTP connection reuse.
+
+Test Coverage:
+T1: Calls share the pooled client and carry the Basic auth default header
+T2: close_toss_client() closes the pool and drops the singleton
+"""
+
+import base64
+
+import httpx
+import pytest
+
+from dpp_api.billing import toss
+from dpp_api.billing.toss import TossPaymentsClient, close_toss_client, get_toss_client
+
+
+@pytest.fixture(autouse=True)
+def toss_env(monkeypatch):
+    monkeypatch.setenv("TOSS_SECRET_KEY", "test_sk_dummy")
+    monkeypatch.setattr(toss, "_toss_client", None)
+
+
+async def test_t1_calls_share_pooled_client_with_auth_header():
+    """T1: Relative paths hit api.tosspayments.com with the static Basic header."""
+    seen: list[tuple[str, str, str, str]] = []
+
+    def _handle(request: httpx.Request) -> httpx.Response:
+        seen.append(
+            (request.method, request.url.host, request.url.path, request.headers["Authorization"])
+        )
+        return httpx.Response(200, json={"status": "DONE"})
+
+    client = TossPaymentsClient()
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url,
+        headers=client._client.headers,
+        transport=httpx.MockTransport(_handle),
+    )
+
+    await client.get_payment("pk-1")
+    await client.cancel_payment(payment_key="pk-1", cancel_reason="test")
+
+    expected_auth = "Basic " + base64.b64encode(b"test_sk_dummy:").decode()
+    assert seen == [
+        ("GET", "api.tosspayments.com", "/v1/payments/pk-1", expected_auth),
+        ("POST", "api.tosspayments.com", "/v1/payments/pk-1/cancel", expected_auth),
+    ]
+    await client.aclose()
+
+
+async def test_t2_close_drops_singleton():
+    """T2: Shutdown closes the pool; the next caller gets a fresh client."""
+    first = get_toss_client()
+    assert get_toss_client() is first
+
+    await close_toss_client()
+
+    assert first._client.is_closed
+    assert toss._toss_client is None
+    await close_toss_client()
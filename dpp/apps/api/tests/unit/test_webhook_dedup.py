@@ -0,0 +1,169 @@
+"""Unit tests for the webhook dedup gate (billing/webhook_dedup.py).
+
+Test Coverage:
+T1: First delivery claims the row in one statement and one commit
+T2: A previously failed event is reclaimed for re-processing
+T3: A concurrent 'processing' duplicate is rejected by the claim
+T4: A 'done' redelivery is rejected by the SELECT fast path with no write
+T5: mark_dedup_done/failed leave the commit to the caller's transaction
+T6: Rows are keyed by a 16-byte hash that matches the migration backfill
+T7: After a 'done' read, redeliveries are answered from memory until the TTL
+T8: A batch is claimed in one statement; results keep input order
+T9: Timestamps are stamped by Postgres; no datetime is bound as a parameter
+T10: Gate decisions log the key prefix only when the level is enabled
+"""
+
+import hashlib
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from dpp_api.billing import webhook_dedup
+from dpp_api.billing.webhook_dedup import (
+    dedup_key_hash,
+    mark_dedup_done,
+    mark_dedup_failed,
+    try_acquire_dedup,
+    try_acquire_dedup_batch,
+)
+
+
+def _db_returning(row, status: str | None = None) -> MagicMock:
+    """Session whose status SELECT yields status and whose claim yields row."""
+    db = MagicMock()
+    db.execute.return_value.scalar.return_value = status
+    db.execute.return_value.fetchone.return_value = row
+    return db
+
+
+def test_t1_first_delivery_single_round_trip():
+    """T1: INSERT branch wins -> True after the status probe and one claim statement."""
+    db = _db_returning(SimpleNamespace(id=1, src="inserted"))
+
+    assert try_acquire_dedup(db, "paypal", "ev_WH-1", "hash") is True
+    assert db.execute.call_count == 2
+    assert db.commit.call_count == 1
+    params = db.execute.call_args.args[1]
+    assert params["provider"] == "paypal"
+    assert params["dedup_key"] == "ev_WH-1"
+    assert params["dedup_key_hash"] == dedup_key_hash("ev_WH-1")
+    assert params["request_hash"] == "hash"
+
+
+def test_t2_failed_event_reclaimed():
+    """T2: UPDATE branch returns the failed row -> True (PG retry proceeds)."""
+    db = _db_returning(SimpleNamespace(id=1, src="reclaimed"), status="failed")
+
+    assert try_acquire_dedup(db, "toss", "tx_T-1") is True
+    assert db.execute.call_count == 2
+
+
+def test_t3_duplicate_rejected():
+    """T3: In-flight 'processing' row -> claim returns nothing -> False."""
+    db = _db_returning(None, status="processing")
+
+    assert try_acquire_dedup(db, "paypal", "ev_WH-1") is False
+    assert db.execute.call_count == 2
+    assert db.commit.call_count == 1
+
+
+def test_t4_done_redelivery_skips_write():
+    """T4: 'done' row -> False after the SELECT alone; nothing committed."""
+    db = _db_returning(None, status="done")
+
+    assert try_acquire_dedup(db, "paypal", "ev_WH-1") is False
+    assert db.execute.call_count == 1
+    assert "SELECT status" in str(db.execute.call_args.args[0])
+    db.commit.assert_not_called()
+
+
+def test_t5_mark_helpers_do_not_commit():
+    """T5: Status updates join the caller's transaction (one commit per webhook)."""
+    db = MagicMock()
+
+    mark_dedup_done(db, "paypal", "ev_WH-1")
+    mark_dedup_failed(db, "toss", "tx_T-1")
+
+    assert db.execute.call_count == 2
+    db.commit.assert_not_called()
+
+
+def test_t6_dedup_key_hash_fixed_width():
+    """T6: sha256(key)[:16] regardless of key length; distinct keys differ."""
+    long_key = "pkey_" + "x" * 200
+
+    assert dedup_key_hash("ev_WH-1") == hashlib.sha256(b"ev_WH-1").digest()[:16]
+    assert len(dedup_key_hash(long_key)) == 16
+    assert dedup_key_hash("ev_WH-1") != dedup_key_hash("ev_WH-2")
+
+
+def test_t7_done_keys_cached_per_worker():
+    """T7: One DB read per 'done' key per TTL; other keys still hit the DB."""
+    db = _db_returning(None, status="done")
+
+    with patch.object(webhook_dedup.time, "monotonic", return_value=1000.0):
+        assert try_acquire_dedup(db, "paypal", "ev_WH-1") is False
+        assert try_acquire_dedup(db, "paypal", "ev_WH-1") is False
+        assert db.execute.call_count == 1
+
+        # Same key under another provider is a different event
+        assert try_acquire_dedup(db, "toss", "ev_WH-1") is False
+        assert db.execute.call_count == 2
+
+    expired = 1000.0 + webhook_dedup._DONE_CACHE_TTL_SEC
+    with patch.object(webhook_dedup.time, "monotonic", return_value=expired):
+        assert try_acquire_dedup(db, "paypal", "ev_WH-1") is False
+    assert db.execute.call_count == 3
+
+
+def test_t8_batch_single_round_trip_in_order():
+    """T8: One execute + commit for N keys; repeats and unclaimed keys are False."""
+    db = MagicMock()
+    db.execute.return_value.fetchall.return_value = [
+        SimpleNamespace(dedup_key_hash=dedup_key_hash("ev_C")),
+        SimpleNamespace(dedup_key_hash=dedup_key_hash("ev_A")),
+    ]
+
+    results = try_acquire_dedup_batch(
+        db, "paypal", [("ev_A", "h1"), ("ev_B", "h2"), ("ev_A", "h1"), ("ev_C", None)]
+    )
+
+    assert results == [True, False, False, True]
+    assert db.execute.call_count == 1
+    assert db.commit.call_count == 1
+    params = db.execute.call_args.args[1]
+    assert params["dedup_keys"] == ["ev_A", "ev_B", "ev_C"]
+    assert params["request_hashes"] == ["h1", "h2", None]
+
+    assert try_acquire_dedup_batch(db, "paypal", []) == []
+    assert db.execute.call_count == 1
+
+
+def test_t9_timestamps_stamped_server_side():
+    """T9: Every write uses clock_timestamp(), so no client datetime is serialized."""
+    db = _db_returning(SimpleNamespace(id=1, src="inserted"))
+
+    try_acquire_dedup(db, "paypal", "ev_WH-1")
+    mark_dedup_done(db, "paypal", "ev_WH-1")
+    mark_dedup_failed(db, "paypal", "ev_WH-1")
+
+    writes = db.execute.call_args_list[1:]
+    assert len(writes) == 3
+    for write in writes:
+        assert "clock_timestamp()" in str(write.args[0])
+        assert "now" not in write.args[1]
+
+
+def test_t10_gate_logging_respects_level(caplog):
+    """T10: Duplicates log at INFO with the key prefix; silent when INFO is off."""
+    key = "ev_WH-0123456789abcdef"
+
+    with caplog.at_level(logging.WARNING, logger=webhook_dedup.__name__):
+        try_acquire_dedup(_db_returning(None, status="processing"), "paypal", key)
+    assert caplog.records == []
+
+    with caplog.at_level(logging.INFO, logger=webhook_dedup.__name__):
+        try_acquire_dedup(_db_returning(None, status="processing"), "paypal", key)
+    (record,) = caplog.records
+    assert record.getMessage() == "WEBHOOK_DEDUP_DUPLICATE"
+    assert (record.provider, record.dedup_key_prefix) == ("paypal", key[:16])
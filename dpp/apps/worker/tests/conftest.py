@@ -26,6 +26,16 @@ REDIS_TEST_PORT = 6379
 REDIS_TEST_DB = 15  # Use separate DB for tests
 
 
+@pytest.fixture(autouse=True)
+def reset_env_derived_caches():
+    """Drop memoized env lookups so each test sees the env it patched in."""
+    from dpp_api.config.env import reset_env_cache
+
+    reset_env_cache()
+    yield
+    reset_env_cache()
+
+
 @pytest.fixture(scope="function")
 def db_session() -> Session:
     """
@@ -35,7 +45,7 @@ def db_session() -> Session:
     """
     # Create engine (using SSOT builder for PostgreSQL, StaticPool for SQLite)
     if "postgresql" in TEST_DATABASE_URL:
-        # PostgreSQL: use SSOT engine builder (respects NullPool policy)
+        # PostgreSQL: use SSOT engine builder (respects DPP_DB_POOL policy)
         engine = build_engine(TEST_DATABASE_URL)
     else:
         # SQLite: use in-memory with special settings (StaticPool required for :memory:)
@@ -77,6 +87,8 @@ def db_session() -> Session:
         # Only drop tables for SQLite (PostgreSQL tables persist)
         if "sqlite" in TEST_DATABASE_URL:
             Base.metadata.drop_all(engine)
+        # Close pooled connections between tests (build_engine shares the engine)
+        engine.dispose()
 
 
 @pytest.fixture(scope="function")
@@ -0,0 +1,22 @@
+-- Covering partial index for session-auth tenant resolution
+-- Created: 2026-04-17
+-- Idempotent: safe to re-run.
+--
+-- get_session_auth_context resolves a user's primary tenant with:
+--   SELECT tenant_id, role FROM user_tenants
+--   WHERE user_id = $1 AND status = 'active'
+--   ORDER BY role DESC, created_at ASC LIMIT 1
+--
+-- idx_user_tenants_user_status (user_id, status) finds the rows but leaves a
+-- sort plus heap fetches. This index matches the ORDER BY, so LIMIT 1 stops at
+-- the first entry, and INCLUDE (tenant_id) makes it an index-only scan.
+-- status is the partial predicate rather than a key column: every entry is
+-- 'active', so a status key would only widen the index.
+--
+-- CONCURRENTLY cannot run inside a transaction block: run this file without
+-- BEGIN/COMMIT (psql default autocommit).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_tenants_active_lookup
+    ON user_tenants (user_id, role DESC, created_at ASC)
+    INCLUDE (tenant_id)
+    WHERE status = 'active';
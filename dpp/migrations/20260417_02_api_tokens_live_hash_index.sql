@@ -0,0 +1,26 @@
+-- Partial covering index for API token authentication
+-- Created: 2026-04-17
+-- Idempotent: safe to re-run.
+--
+-- get_token_auth_context looks tokens up with:
+--   WHERE token_hash = $1 AND status IN ('active', 'rotating') AND revoked_at IS NULL
+--   -> id, tenant_id, scopes, status, expires_at
+--
+-- idx_api_tokens_token_hash covered only part of that predicate (status) and
+-- returned nothing but the key. This index covers the full predicate, so it
+-- holds only live tokens however many revoked or expired ones pile up. Its
+-- INCLUDE list makes the plain-lookup branch an index-only scan.
+--
+-- last_used_at is deliberately NOT included. An indexed column blocks HOT
+-- updates, and the hourly last_used_at touch would then rewrite every index.
+--
+-- CONCURRENTLY cannot run inside a transaction block: run this file without
+-- BEGIN/COMMIT (psql default autocommit).
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_api_tokens_live_hash
+    ON api_tokens (token_hash)
+    INCLUDE (id, tenant_id, scopes, expires_at, status)
+    WHERE status IN ('active', 'rotating') AND revoked_at IS NULL;
+
+-- Superseded by ix_api_tokens_live_hash (same key, narrower predicate)
+DROP INDEX CONCURRENTLY IF EXISTS idx_api_tokens_token_hash;
@@ -0,0 +1,26 @@
+-- auth_request_log: UNLOGGED storage + BRIN time index
+-- Created: 2026-04-17
+-- Idempotent: safe to re-run.
+--
+-- auth_request_log is append-only, best-effort security telemetry that is
+-- written on every token-authenticated request and read almost never.
+--
+-- 1) SET UNLOGGED: inserts skip WAL. Trade-off (accepted): the table is
+--    truncated after a crash and is not replicated to standbys or PITR. Rows
+--    already tolerate loss: the writer drops on overflow or on flush failure.
+--    NOTE: rewrites the table under ACCESS EXCLUSIVE. Run in a quiet window
+--    or after the 90-day retention prune.
+--
+-- 2) BRIN on created_at replaces the btree. Rows arrive in created_at order,
+--    so block ranges are naturally correlated. The BRIN index is a few pages
+--    where the btree grew with every row, and range scans for retention and
+--    investigations still use it.
+--    token_id and status_code btrees are kept; they back per-token and
+--    failed-auth lookups that BRIN cannot serve.
+
+ALTER TABLE auth_request_log SET UNLOGGED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_auth_request_log_created_brin
+    ON auth_request_log USING BRIN (created_at);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_auth_request_log_created_at;
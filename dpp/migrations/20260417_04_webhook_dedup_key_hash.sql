@@ -0,0 +1,53 @@
+-- webhook_dedup_events: fixed-width hashed dedup key for the unique gate
+-- Created: 2026-04-17
+-- Idempotent: safe to re-run.
+--
+-- The atomic gate (INSERT ... ON CONFLICT) probed a unique btree on
+-- (provider, dedup_key), where dedup_key is variable-length TEXT of up to
+-- ~100 chars (ev_<event_id> | tx_<tid> | pkey_<key>). It now probes
+-- (provider, dedup_key_hash): the first 16 bytes of SHA-256(dedup_key).
+-- Fixed 16-byte keys pack more entries per page and keep the tree shallow.
+--
+-- dedup_key stays as a plain, non-indexed column for debugging and audits.
+-- The application computes the same value (hashlib.sha256(key).digest()[:16]),
+-- so the backfill below and newly written rows agree.
+--
+-- Rollout: apply right before deploying the API that writes dedup_key_hash.
+-- Any row an old worker tries to insert after step 3 fails NOT NULL. The
+-- handler answers 500, and PayPal/Toss redeliver to a new worker, so no event
+-- is lost. Re-running the file backfills any stragglers.
+--
+-- CONCURRENTLY cannot run inside a transaction block: run this file without
+-- BEGIN/COMMIT (psql default autocommit).
+
+-- 1) Column
+ALTER TABLE webhook_dedup_events
+    ADD COLUMN IF NOT EXISTS dedup_key_hash BYTEA;
+
+-- 2) Backfill existing rows
+UPDATE webhook_dedup_events
+SET dedup_key_hash = substring(sha256(convert_to(dedup_key, 'UTF8')) FROM 1 FOR 16)
+WHERE dedup_key_hash IS NULL;
+
+-- 3) Enforce presence and width
+ALTER TABLE webhook_dedup_events
+    ALTER COLUMN dedup_key_hash SET NOT NULL;
+
+ALTER TABLE webhook_dedup_events
+    DROP CONSTRAINT IF EXISTS ck_webhook_dedup_key_hash_len;
+ALTER TABLE webhook_dedup_events
+    ADD CONSTRAINT ck_webhook_dedup_key_hash_len
+    CHECK (octet_length(dedup_key_hash) = 16);
+
+-- 4) New gate: exactly one INSERT succeeds per (provider, dedup_key_hash)
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_webhook_dedup_events_key_hash
+    ON webhook_dedup_events (provider, dedup_key_hash);
+
+-- 5) Superseded TEXT-keyed constraint and index
+ALTER TABLE webhook_dedup_events
+    DROP CONSTRAINT IF EXISTS uq_webhook_dedup_events;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_webhook_dedup_provider_key;
+
+COMMENT ON COLUMN webhook_dedup_events.dedup_key_hash IS
+    'First 16 bytes of SHA-256(dedup_key); unique with provider (the atomic gate)';
@@ -0,0 +1,26 @@
+-- webhook_dedup_events: partial index for the reclaim-'failed' branch
+-- Created: 2026-04-17
+-- Idempotent: safe to re-run.
+--
+-- The dedup gate's reclaim branch runs for every delivery whose INSERT hit
+-- a conflict:
+--   UPDATE ... WHERE provider = $1 AND dedup_key_hash = $2 AND status = 'failed'
+-- Through uq_webhook_dedup_events_key_hash, every such probe also reads the
+-- heap tuple just to learn that status is 'done' or 'processing'. That is the
+-- usual duplicate case. This index holds only 'failed' rows, so it is nearly
+-- empty in steady state. A probe for a non-failed key ends in the index with
+-- no heap visit, and the planner picks it from the matching predicate.
+--
+-- Write cost: status is already indexed (idx_webhook_dedup_status), so
+-- status changes are not HOT today; entries are added and removed only on
+-- transitions into and out of 'failed'.
+--
+-- Verify use: pg_stat_user_indexes.idx_scan for this index should climb
+-- with duplicate traffic.
+--
+-- CONCURRENTLY cannot run inside a transaction block: run this file without
+-- BEGIN/COMMIT (psql default autocommit).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_webhook_dedup_failed
+    ON webhook_dedup_events (provider, dedup_key_hash)
+    WHERE status = 'failed';
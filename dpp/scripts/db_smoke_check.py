@@ -144,9 +144,15 @@ EXPECTED_PK = {
     "tenant_usage_daily": ["id"],
 }
 
-# Unique constraints: {table_name: [(constraint_name, [col_names])]}
-EXPECTED_UNIQUE_CONSTRAINTS = {
-    "runs": [("uq_runs_tenant_idempotency", ["tenant_id", "idempotency_key"])],
+# Partial unique indexes: {table_name: [(index_name, [col_names], where_predicate)]}
+EXPECTED_UNIQUE_INDEXES = {
+    "runs": [
+        (
+            "uq_runs_tenant_idempotency",
+            ["tenant_id", "idempotency_key"],
+            "idempotency_key IS NOT NULL",
+        )
+    ],
 }
 
 # Index groups: {table_name: [group, ...]}
@@ -170,6 +176,11 @@ EXPECTED_INDEX_GROUPS = {
             "canonical_name": "idx_runs_tenant_created",
             "alias_names": [],
         },
+        {
+            "signature": (("tenant_id", "idempotency_key"), True),
+            "canonical_name": "uq_runs_tenant_idempotency",
+            "alias_names": [],
+        },
     ],
     "tenant_plans": [
         {
@@ -307,22 +318,43 @@ def check_primary_key(engine: Engine, schema: str, table: str, expected_pk: list
         error_exit("PK_DRIFT", 3)
 
 
-def check_unique_constraints(
-    engine: Engine, schema: str, table: str, expected_uqs: list[tuple[str, list[str]]]
+def _normalize_predicate(predicate: str) -> str:
+    """Strip the parentheses and case/whitespace differences pg_get_expr adds."""
+    return " ".join(predicate.replace("(", " ").replace(")", " ").split()).lower()
+
+
+def check_unique_indexes(
+    engine: Engine,
+    schema: str,
+    table: str,
+    expected_uqs: list[tuple[str, list[str], str]],
 ) -> None:
-    """Verify unique constraints match expected (name + columns)."""
+    """Verify partial unique indexes match expected (name + columns + WHERE predicate)."""
     inspector = inspect(engine)
-    actual_uqs = inspector.get_unique_constraints(table, schema=schema)
-    actual_map = {uq["name"]: sorted(uq["column_names"]) for uq in actual_uqs}
-
-    for uq_name, uq_cols in expected_uqs:
-        if uq_name not in actual_map:
-            debug(f"Missing unique constraint {uq_name} in {table}")
+    actual_map = {
+        idx["name"]: idx for idx in inspector.get_indexes(table, schema=schema)
+    }
+
+    for uq_name, uq_cols, uq_where in expected_uqs:
+        idx = actual_map.get(uq_name)
+        if idx is None:
+            debug(f"Missing unique index {uq_name} in {table}")
             error_exit("UQ_DRIFT", 3)
-        if sorted(uq_cols) != actual_map[uq_name]:
-            debug(f"Unique constraint mismatch {uq_name} in {table}")
+        if not idx["unique"]:
+            debug(f"Index {uq_name} in {table} is not unique")
+            error_exit("UQ_DRIFT", 3)
+        if sorted(uq_cols) != sorted(idx["column_names"]):
+            debug(f"Unique index mismatch {uq_name} in {table}")
             debug(f"  Expected: {sorted(uq_cols)}")
-            debug(f"  Actual:   {actual_map[uq_name]}")
+            debug(f"  Actual:   {sorted(idx['column_names'])}")
+            error_exit("UQ_DRIFT", 3)
+        actual_where = idx.get("dialect_options", {}).get("postgresql_where")
+        if actual_where is None or _normalize_predicate(
+            str(actual_where)
+        ) != _normalize_predicate(uq_where):
+            debug(f"Unique index predicate mismatch {uq_name} in {table}")
+            debug(f"  Expected: WHERE {uq_where}")
+            debug(f"  Actual:   WHERE {actual_where}")
             error_exit("UQ_DRIFT", 3)
 
 
@@ -469,9 +501,9 @@ def main() -> None:
         check_table_columns(engine, schema, table, expected_cols)
         check_primary_key(engine, schema, table, EXPECTED_PK[table])
 
-        if table in EXPECTED_UNIQUE_CONSTRAINTS:
-            check_unique_constraints(
-                engine, schema, table, EXPECTED_UNIQUE_CONSTRAINTS[table]
+        if table in EXPECTED_UNIQUE_INDEXES:
+            check_unique_indexes(
+                engine, schema, table, EXPECTED_UNIQUE_INDEXES[table]
             )
 
         if table in EXPECTED_INDEX_GROUPS:
@@ -505,7 +537,7 @@ def main() -> None:
             "checks": {
                 "tables": len(all_tables),
                 "columns": sum(len(cols) for cols in EXPECTED_TABLE_SPECS.values()),
-                "constraints": len(EXPECTED_UNIQUE_CONSTRAINTS),
+                "unique_indexes": sum(len(uqs) for uqs in EXPECTED_UNIQUE_INDEXES.values()),
                 "indexes": sum(len(groups) for groups in EXPECTED_INDEX_GROUPS.values()),
                 "rls": "enabled on all tables",
                 "mode": mode,